@@ -0,0 +1,125 @@
+"""
+Collaborator index benchmark over a large simulated artist catalog.
+
+Builds the k-d tree index, times top-k queries with and without a role
+filter against a brute-force numpy scan, checks the results agree, then
+times incremental inserts and queries while inserts are buffered.
+
+Usage:
+    python benchmarks/collaborator_index.py                  # print the report
+    python benchmarks/collaborator_index.py --write          # also update collaborator_index.md
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'collaborator_index.md')
+sys.path.insert(0, REPO_ROOT)
+
+from modules.collaborator_index import (  # noqa: E402
+    COLLABORATOR_ROLES,
+    MIN_REBUILD_SIZE,
+    artist_vectors,
+    build_collaborator_index
+)
+from utils.data_simulation import generate_artist_catalog  # noqa: E402
+
+def brute_force(vectors, query, k):
+    distances = np.sqrt(((vectors - query) ** 2).sum(axis=1))
+    nearest = np.argpartition(distances, k - 1)[:k]
+    return nearest[np.argsort(distances[nearest])]
+
+def latency(func, queries):
+    """Median and 99th percentile per-query latency in milliseconds."""
+    times = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        times.append(time.perf_counter() - start)
+    return np.median(times) * 1000, np.percentile(times, 99) * 1000
+
+def build_report(n_artists, n_queries, k):
+    start = time.perf_counter()
+    catalog = generate_artist_catalog(n_artists, COLLABORATOR_ROLES, seed=0)
+    catalog_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = build_collaborator_index(catalog)
+    build_seconds = time.perf_counter() - start
+
+    vectors = artist_vectors(catalog)
+    queries = artist_vectors(generate_artist_catalog(n_queries, COLLABORATOR_ROLES, seed=1))
+    role = COLLABORATOR_ROLES[0]
+
+    # Every index result must match an exact scan
+    for query in queries[:50]:
+        expected = [catalog['artist_id'].iat[row] for row in brute_force(vectors, query, k)]
+        assert [match['artist_id'] for match in index.query(query, k)] == expected
+
+    query_rows = [
+        ("Brute-force numpy scan", latency(lambda q: brute_force(vectors, q, k), queries[:100])),
+        ("`CollaboratorIndex.query`", latency(lambda q: index.query(q, k), queries)),
+        (f"`CollaboratorIndex.query`, role = {role}", latency(lambda q: index.query(q, k, role=role), queries))
+    ]
+
+    # Inserts stay in the buffer below the rebuild threshold
+    new_artists = generate_artist_catalog(MIN_REBUILD_SIZE - 1, COLLABORATOR_ROLES, seed=2)
+    new_vectors = artist_vectors(new_artists)
+    new_ids = [f"new-{i}" for i in range(len(new_artists))]
+    start = time.perf_counter()
+    for i in range(0, len(new_artists), 100):
+        index.add(new_ids[i:i + 100], new_vectors[i:i + 100], new_artists['role'].iloc[i:i + 100])
+    insert_us = (time.perf_counter() - start) / len(new_artists) * 1e6
+    assert index.buffered == len(new_artists)
+    assert index.query(new_vectors[0], 1)[0]['artist_id'] == new_ids[0]
+    query_rows.append((f"`CollaboratorIndex.query` with {index.buffered:,} buffered inserts",
+                       latency(lambda q: index.query(q, k), queries)))
+
+    start = time.perf_counter()
+    index.rebuild()
+    rebuild_seconds = time.perf_counter() - start
+
+    lines = [
+        "# Collaborator Index Benchmark",
+        "",
+        "Generated by `python benchmarks/collaborator_index.py --write`.",
+        "",
+        f"{n_artists:,} simulated artists, {len(COLLABORATOR_ROLES)} collaborator roles, "
+        f"{vectors.shape[1]}-dimensional audio vectors. Queries return the top {k} artists; "
+        "results were checked against the brute-force scan.",
+        "",
+        "| Step | Time |",
+        "|---|---|",
+        f"| Generate catalog | {catalog_seconds:.2f} s |",
+        f"| Build index | {build_seconds:.2f} s |",
+        f"| Insert (buffered, batches of 100) | {insert_us:.1f} µs per artist |",
+        f"| Rebuild with {len(new_artists):,} buffered inserts | {rebuild_seconds:.2f} s |",
+        "",
+        f"Per-query latency over {n_queries:,} queries (brute force over 100):",
+        "",
+        "| Query | Median (ms) | p99 (ms) |",
+        "|---|---|---|"
+    ] + [f"| {label} | {median:.2f} | {p99:.2f} |" for label, (median, p99) in query_rows] + [""]
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the collaborator index")
+    parser.add_argument('--artists', type=int, default=1_000_000, help="Artists in the catalog")
+    parser.add_argument('--queries', type=int, default=1000, help="Queries per latency measurement")
+    parser.add_argument('-k', type=int, default=10, help="Artists returned per query")
+    parser.add_argument('--write', action='store_true', help=f"Write the report to {REPORT_PATH}")
+    args = parser.parse_args()
+
+    report = build_report(args.artists, args.queries, args.k)
+    print(report)
+
+    if args.write:
+        with open(REPORT_PATH, 'w') as f:
+            f.write(report)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Engagement cube benchmark: region/genre selections over pre-aggregated cells.
+
+Aggregates simulated raw engagement rows into an EngagementCube, then
+times random region multiselect queries against filtering and grouping
+the raw rows with pandas, checks both agree, and times ingesting one
+more day of rows.
+
+Usage:
+    python benchmarks/engagement_cube.py                  # print the report
+    python benchmarks/engagement_cube.py --write          # also update engagement_cube.md
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'engagement_cube.md')
+sys.path.insert(0, REPO_ROOT)
+
+from modules.engagement_cube import CUBE_GENRES, CUBE_REGIONS, GLOBAL_REGION, EngagementCube  # noqa: E402
+from utils.data_simulation import generate_engagement_events  # noqa: E402
+
+def raw_scan(rows, regions, genre):
+    selected = rows['genre'] == genre
+    if GLOBAL_REGION not in regions:
+        selected &= rows['region'].isin(regions)
+    return rows[selected].groupby('date')['engagement'].sum()
+
+def random_selections(n_queries, seed):
+    rng = np.random.default_rng(seed)
+    selections = []
+    for _ in range(n_queries):
+        regions = list(rng.choice(CUBE_REGIONS, rng.integers(1, 5), replace=False))
+        if rng.random() < 0.2:
+            regions.append(GLOBAL_REGION)
+        selections.append((regions, CUBE_GENRES[rng.integers(len(CUBE_GENRES))]))
+    return selections
+
+def latency_ms(func, selections):
+    times = []
+    for regions, genre in selections:
+        start = time.perf_counter()
+        func(regions, genre)
+        times.append(time.perf_counter() - start)
+    return np.median(times) * 1000, np.percentile(times, 99) * 1000
+
+def build_report(n_rows, days, n_queries):
+    end_date = datetime.now().date() - timedelta(days=1)
+    start = time.perf_counter()
+    rows = generate_engagement_events(n_rows, days, end_date=end_date, seed=0)
+    generate_seconds = time.perf_counter() - start
+
+    cube = EngagementCube()
+    start = time.perf_counter()
+    cube.ingest(rows)
+    build_seconds = time.perf_counter() - start
+
+    selections = random_selections(n_queries, seed=1)
+    for regions, genre in selections[:20]:
+        expected = raw_scan(rows, regions, genre)
+        daily = cube.query(regions, genre).set_index('date')['engagement']
+        assert np.allclose(daily.reindex(expected.index).to_numpy(), expected.to_numpy())
+        assert np.isclose(daily.sum(), expected.sum())
+
+    query_rows = [
+        ("Raw rows: filter and group by day (pandas)", latency_ms(lambda r, g: raw_scan(rows, r, g), selections[:50])),
+        ("`EngagementCube.query`", latency_ms(lambda r, g: cube.query(r, g), selections)),
+        ("`EngagementCube.query`, last 30 days",
+         latency_ms(lambda r, g: cube.query(r, g, start=end_date - timedelta(days=29)), selections))
+    ]
+
+    # One more day of rows, ingested incrementally
+    new_day = generate_engagement_events(n_rows // days, 1, end_date=end_date + timedelta(days=1), seed=2)
+    start = time.perf_counter()
+    cube.ingest(new_day)
+    ingest_ms = (time.perf_counter() - start) * 1000
+    assert cube.n_days == days + 1
+
+    lines = [
+        "# Engagement Cube Benchmark",
+        "",
+        "Generated by `python benchmarks/engagement_cube.py --write`.",
+        "",
+        f"{n_rows:,} simulated engagement rows over {days} days, {len(CUBE_REGIONS)} regions and "
+        f"{len(CUBE_GENRES)} genres ({len(CUBE_REGIONS) * len(CUBE_GENRES) * days:,} cells). Queries select "
+        f"1-4 random regions, sometimes with {GLOBAL_REGION}, and one genre. 20 queries were checked "
+        f"against the raw-row scan. Run on {os.cpu_count()} CPU(s).",
+        "",
+        "| Step | Time |",
+        "|---|---|",
+        f"| Generate rows | {generate_seconds:.2f} s |",
+        f"| Aggregate all rows into the cube | {build_seconds:.2f} s |",
+        f"| Ingest one more day ({len(new_day):,} rows) | {ingest_ms:.1f} ms |",
+        "",
+        f"Per-query latency over {n_queries:,} selections (raw scan over 50):",
+        "",
+        "| Query | Median (ms) | p99 (ms) |",
+        "|---|---|---|"
+    ] + [f"| {label} | {median:.2f} | {p99:.2f} |" for label, (median, p99) in query_rows] + [""]
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the engagement cube")
+    parser.add_argument('--rows', type=int, default=10_000_000, help="Raw engagement rows")
+    parser.add_argument('--days', type=int, default=365, help="Days the rows span")
+    parser.add_argument('--queries', type=int, default=1000, help="Selections to time")
+    parser.add_argument('--write', action='store_true', help=f"Write the report to {REPORT_PATH}")
+    args = parser.parse_args()
+
+    report = build_report(args.rows, args.days, args.queries)
+    print(report)
+
+    if args.write:
+        with open(REPORT_PATH, 'w') as f:
+            f.write(report)
+
+if __name__ == '__main__':
+    main()
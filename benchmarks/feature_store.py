@@ -0,0 +1,138 @@
+"""
+Feature store benchmark: batch scoring with and without the SQLite store.
+
+Scores the same seeded roster without a store, against a cold store, a
+warm store, and a warm store after new tracks are added, then times point
+lookups and bulk reads on a larger store.
+
+Usage:
+    python benchmarks/feature_store.py                  # print the report
+    python benchmarks/feature_store.py --write          # also update feature_store.md
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'feature_store.md')
+sys.path.insert(0, REPO_ROOT)
+os.chdir(REPO_ROOT)
+
+from modules.batch_scoring import score_tracks  # noqa: E402
+from modules.feature_store import pipeline_feature_store  # noqa: E402
+from modules.parameters import validate_params  # noqa: E402
+
+def make_tracks(n_tracks, offset=0):
+    rng = np.random.default_rng(offset)
+    return [
+        (f"track-{offset + i}", validate_params({'tempo': int(rng.integers(60, 201)),
+                                                 'meme_potential': float(rng.random())}))
+        for i in range(n_tracks)
+    ]
+
+def score_runs(n_tracks, workdir):
+    tracks = make_tracks(n_tracks)
+    new_tracks = make_tracks(n_tracks // 10, offset=n_tracks)
+    store_path = os.path.join(workdir, 'features.db')
+    output = os.path.join(workdir, 'scores.csv')
+    quiet = lambda line: None  # noqa: E731
+
+    runs = [
+        ("No feature store", tracks, None),
+        ("Cold store", tracks, store_path),
+        ("Warm store", tracks, store_path),
+        (f"Warm store + {len(new_tracks)} new tracks", tracks + new_tracks, store_path)
+    ]
+    # Unreported warm-up so the first measured run does not pay for cold imports and file caches
+    score_tracks(make_tracks(20, offset=10 * n_tracks), output, seed=7, report=quiet)
+
+    rows = []
+    for label, roster, store in runs:
+        summary = score_tracks(roster, output, seed=7, feature_store=store, report=quiet)
+        hit_rate = f"{summary['feature_store']['hit_rate']:.0%}" if store else "-"
+        rows.append(f"| {label} | {summary['tracks']} | {summary['seconds']:.2f} | "
+                    f"{summary['tracks_per_second']:.0f} | {hit_rate} |")
+    return rows
+
+def lookup_timings(n_rows, workdir):
+    store = pipeline_feature_store(os.path.join(workdir, 'lookup.db'))
+    as_of_date = date.today().isoformat()
+    rng = np.random.default_rng(0)
+    vectors = rng.random((n_rows, len(store.columns)))
+    track_ids = [f"track-{i}" for i in range(n_rows)]
+
+    start = time.perf_counter()
+    for begin in range(0, n_rows, 10000):
+        store.put_many(zip(track_ids[begin:begin + 10000], vectors[begin:begin + 10000]), as_of_date)
+    write_seconds = time.perf_counter() - start
+
+    probes = rng.choice(n_rows, 2000, replace=False)
+    start = time.perf_counter()
+    for i in probes:
+        store.get(track_ids[i], as_of_date)
+    point_us = (time.perf_counter() - start) / len(probes) * 1e6
+
+    start = time.perf_counter()
+    found = store.get_many([track_ids[i] for i in rng.choice(n_rows, 10000, replace=False)], as_of_date)
+    many_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _, matrix = store.read_day(as_of_date)
+    bulk_seconds = time.perf_counter() - start
+    store.close()
+
+    assert len(found) == 10000 and matrix.shape == vectors.shape
+    return [
+        f"| Write {n_rows:,} rows (10k per transaction) | {write_seconds:.2f} s |",
+        f"| Point lookup (`get`) | {point_us:.0f} µs |",
+        f"| Batched lookup of 10,000 keys (`get_many`) | {many_seconds * 1000:.0f} ms |",
+        f"| Bulk read of {n_rows:,} rows (`read_day`) | {bulk_seconds * 1000:.0f} ms |",
+        f"| Database size | {os.path.getsize(os.path.join(workdir, 'lookup.db')) / 1024 ** 2:.1f} MB |"
+    ]
+
+def build_report(n_tracks, n_rows):
+    with tempfile.TemporaryDirectory() as workdir:
+        score_rows = score_runs(n_tracks, workdir)
+        lookup_rows = lookup_timings(n_rows, workdir)
+
+    lines = [
+        "# Feature Store Benchmark",
+        "",
+        "Generated by `python benchmarks/feature_store.py --write`.",
+        "",
+        f"End-to-end batch scoring of {n_tracks:,} seeded tracks with `score_tracks` on "
+        f"{os.cpu_count()} CPU(s). A store hit skips preprocessing and `extract_features`; "
+        "simulation, prediction, metrics and recommendations still run.",
+        "",
+        "| Run | Tracks | Seconds | Tracks/s | Store hit rate |",
+        "|---|---|---|---|---|"
+    ] + score_rows + [
+        "",
+        f"Lookups on a store of {n_rows:,} pipeline feature rows:",
+        "",
+        "| Operation | Time |",
+        "|---|---|"
+    ] + lookup_rows + [""]
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the feature store")
+    parser.add_argument('--tracks', type=int, default=1000, help="Tracks in the scoring runs")
+    parser.add_argument('--rows', type=int, default=200_000, help="Rows in the lookup benchmark")
+    parser.add_argument('--write', action='store_true', help=f"Write the report to {REPORT_PATH}")
+    args = parser.parse_args()
+
+    report = build_report(args.tracks, args.rows)
+    print(report)
+
+    if args.write:
+        with open(REPORT_PATH, 'w') as f:
+            f.write(report)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Forecasting benchmark: vectorized Holt smoothing over many engagement series.
+
+Fits damped-trend Holt smoothing to batches of simulated histories, reports
+fit time per 10k series against a per-series Python loop of the same
+grid search, checks both give the same fit, and scores the forecasts on
+the days that followed against naive baselines.
+
+Usage:
+    python benchmarks/forecasting.py                  # print the report
+    python benchmarks/forecasting.py --write          # also update forecasting.md
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'forecasting.md')
+sys.path.insert(0, REPO_ROOT)
+
+from modules.forecasting import (  # noqa: E402
+    ALPHA_GRID,
+    BETA_GRID,
+    DAMPING_GRID,
+    INIT_TREND_DAYS,
+    fit_holt,
+    forecast_holt
+)
+from utils.data_simulation import generate_historical_trends  # noqa: E402
+
+HISTORY_DAYS = 30
+
+def fit_holt_loop(series):
+    """The same grid search as fit_holt, one series and one grid point at a time."""
+    n_days = len(series)
+    m = min(INIT_TREND_DAYS, n_days - 1)
+    best = None
+    for alpha in ALPHA_GRID:
+        for beta in BETA_GRID:
+            for damping in DAMPING_GRID:
+                level, trend, sse = series[0], (series[m] - series[0]) / m, 0.0
+                for t in range(1, n_days):
+                    trend *= damping
+                    level += trend
+                    error = series[t] - level
+                    sse += error * error
+                    level += alpha * error
+                    trend += alpha * beta * error
+                if best is None or sse < best[0]:
+                    best = (sse, level, trend)
+    return best[1], best[2]
+
+def mape(forecast, actual):
+    return float(np.mean(np.abs(forecast - actual) / np.maximum(np.abs(actual), 1)))
+
+def build_report(sizes, loop_series):
+    curves = generate_historical_trends(max(sizes), seed=0).astype(np.float64)
+    history, outcome = curves[:, :HISTORY_DAYS], curves[:, HISTORY_DAYS:]
+    horizon = outcome.shape[1]
+
+    fit_rows = []
+    for size in sizes:
+        start = time.perf_counter()
+        fit_holt(history[:size])
+        seconds = time.perf_counter() - start
+        fit_rows.append(f"| `fit_holt`, {size:,} series | {seconds:.2f} s | {seconds / size * 10_000:.2f} s |")
+
+    start = time.perf_counter()
+    looped = np.array([fit_holt_loop(series) for series in history[:loop_series]])
+    seconds = time.perf_counter() - start
+    fit_rows.append(f"| Per-series Python loop, {loop_series:,} series | {seconds:.2f} s | "
+                    f"{seconds / loop_series * 10_000:.1f} s |")
+
+    fit = fit_holt(history)
+    assert np.allclose(looped[:, 0], fit['level'][:loop_series])
+    assert np.allclose(looped[:, 1], fit['trend'][:loop_series])
+
+    # Forecast accuracy on the outcome days that followed each history
+    holt = np.maximum(forecast_holt(fit, horizon), 0)
+    naive = np.repeat(history[:, -1:], horizon, axis=1)
+    slope = (history[:, -1] - history[:, -8]) / 7
+    drift = np.maximum(history[:, -1:] + slope[:, None] * np.arange(1, horizon + 1), 0)
+    accuracy_rows = [
+        f"| {label} | {mape(forecast, outcome):.1%} | {mape(forecast[:, :7], outcome[:, :7]):.1%} |"
+        for label, forecast in [("Holt, damped trend", holt), ("Last value", naive),
+                                ("Last-week linear drift", drift)]
+    ]
+
+    lines = [
+        "# Forecasting Benchmark",
+        "",
+        "Generated by `python benchmarks/forecasting.py --write`.",
+        "",
+        f"Simulated engagement series with {HISTORY_DAYS} days of history and {horizon} outcome days. "
+        f"`fit_holt` searches {len(ALPHA_GRID) * len(BETA_GRID) * len(DAMPING_GRID)} (alpha, beta, damping) "
+        f"triples per series, with damping from {', '.join(f'{d:g}' for d in DAMPING_GRID)}. Run on {os.cpu_count()} CPU(s). The loop's fits were checked against "
+        "`fit_holt`.",
+        "",
+        "| Fit | Time | Per 10k series |",
+        "|---|---|---|"
+    ] + fit_rows + [
+        "",
+        f"Mean absolute percentage error over {len(curves):,} series:",
+        "",
+        f"| Forecast | MAPE, {horizon} days | MAPE, first 7 days |",
+        "|---|---|---|"
+    ] + accuracy_rows + [""]
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized Holt forecasting")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000], help="Batch sizes to fit")
+    parser.add_argument('--loop-series', type=int, default=200, help="Series fitted by the Python loop")
+    parser.add_argument('--write', action='store_true', help=f"Write the report to {REPORT_PATH}")
+    args = parser.parse_args()
+
+    report = build_report(args.sizes, args.loop_series)
+    print(report)
+
+    if args.write:
+        with open(REPORT_PATH, 'w') as f:
+            f.write(report)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""
+Online learning benchmark: micro-batch updates, drift tracking and hot-swap cost.
+
+Streams the realized outcomes of simulated tracks into an OnlineLearner one
+forecast period at a time. Halfway through, the outcomes change meaning
+(realized virality is inverted and trends end 40% sooner), and the report
+follows each period's prediction error, before the models learn it, for the
+online models and for a copy frozen at the change, with the drift ratio
+the learner reports. It also reports update latency and the latency of
+single-track predictions served while updates run in the background.
+
+Usage:
+    python benchmarks/online_learning.py                  # print the report
+    python benchmarks/online_learning.py --write          # also update online_learning.md
+"""
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'online_learning.md')
+sys.path.insert(0, REPO_ROOT)
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from modules.backtesting import DURATION_RANGE, HORIZON_DAYS  # noqa: E402
+from modules.data_processing import FEATURE_NAMES  # noqa: E402
+from modules.online_learning import (MICRO_BATCH_ROWS, OUTCOME_TARGETS, OnlineLearner,  # noqa: E402
+                                     realized_outcome_batches)
+from utils.data_simulation import generate_historical_trends  # noqa: E402
+
+def _outcome_frames(n_tracks, n_days):
+    curves = generate_historical_trends(n_tracks, history_days=n_days - HORIZON_DAYS, outcome_days=HORIZON_DAYS,
+                                        seed=0)
+    frames = []
+    for features, outcomes, observed_at in realized_outcome_batches(curves):
+        frame = pd.DataFrame(features, columns=list(FEATURE_NAMES))
+        for target in OUTCOME_TARGETS:
+            frame[target] = outcomes[target]
+        frames.append((observed_at.date(), frame))
+    return frames
+
+def _shift_concept(frame):
+    # The changed relationship between features and outcomes
+    frame = frame.copy()
+    frame['virality'] = 100 - frame['virality']
+    frame['trend_duration'] = np.clip(np.round(frame['trend_duration'] * 0.6), *DURATION_RANGE)
+    return frame
+
+def _mae(models, frame):
+    features = frame[list(FEATURE_NAMES)].to_numpy()
+    return {target: float(np.abs(model.predict(features) - frame[target].to_numpy()).mean())
+            for target, model in models.items()}
+
+def _predict_latencies(learner, row, seconds):
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        for model in learner.models().values():
+            model.predict(row)
+        latencies.append(time.perf_counter() - started)
+    return np.array(latencies) * 1000
+
+def build_report(n_tracks, n_days):
+    frames = _outcome_frames(n_tracks, n_days)
+    change = len(frames) // 2
+    frames = [(date, frame if i < change else _shift_concept(frame)) for i, (date, frame) in enumerate(frames)]
+
+    learner, frozen = OnlineLearner(), None
+    period_rows = []
+    for i, (date, frame) in enumerate(frames):
+        if i == change:
+            frozen = dict(learner.models())
+        serving = all(model.ready for model in learner.models().values())
+        online = _mae(learner.models(), frame) if serving else None
+        fixed = _mae(frozen, frame) if frozen else None
+        learner.submit(frame)
+        learner.flush()
+        drift = learner.metrics()['models']
+        cells = []
+        for target in OUTCOME_TARGETS:
+            ratio = drift[target]['drift_ratio']
+            cells += [f"{online[target]:.2f}" if online else "-", f"{fixed[target]:.2f}" if fixed else "-",
+                      "-" if ratio is None else f"{ratio:.2f}{' (drifting)' if drift[target]['drifting'] else ''}"]
+        marker = " (change)" if i == change else ""
+        period_rows.append(f"| {date}{marker} | {len(frame):,} | " + " | ".join(cells) + " |")
+
+    metrics = learner.metrics()
+    samples = metrics['models']['virality']['samples']
+    update_seconds = learner.update_seconds
+
+    # Single-track predictions while a replay of every outcome is learned in the background
+    row = frames[0][1][list(FEATURE_NAMES)].to_numpy()[:1]
+    idle = _predict_latencies(learner, row, 1.0)
+    replay = OnlineLearner(models=learner.models())
+    replay.submit(pd.concat([frame for _, frame in frames], ignore_index=True))
+    busy = []
+    while replay.metrics()['queued_batches']:
+        busy.append(_predict_latencies(replay, row, 0.05))
+    replay.flush()
+    busy = np.concatenate(busy) if busy else idle
+
+    target_headers = " | ".join(f"`{target}` online MAE | `{target}` frozen MAE | `{target}` drift"
+                                for target in OUTCOME_TARGETS)
+    lines = [
+        "# Online Learning Benchmark",
+        "",
+        "Generated by `python benchmarks/online_learning.py --write`.",
+        "",
+        f"Realized outcomes of {n_tracks:,} simulated tracks over {n_days} days, arriving one forecast period at "
+        f"a time and learned in micro-batches of {MICRO_BATCH_ROWS}. From the marked period on, realized "
+        f"virality is inverted (100 - value) and trends end 40% sooner. MAE is measured on each period's "
+        f"outcomes before the models learn them; the frozen models stop learning at the change. Drift is the "
+        f"learner's recent/reference MAE ratio after the period. Run on {os.cpu_count()} CPU(s).",
+        "",
+        "| Period | Outcomes | " + target_headers + " |",
+        "|---|---|" + "---|" * (3 * len(OUTCOME_TARGETS))
+    ] + period_rows + [
+        "",
+        f"{metrics['updates']:,} updates of {samples:,} outcomes took {update_seconds:.2f} s "
+        f"({samples / update_seconds:,.0f} outcomes/s); update latency to swap p50 "
+        f"{metrics['update_p50_ms']:.1f} ms, p99 {metrics['update_p99_ms']:.1f} ms.",
+        "",
+        "Single-track prediction of both outcomes, reading the current models:",
+        "",
+        "| Background updates | Predictions | p50 (ms) | p99 (ms) | Max (ms) |",
+        "|---|---|---|---|---|",
+        f"| None | {len(idle):,} | {np.percentile(idle, 50):.3f} | {np.percentile(idle, 99):.3f} | "
+        f"{idle.max():.3f} |",
+        f"| Replaying {samples:,} outcomes | {len(busy):,} | {np.percentile(busy, 50):.3f} | "
+        f"{np.percentile(busy, 99):.3f} | {busy.max():.3f} |",
+        "",
+        "Predictions never take a lock; on a single CPU the tail reflects the update thread holding the GIL.",
+        ""
+    ]
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark online model updates")
+    parser.add_argument('--tracks', type=int, default=2000, help="Simulated tracks")
+    parser.add_argument('--days', type=int, default=150, help="Days per history")
+    parser.add_argument('--write', action='store_true', help=f"Write the report to {REPORT_PATH}")
+    args = parser.parse_args()
+
+    report = build_report(args.tracks, args.days)
+    print(report)
+
+    if args.write:
+        with open(REPORT_PATH, 'w') as f:
+            f.write(report)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+Prediction interval benchmark: split-conformal coverage, width and lookup cost.
+
+Calibrates the registered models on the rolling-origin residuals of one set
+of simulated histories and measures, on histories simulated with another
+seed, how often the realized outcome falls inside the intervals at several
+coverage levels, with predicted-value bins and with a single pooled bin.
+Then compares the cost of batch interval lookup with one-at-a-time lookup
+and with recomputing the residual quantiles for every prediction.
+
+Usage:
+    python benchmarks/prediction_intervals.py                  # print the report
+    python benchmarks/prediction_intervals.py --write          # also update prediction_intervals.md
+"""
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'prediction_intervals.md')
+sys.path.insert(0, REPO_ROOT)
+
+import numpy as np  # noqa: E402
+
+from modules.backtesting import HORIZON_DAYS, run_backtest  # noqa: E402
+from modules.prediction_intervals import (CALIBRATION_BINS, DEFAULT_COVERAGE, VALUE_RANGES,  # noqa: E402
+                                          ConformalCalibration, calibrate_models)
+from utils.data_simulation import generate_historical_trends  # noqa: E402
+
+COVERAGES = (0.5, 0.8, 0.9, 0.95)
+
+# Predictions timed one at a time; their cost is extrapolated to the whole test set
+SINGLE_LOOKUPS = 2_000
+
+def _histories(n_tracks, n_days, seed):
+    return generate_historical_trends(n_tracks, history_days=n_days - HORIZON_DAYS, outcome_days=HORIZON_DAYS,
+                                      seed=seed)
+
+def _per_prediction_quantiles(residuals, predicted, coverage, value_range):
+    # Baseline: the quantiles recomputed from the raw residuals for each prediction
+    tail = (1 - coverage) / 2
+    bounds = []
+    for value in predicted:
+        lower, upper = np.quantile(residuals, [tail, 1 - tail])
+        bounds.append((np.clip(value + lower, *value_range), np.clip(value + upper, *value_range)))
+    return bounds
+
+def _timed(fn):
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+def build_report(n_tracks, n_days):
+    result = calibrate_models(_histories(n_tracks, n_days, seed=0), save=False)
+    calibration_predictions = result['backtest']['predictions']
+    test = run_backtest(_histories(n_tracks, n_days, seed=1))['predictions']
+
+    coverage_rows, bin_rows, timing_rows = [], [], []
+    for name, binned in result['calibrations'].items():
+        calibration_rows = calibration_predictions[calibration_predictions['model'] == name]
+        pooled = ConformalCalibration(calibration_rows['predicted'], calibration_rows['actual'], n_bins=1,
+                                      value_range=VALUE_RANGES[name])
+        rows = test[test['model'] == name]
+        predicted, actual = rows['predicted'].to_numpy(), rows['actual'].to_numpy()
+
+        for coverage in COVERAGES:
+            cells = []
+            for calibration in (binned, pooled):
+                low, high = calibration.intervals(predicted, coverage)
+                inside = (actual >= low) & (actual <= high)
+                cells += [f"{inside.mean():.1%}", f"{np.median(high - low):.1f}"]
+            coverage_rows.append(f"| `{name}` | {coverage:.0%} | " + " | ".join(cells) + " |")
+
+        # Coverage within each bin of predicted values at the default coverage
+        bins = np.searchsorted(binned.edges, predicted, side='right')
+        bounds = [calibration.intervals(predicted, DEFAULT_COVERAGE) for calibration in (binned, pooled)]
+        edges = np.concatenate([[-np.inf], binned.edges, [np.inf]])
+        for b in range(len(binned.bin_sizes())):
+            in_bin = bins == b
+            if not in_bin.any():
+                continue
+            label = (f"< {edges[b + 1]:.1f}" if b == 0 else f">= {edges[b]:.1f}" if b == len(edges) - 2
+                     else f"{edges[b]:.1f} to < {edges[b + 1]:.1f}")
+            cells = [f"{((actual >= low) & (actual <= high))[in_bin].mean():.1%}" for low, high in bounds]
+            bin_rows.append(f"| `{name}` | {label} | {in_bin.sum():,} | " + " | ".join(cells) + " |")
+
+        residuals = calibration_rows['actual'].to_numpy() - calibration_rows['predicted'].to_numpy()
+        sample = predicted[:SINGLE_LOOKUPS]
+        scale = len(predicted) / len(sample)
+        binned.intervals(sample, DEFAULT_COVERAGE)  # offsets are computed once per coverage
+        timings = [
+            ("Batch `intervals`", _timed(lambda: binned.intervals(predicted, DEFAULT_COVERAGE))),
+            ("One `interval` per prediction",
+             _timed(lambda: [binned.interval(value, DEFAULT_COVERAGE) for value in sample]) * scale),
+            ("Quantiles recomputed per prediction",
+             _timed(lambda: _per_prediction_quantiles(residuals, sample, DEFAULT_COVERAGE,
+                                                      VALUE_RANGES[name])) * scale)
+        ]
+        for label, seconds in timings:
+            timing_rows.append(f"| `{name}` | {label} | {seconds * 1000:.2f} | "
+                               f"{seconds / len(predicted) * 1e9:,.0f} |")
+
+    n_calibration = len(calibration_predictions) // len(result['calibrations'])
+    n_test = len(test) // len(result['calibrations'])
+    lines = [
+        "# Prediction Interval Benchmark",
+        "",
+        "Generated by `python benchmarks/prediction_intervals.py --write`.",
+        "",
+        f"Split-conformal intervals calibrated on {n_calibration:,} rolling-origin predictions per model "
+        f"({n_tracks:,} simulated tracks over {n_days} days, seed 0) and evaluated on {n_test:,} predictions "
+        f"of tracks simulated with seed 1. Binned intervals calibrate {CALIBRATION_BINS} bins of predicted "
+        f"values separately; pooled intervals use one set of residuals. Coverage is the share of realized "
+        f"outcomes inside the interval. Run on {os.cpu_count()} CPU(s).",
+        "",
+        "| Model | Target coverage | Binned coverage | Binned median width | Pooled coverage | "
+        "Pooled median width |",
+        "|---|---|---|---|---|---|"
+    ] + coverage_rows + [
+        "",
+        "Realized trend durations are whole days clipped to the 3-30 day range, so the duration residuals tie "
+        "heavily and its intervals cover more than the target; split-conformal intervals only guarantee at "
+        "least the target coverage.",
+        "",
+        f"Coverage within each bin of predicted values at {DEFAULT_COVERAGE:.0%}:",
+        "",
+        "| Model | Predicted value | Test predictions | Binned coverage | Pooled coverage |",
+        "|---|---|---|---|---|"
+    ] + bin_rows + [
+        "",
+        f"Interval computation for the {n_test:,} test predictions of each model at {DEFAULT_COVERAGE:.0%} "
+        f"(one-at-a-time times extrapolated from {SINGLE_LOOKUPS:,}):",
+        "",
+        "| Model | Computation | Time (ms) | Per prediction (ns) |",
+        "|---|---|---|---|"
+    ] + timing_rows + [""]
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark conformal prediction intervals")
+    parser.add_argument('--tracks', type=int, default=2000, help="Simulated tracks per history set")
+    parser.add_argument('--days', type=int, default=90, help="Days per history")
+    parser.add_argument('--write', action='store_true', help=f"Write the report to {REPORT_PATH}")
+    args = parser.parse_args()
+
+    report = build_report(args.tracks, args.days)
+    print(report)
+
+    if args.write:
+        with open(REPORT_PATH, 'w') as f:
+            f.write(report)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Spike detector benchmark: streaming breakout detection over many tracks.
+
+Streams simulated hourly engagement of many tracks, a few of which break
+out, through a SpikeDetector one hour at a time and reports processing
+time per hour, detection rate and delay for the breakouts, the share of
+alerts that are real breakouts, and false alerts. The same stream is then written to an event file and read back
+with tail_events, to time the file path including parsing.
+
+Usage:
+    python benchmarks/spike_detector.py                  # print the report
+    python benchmarks/spike_detector.py --write          # also update spike_detector.md
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'spike_detector.md')
+sys.path.insert(0, REPO_ROOT)
+
+from modules.spike_detector import (  # noqa: E402
+    CUSUM_CONFIRM_Z,
+    CUSUM_SLACK,
+    CUSUM_THRESHOLD,
+    WARMUP_EVENTS,
+    Z_THRESHOLD,
+    SpikeDetector,
+    run_detector,
+    tail_events
+)
+from utils.data_simulation import generate_engagement_stream  # noqa: E402
+
+def detection_quality(alerts, onsets, start, n_tracks, periods):
+    # Alerts at or after a breakout's onset are detections; all others are false alerts
+    hours = ((alerts['timestamp'] - start) // pd.Timedelta(hours=1)).to_numpy()
+    tracks = alerts['track_id'].str.slice(6).astype(int).to_numpy()
+    onset = onsets[tracks]
+    detected = (onset >= 0) & (hours >= onset)
+    breakouts = np.flatnonzero(onsets >= 0)
+    first = pd.Series(hours[detected]).groupby(tracks[detected]).min().reindex(breakouts)
+    delay = first.to_numpy() - onsets[breakouts]
+    return {
+        'breakouts': len(breakouts),
+        'detected': first.notna().mean(),
+        'delay_median': np.nanmedian(delay),
+        'delay_p90': np.nanpercentile(delay, 90),
+        'precision': detected.mean(),
+        'false_per_1k': (~detected).sum() / (n_tracks * periods) * 1000
+    }
+
+def build_report(n_tracks, periods, breakout_share):
+    events, onsets = generate_engagement_stream(n_tracks, periods, breakout_share=breakout_share, seed=0)
+    start = events['timestamp'].iloc[0]
+
+    detector = SpikeDetector()
+    hour_ms = []
+    alerts = []
+    for _, hour in events.groupby('timestamp', sort=True):
+        began = time.perf_counter()
+        found = detector.update(hour['track_id'].to_numpy(), hour['engagement'].to_numpy(),
+                                timestamps=hour['timestamp'].to_numpy())
+        hour_ms.append((time.perf_counter() - began) * 1000)
+        if len(found):
+            alerts.append(found)
+    alerts = pd.concat(alerts, ignore_index=True)
+    alerts['timestamp'] = pd.to_datetime(alerts['timestamp'])
+    memory = detector.metrics()
+    quality = detection_quality(alerts, onsets, start, n_tracks, periods)
+
+    # The same events through an event file, read back in batches as a tailing consumer would
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'events.csv')
+        events.to_csv(path, index=False)
+        file_detector = SpikeDetector()
+        began = time.perf_counter()
+        tailed = run_detector(file_detector, tail_events(path, batch_lines=n_tracks, follow=False))
+        file_seconds = time.perf_counter() - began
+    assert tailed['events'] == len(events) and tailed['alerts'] == len(alerts)
+
+    lines = [
+        "# Spike Detector Benchmark",
+        "",
+        "Generated by `python benchmarks/spike_detector.py --write`.",
+        "",
+        f"{n_tracks:,} simulated tracks reporting hourly engagement for {periods} hours "
+        f"({len(events):,} events); {breakout_share:.0%} of them start growing exponentially at a random "
+        f"hour in the second half. Defaults: EWMA alerts at z >= {Z_THRESHOLD}, CUSUM (slack {CUSUM_SLACK}) "
+        f"alerts at {CUSUM_THRESHOLD} with z >= {CUSUM_CONFIRM_Z}, {WARMUP_EVENTS} events of warm-up per track. "
+        f"Run on {os.cpu_count()} CPU(s).",
+        "",
+        "| Path | Time | Throughput |",
+        "|---|---|---|",
+        f"| `SpikeDetector.update`, one batch per hour | median {np.median(hour_ms):.1f} ms per hour of "
+        f"{n_tracks:,} events, p99 {np.percentile(hour_ms, 99):.1f} ms | "
+        f"{memory['events_per_second']:,.0f} events/s |",
+        f"| Event file via `tail_events`, parsing included | {file_seconds:.1f} s in total | "
+        f"{len(events) / file_seconds:,.0f} events/s |",
+        "",
+        "Alert latency, from receiving a batch to emitting its alerts: "
+        f"p50 {memory['latency_p50_ms']:.1f} ms, p99 {memory['latency_p99_ms']:.1f} ms "
+        f"({len(alerts):,} alerts).",
+        "",
+        "| Detection | Value |",
+        "|---|---|",
+        f"| Breakouts detected | {quality['detected']:.1%} of {quality['breakouts']:,} |",
+        f"| Delay after onset, median | {quality['delay_median']:.0f} hours |",
+        f"| Delay after onset, p90 | {quality['delay_p90']:.0f} hours |",
+        f"| Alerts that are real breakouts | {quality['precision']:.1%} of {len(alerts):,} |",
+        f"| False alerts | {quality['false_per_1k']:.2f} per 1,000 track-hours |",
+        ""
+    ]
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streaming spike detector")
+    parser.add_argument('--tracks', type=int, default=100_000, help="Tracks in the stream")
+    parser.add_argument('--hours', type=int, default=72, help="Hours of events")
+    parser.add_argument('--breakouts', type=float, default=0.01, help="Share of tracks that break out")
+    parser.add_argument('--write', action='store_true', help=f"Write the report to {REPORT_PATH}")
+    args = parser.parse_args()
+
+    report = build_report(args.tracks, args.hours, args.breakouts)
+    print(report)
+
+    if args.write:
+        with open(REPORT_PATH, 'w') as f:
+            f.write(report)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+"""
+Startup profile for the SonicSeer app.
+
+Reports an import-time breakdown of the modules the landing page needs and
+of the modules deferred until the first prediction, then measures
+time-to-first-paint of the landing page against a running Streamlit server.
+
+Usage:
+    python benchmarks/startup_profile.py              # print the profile
+    python benchmarks/startup_profile.py --write      # also update startup_profile.md
+"""
+import argparse
+import asyncio
+import os
+import re
+import socket
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'startup_profile.md')
+
+# Time-to-first-paint target for the landing page on a warm server process
+FIRST_PAINT_TARGET_MS = 250
+
+# Imports made by app.py before the landing page renders
+LANDING_IMPORTS = [
+    'components.sidebar',
+    'components.recommendation_cards',
+    'components.admin_panel',
+    'utils.style_helpers',
+    'utils.stage_timing'
+]
+
+# Imports deferred until "Generate Quantum Prediction" is first pressed
+PREDICTION_IMPORTS = [
+    'components.trend_charts',
+    'components.metrics_display',
+    'components.progress',
+    'components.pipeline_graph'
+]
+
+APP_PACKAGES = {'components', 'models', 'modules', 'utils'}
+
+IMPORTTIME_PATTERN = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+def import_breakdown(modules, preloaded=('streamlit',)):
+    """
+    Measure cumulative import time of each module with -X importtime.
+
+    Modules in preloaded are imported first and excluded, since the
+    Streamlit server process has already loaded them. Third-party imports
+    are attributed to the app module that imports them directly.
+
+    Returns:
+        tuple: (module, cumulative_ms) pairs in import order, and the
+            (package, cumulative_ms) pairs of third-party packages over 5 ms
+    """
+    code = "; ".join(f"import {name}" for name in list(preloaded) + list(modules))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+
+    rows = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            depth = (len(match.group(3)) - 1) // 2
+            rows.append((depth, match.group(4), int(match.group(2)) / 1000))
+
+    # -X importtime lists dependencies before the module importing them;
+    # walking the rows backwards visits every parent before its children
+    top_level, third_party, ancestors = {}, {}, []
+    for depth, name, cumulative_ms in reversed(rows):
+        del ancestors[depth:]
+        parent = ancestors[-1] if ancestors else None
+        ancestors.append(name)
+
+        if depth == 0:
+            top_level[name] = cumulative_ms
+        elif parent and parent.split('.')[0] in APP_PACKAGES and name.split('.')[0] not in APP_PACKAGES:
+            third_party[name] = cumulative_ms
+
+    breakdown = [(name, top_level.get(name, 0.0)) for name in modules]
+    heavy = sorted(((name, ms) for name, ms in third_party.items() if ms >= 5),
+                   key=lambda item: item[1], reverse=True)
+    return breakdown, heavy
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        return sock.getsockname()[1]
+
+async def _time_session(port, runs):
+    from tornado.websocket import websocket_connect
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    ws = await websocket_connect(f"ws://localhost:{port}/_stcore/stream")
+    timings = []
+    for _ in range(runs):
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        message.rerun_script.page_script_hash = ""
+
+        start = time.perf_counter()
+        first_paint = None
+        await ws.write_message(message.SerializeToString(), binary=True)
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await asyncio.wait_for(ws.read_message(), 120))
+            kind = forward.WhichOneof('type')
+            if kind == 'delta' and first_paint is None:
+                first_paint = (time.perf_counter() - start) * 1000
+            if kind == 'script_finished':
+                timings.append((first_paint, (time.perf_counter() - start) * 1000))
+                break
+    ws.close()
+    return timings
+
+def measure_first_paint(runs=5):
+    """
+    Start the app on a headless Streamlit server and time landing-page runs.
+
+    Returns:
+        list: (first_paint_ms, script_finished_ms) per run; the first run
+            includes importing the app's modules into a fresh server process
+    """
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', 'app.py', '--server.headless', 'true',
+         '--server.port', str(port), '--browser.gatherUsageStats', 'false'],
+        cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.time() + 30
+        while time.time() < deadline:
+            try:
+                socket.create_connection(('localhost', port), timeout=1).close()
+                break
+            except OSError:
+                time.sleep(0.2)
+        return asyncio.run(_time_session(port, runs))
+    finally:
+        server.terminate()
+        server.wait()
+
+def build_report(runs):
+    landing, landing_heavy = import_breakdown(LANDING_IMPORTS)
+    deferred, deferred_heavy = import_breakdown(PREDICTION_IMPORTS)
+    paints = measure_first_paint(runs)
+
+    cold_paint, cold_finish = paints[0]
+    warm = paints[1:] or paints
+    warm_paint = sorted(p for p, _ in warm)[len(warm) // 2]
+    warm_finish = sorted(f for _, f in warm)[len(warm) // 2]
+
+    lines = [
+        "# Startup Profile",
+        "",
+        "Generated by `python benchmarks/startup_profile.py --write`.",
+        "",
+        "## Landing page imports",
+        "",
+        "Cumulative import time (ms) of what `app.py` imports before the landing page renders, "
+        "with Streamlit already loaded by the server process.",
+        "",
+        "| Module | ms |",
+        "|---|---|"
+    ]
+    lines += [f"| `{name}` | {ms:.1f} |" for name, ms in landing]
+    lines += [f"| **Total** | **{sum(ms for _, ms in landing):.1f}** |", ""]
+    if landing_heavy:
+        lines += ["Third-party imports over 5 ms made directly by the landing-page modules:", ""]
+        lines += [f"- `{name}`: {ms:.1f} ms" for name, ms in landing_heavy]
+        lines.append("")
+
+    lines += [
+        "## Deferred until the first prediction",
+        "",
+        "| Module | ms |",
+        "|---|---|"
+    ]
+    lines += [f"| `{name}` | {ms:.1f} |" for name, ms in deferred]
+    lines += [f"| **Total** | **{sum(ms for _, ms in deferred):.1f}** |", ""]
+    if deferred_heavy:
+        lines += ["Largest third-party imports behind the pipeline:", ""]
+        lines += [f"- `{name}`: {ms:.1f} ms" for name, ms in deferred_heavy[:8]]
+        lines.append("")
+
+    status = "met" if warm_paint <= FIRST_PAINT_TARGET_MS and cold_paint <= FIRST_PAINT_TARGET_MS else "missed"
+    lines += [
+        "## Time to first paint",
+        "",
+        "Time from the browser's rerun request to the first rendered element, and to the end of "
+        "the landing-page script.",
+        "",
+        "| Session | First paint (ms) | Script finished (ms) |",
+        "|---|---|---|",
+        f"| Cold (fresh server process) | {cold_paint:.0f} | {cold_finish:.0f} |",
+        f"| Warm (median of {len(warm)}) | {warm_paint:.0f} | {warm_finish:.0f} |",
+        "",
+        f"Target: first paint within {FIRST_PAINT_TARGET_MS} ms on cold and warm sessions ({status}).",
+        ""
+    ]
+    return "\n".join(lines), status == "met"
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile SonicSeer startup")
+    parser.add_argument('--runs', type=int, default=5, help="Landing-page runs to time")
+    parser.add_argument('--write', action='store_true', help=f"Write the report to {REPORT_PATH}")
+    args = parser.parse_args()
+
+    report, met = build_report(args.runs)
+    print(report)
+
+    if args.write:
+        with open(REPORT_PATH, 'w') as f:
+            f.write(report)
+
+    sys.exit(0 if met else 1)
+
+if __name__ == '__main__':
+    main()
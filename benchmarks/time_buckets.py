@@ -0,0 +1,123 @@
+"""
+Time-bucket pyramid benchmark: appending raw events and querying by resolution.
+
+Streams simulated per-event engagement for many tracks into an
+EngagementPyramid in time-ordered batches, then times window queries at
+the resolution each zoom level picks against resampling the raw events
+with pandas on every request, and checks both agree.
+
+Usage:
+    python benchmarks/time_buckets.py                  # print the report
+    python benchmarks/time_buckets.py --write          # also update time_buckets.md
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'time_buckets.md')
+sys.path.insert(0, REPO_ROOT)
+
+from modules.time_buckets import MAX_CHART_POINTS, EngagementPyramid, choose_resolution  # noqa: E402
+
+RESAMPLE_RULES = {'hour': 'h', 'day': 'D', 'week': 'W-MON'}
+
+def generate_events(n_tracks, n_events, days, seed):
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp.now().floor('D').to_datetime64().astype('datetime64[s]').astype(np.int64)
+    seconds = np.sort(rng.integers(end - days * 86400, end, n_events))
+    return pd.DataFrame({
+        'track': rng.integers(0, n_tracks, n_events),
+        'timestamp': seconds.astype('datetime64[s]'),
+        'engagement': rng.integers(1, 100, n_events)
+    })
+
+def resample_window(events, days, end):
+    # What a request costs without the pyramid: filter the raw events and resample them
+    resolution = choose_resolution(days)
+    window = events[(events['timestamp'] > end - pd.Timedelta(days=days)) & (events['timestamp'] <= end)]
+    return window.set_index('timestamp')['engagement'].resample(
+        RESAMPLE_RULES[resolution], label='left', closed='left').sum()
+
+def latency_ms(func, tracks):
+    times = []
+    for track in tracks:
+        start = time.perf_counter()
+        func(track)
+        times.append(time.perf_counter() - start)
+    return np.median(times) * 1000, np.percentile(times, 99) * 1000
+
+def build_report(n_tracks, n_events, days, batches, n_queries):
+    events = generate_events(n_tracks, n_events, days, seed=0)
+    groups = {track: frame for track, frame in events.groupby('track')}
+
+    # Events arrive in time order, in batches spanning all tracks
+    pyramid = EngagementPyramid()
+    start = time.perf_counter()
+    for batch in np.array_split(np.arange(n_events), batches):
+        chunk = events.iloc[batch]
+        for track, frame in chunk.groupby('track'):
+            pyramid.append(track, frame['timestamp'].to_numpy(), frame['engagement'].to_numpy())
+    append_seconds = time.perf_counter() - start
+
+    end = events['timestamp'].max()
+    tracks = np.random.default_rng(1).integers(0, n_tracks, n_queries)
+    for track in tracks[:20]:
+        for zoom in (2, 30, days):
+            expected = resample_window(groups[track], zoom, end)
+            _, buckets = pyramid.window(track, zoom, end=end)
+            found = buckets.set_index('date')['engagement'].reindex(expected.index, fill_value=0)
+            assert np.allclose(found.to_numpy(), expected.to_numpy())
+
+    query_rows = []
+    for zoom in (2, 7, 30, days):
+        resolution = choose_resolution(zoom)
+        pyramid_ms = latency_ms(lambda track: pyramid.window(track, zoom, end=end), tracks)
+        resample_ms = latency_ms(lambda track: resample_window(groups[track], zoom, end), tracks[:100])
+        query_rows.append(f"| {zoom} days | {resolution} | {resample_ms[0]:.2f} | {pyramid_ms[0]:.2f} | "
+                          f"{pyramid_ms[1]:.2f} |")
+
+    lines = [
+        "# Time-Bucket Pyramid Benchmark",
+        "",
+        "Generated by `python benchmarks/time_buckets.py --write`.",
+        "",
+        f"{n_events:,} simulated engagement events for {n_tracks:,} tracks over {days} days, appended in "
+        f"{batches} time-ordered batches. Each zoom level reads the finest resolution with at most "
+        f"{MAX_CHART_POINTS} buckets. 20 tracks were checked against pandas resampling at three zoom "
+        f"levels. Run on {os.cpu_count()} CPU(s).",
+        "",
+        "| Step | Time |",
+        "|---|---|",
+        f"| Append all events | {append_seconds:.2f} s ({n_events / append_seconds:,.0f} events/s) |",
+        "",
+        f"Per-request latency over {n_queries:,} random tracks (resampling over 100):",
+        "",
+        "| Zoom | Resolution | Resample raw events, median (ms) | Pyramid, median (ms) | Pyramid, p99 (ms) |",
+        "|---|---|---|---|---|"
+    ] + query_rows + [""]
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the time-bucket pyramid")
+    parser.add_argument('--tracks', type=int, default=1000, help="Tracks in the feed")
+    parser.add_argument('--events', type=int, default=10_000_000, help="Raw engagement events")
+    parser.add_argument('--days', type=int, default=365, help="Days the events span")
+    parser.add_argument('--batches', type=int, default=24, help="Append batches")
+    parser.add_argument('--queries', type=int, default=1000, help="Window queries per zoom level")
+    parser.add_argument('--write', action='store_true', help=f"Write the report to {REPORT_PATH}")
+    args = parser.parse_args()
+
+    report = build_report(args.tracks, args.events, args.days, args.batches, args.queries)
+    print(report)
+
+    if args.write:
+        with open(REPORT_PATH, 'w') as f:
+            f.write(report)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Trajectory index benchmark: k-nearest DTW queries over many stored curves.
+
+Builds a TrajectoryIndex over simulated past engagement curves, checks a
+few queries against a full DTW scan, then reports per-query latency,
+how many curves each pruning stage leaves and how many queries fell back
+to a full scan.
+
+Usage:
+    python benchmarks/trajectory_index.py                  # print the report
+    python benchmarks/trajectory_index.py --write          # also update trajectory_index.md
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'trajectory_index.md')
+sys.path.insert(0, REPO_ROOT)
+
+from modules.trajectory_index import (  # noqa: E402
+    FULL_SCAN_SHARE,
+    HISTORY_DAYS,
+    WARPING_WINDOW,
+    TrajectoryIndex,
+    dtw_distances,
+    znormalize
+)
+from utils.data_simulation import generate_historical_trends  # noqa: E402
+
+def full_scan(index, history, k):
+    query = znormalize(history.reshape(1, -1))[0]
+    distances = np.concatenate([dtw_distances(query, index.days[:, start:start + 65536].T, index.radius)
+                                for start in range(0, len(index), 65536)])
+    return np.sort(distances)[:k]
+
+def build_report(n_curves, n_queries, k, n_checks):
+    start = time.perf_counter()
+    curves = generate_historical_trends(n_curves, seed=0)
+    generate_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = TrajectoryIndex(curves)
+    build_seconds = time.perf_counter() - start
+
+    queries = generate_historical_trends(n_queries, seed=1)[:, :HISTORY_DAYS]
+
+    scan_seconds = []
+    for history in queries[:n_checks]:
+        start = time.perf_counter()
+        expected = full_scan(index, history, k)
+        scan_seconds.append(time.perf_counter() - start)
+        found = [distance for _, distance in index.query(history, k)]
+        assert np.allclose(found, expected, atol=1e-4), (found, expected)
+
+    seconds, stats = [], []
+    for history in queries:
+        start = time.perf_counter()
+        index.query(history, k)
+        seconds.append(time.perf_counter() - start)
+        stats.append(index.last_query_stats)
+
+    ms = np.array(seconds) * 1000
+    stages = [('after_lb_paa', "LB_PAA pre-filter"), ('after_lb_kim', "LB_Kim"),
+              ('after_lb_keogh', "LB_Keogh"), ('dtw_computed', "DTW computed (incl. seeds)")]
+    stage_rows = []
+    for key, label in stages:
+        counts = np.array([s[key] for s in stats])
+        stage_rows.append(f"| {label} | {np.median(counts):,.0f} | {counts.max():,} | "
+                          f"{np.median(counts) / n_curves:.1%} |")
+
+    lines = [
+        "# Trajectory Index Benchmark",
+        "",
+        "Generated by `python benchmarks/trajectory_index.py --write`.",
+        "",
+        f"{n_curves:,} simulated engagement curves; queries match the first {HISTORY_DAYS} days, "
+        f"z-normalized, under DTW with a {WARPING_WINDOW}-day Sakoe-Chiba band, returning the top {k}. "
+        f"Run on {os.cpu_count()} CPU(s). {n_checks} queries were checked against a full DTW scan.",
+        "",
+        "| Step | Time |",
+        "|---|---|",
+        f"| Generate curves | {generate_seconds:.2f} s |",
+        f"| Build index | {build_seconds:.2f} s |",
+        f"| Full DTW scan (no pruning), mean of {n_checks} | {np.mean(scan_seconds):.2f} s |",
+        "",
+        f"Latency of {n_queries} queries:",
+        "",
+        "| Median (ms) | p90 (ms) | p99 (ms) | Max (ms) |",
+        "|---|---|---|---|",
+        f"| {np.median(ms):.0f} | {np.percentile(ms, 90):.0f} | {np.percentile(ms, 99):.0f} | {ms.max():.0f} |",
+        "",
+        "Curves remaining after each stage:",
+        "",
+        "| Stage | Median | Max | Median share |",
+        "|---|---|---|---|"
+    ] + stage_rows + [
+        "",
+        f"{sum(s['full_scan'] for s in stats)} of {n_queries} queries left more than {FULL_SCAN_SHARE:.0%} "
+        "of the curves after LB_Kim and scanned every curve with DTW instead.",
+        ""
+    ]
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the trajectory index")
+    parser.add_argument('--curves', type=int, default=1_000_000, help="Curves in the index")
+    parser.add_argument('--queries', type=int, default=200, help="Queries to time")
+    parser.add_argument('-k', type=int, default=5, help="Matches per query")
+    parser.add_argument('--checks', type=int, default=3, help="Queries checked against a full scan")
+    parser.add_argument('--write', action='store_true', help=f"Write the report to {REPORT_PATH}")
+    args = parser.parse_args()
+
+    report = build_report(args.curves, args.queries, args.k, args.checks)
+    print(report)
+
+    if args.write:
+        with open(REPORT_PATH, 'w') as f:
+            f.write(report)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,370 @@
+"""
+Command-line entry point for SonicSeer batch jobs.
+
+Runs without Streamlit so it can be scheduled from cron or a data pipeline.
+
+Usage:
+    python cli.py score tracks.csv -o scores.csv
+    python cli.py score trend_store/ -o scores.parquet --workers 4 --chunk-size 1000
+    python cli.py score tracks.csv -o scores.csv --seed 42 --feature-store features.db
+    python cli.py detect events.csv --follow --alerts alerts.csv
+    python cli.py ingest --feed HoloTok=file:holotok.csv --feed NeuraVerse=tcp:127.0.0.1:9001
+    python cli.py backtest --tracks 1000 --workers 4 -o backtest.csv
+    python cli.py tune --model virality --tracks 1000 --workers 4
+    python cli.py calibrate --tracks 2000 --seed 1 --coverage 0.8
+    python cli.py segment --listeners 2000000 --segments 5
+    python cli.py segment --input listeners.csv --chunk-size 200000
+    python cli.py learn --tracks 1000 --log data/outcome_log.csv
+"""
+import argparse
+import os
+import sys
+
+def score(args):
+    # Imported here so `--help` does not pay for pandas and the pipeline
+    from modules.batch_scoring import DEFAULT_CHUNK_SIZE, read_tracks, score_tracks
+
+    try:
+        tracks = read_tracks(args.input)
+    except (OSError, ValueError) as e:
+        print(f"Could not read tracks: {e}", file=sys.stderr)
+        return 2
+
+    print(f"Read {len(tracks)} tracks from {args.input}")
+    score_tracks(tracks, args.output, max_workers=args.workers, chunk_size=args.chunk_size or DEFAULT_CHUNK_SIZE,
+                 seed=args.seed, feature_store=args.feature_store, report=lambda line: print(line, flush=True))
+    return 0
+
+def detect(args):
+    from modules.spike_detector import SpikeDetector, run_detector, tail_events
+
+    detector = SpikeDetector()
+
+    def on_alerts(alerts):
+        if args.alerts:
+            alerts.to_csv(args.alerts, mode='a', index=False, header=not os.path.exists(args.alerts))
+        else:
+            for alert in alerts.itertuples():
+                print(f"{alert.timestamp} {alert.track_id}: {alert.triggers} "
+                      f"(growth {alert.growth:+.1%}, {alert.latency_ms:.1f} ms)", flush=True)
+
+    batches = tail_events(args.events, batch_lines=args.batch_size, follow=args.follow)
+    try:
+        metrics = run_detector(detector, batches, on_alerts=on_alerts)
+    except KeyboardInterrupt:
+        metrics = detector.metrics()
+
+    latency = ("n/a" if metrics['latency_p50_ms'] is None
+               else f"p50 {metrics['latency_p50_ms']:.1f} ms, p99 {metrics['latency_p99_ms']:.1f} ms")
+    print(f"{metrics['events']:,} events from {metrics['tracks']:,} tracks, {metrics['alerts']:,} alerts, "
+          f"{metrics['events_per_second']:,.0f} events/s; alert latency {latency}")
+    return 0
+
+def ingest(args):
+    import asyncio
+    from modules.ingestion import IngestionService, open_feed
+    from modules.trend_store import TrendStore
+
+    feeds = {}
+    for spec in args.feed:
+        platform, separator, source = spec.partition('=')
+        if not separator:
+            print(f"Feed must be PLATFORM=SOURCE, got {spec!r}", file=sys.stderr)
+            return 2
+        try:
+            feeds[platform] = open_feed(source, follow=args.follow)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 2
+
+    def report(metrics):
+        for platform, feed in metrics.items():
+            lag = "n/a" if feed['lag_seconds'] is None else f"{feed['lag_seconds']:.1f} s"
+            print(f"{platform}: {feed['written']:,}/{feed['received']:,} events written, "
+                  f"{feed['dropped']:,} malformed lines dropped, "
+                  f"{feed['events_per_second']:,.0f} events/s, {feed['queued_batches']} batches queued, "
+                  f"lag {lag}", flush=True)
+
+    with TrendStore(args.store) as store:
+        service = IngestionService(store, feeds)
+        try:
+            metrics = asyncio.run(service.run(report=report, report_interval=args.report_every))
+        except KeyboardInterrupt:
+            metrics = service.metrics()
+    report(metrics)
+    return 0
+
+def backtest(args):
+    from modules.backtesting import HORIZON_DAYS, run_backtest
+    from utils.data_simulation import generate_historical_trends
+
+    curves = generate_historical_trends(args.tracks, history_days=args.days - HORIZON_DAYS,
+                                        outcome_days=HORIZON_DAYS, seed=args.seed)
+    try:
+        result = run_backtest(curves, max_workers=args.workers)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    print(f"Backtested {args.tracks} tracks over {result['origins']['origin'].nunique()} origins "
+          f"in {result['wall_seconds']:.1f} s")
+    print(result['summary'].to_string(index=False, float_format=lambda value: f"{value:.3f}"))
+    if args.output:
+        result['origins'].to_csv(args.output, index=False)
+        print(f"Per-origin errors written to {args.output}")
+    return 0
+
+def tune(args):
+    from modules.backtesting import HORIZON_DAYS
+    from modules.tuning import tune_model
+    from utils.data_simulation import generate_historical_trends
+
+    curves = generate_historical_trends(args.tracks, history_days=args.days - HORIZON_DAYS,
+                                        outcome_days=HORIZON_DAYS, seed=args.seed)
+    try:
+        result = tune_model(curves, args.model, model_types=args.model_type, latency_weight=args.latency_weight,
+                            max_workers=args.workers, model_dir=args.model_dir, save=not args.dry_run)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    metadata = result['metadata']
+    print(f"Evaluated {len(result['candidates'])} candidates across halving rounds "
+          f"on {metadata['samples']:,} samples in {result['wall_seconds']:.1f} s")
+    print(f"Best {metadata['model_type']}: {metadata['hyperparameters']}")
+    print(f"Objective {metadata['objective']:.3f}, CV RMSE {metadata['cv_rmse']:.3f}, "
+          f"latency {metadata['latency_ms']:.2f} ms per track")
+    return 0
+
+def calibrate(args):
+    import numpy as np
+    from modules.backtesting import HORIZON_DAYS
+    from modules.prediction_intervals import calibrate_models
+    from utils.data_simulation import generate_historical_trends
+
+    if not 0 < args.coverage < 1:
+        print(f"Coverage must be between 0 and 1, got {args.coverage}", file=sys.stderr)
+        return 2
+    curves = generate_historical_trends(args.tracks, history_days=args.days - HORIZON_DAYS,
+                                        outcome_days=HORIZON_DAYS, seed=args.seed)
+    try:
+        result = calibrate_models(curves, n_bins=args.bins, max_workers=args.workers, model_dir=args.model_dir,
+                                  save=not args.dry_run)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    predictions = result['backtest']['predictions']
+    print(f"Calibrated on {len(predictions) // len(result['calibrations']):,} predictions per model "
+          f"in {result['wall_seconds']:.1f} s")
+    for name, calibration in result['calibrations'].items():
+        rows = predictions[predictions['model'] == name]
+        low, high = calibration.intervals(rows['predicted'].to_numpy(), args.coverage)
+        print(f"  {name}: {len(calibration.bin_sizes())} bins, {args.coverage:.0%} interval "
+              f"median width {np.median(high - low):.1f}")
+    if not args.dry_run:
+        print(f"Calibrations written next to the models in {args.model_dir}")
+    return 0
+
+def segment(args):
+    import time
+    from functools import partial
+    from modules.audience_segmentation import read_listener_chunks, train_segmentation
+    from utils.data_simulation import generate_listener_chunks
+
+    if args.input:
+        if not os.path.exists(args.input):
+            print(f"Could not read listeners: {args.input} does not exist", file=sys.stderr)
+            return 2
+        make_chunks = partial(read_listener_chunks, args.input, args.chunk_size)
+    else:
+        make_chunks = partial(generate_listener_chunks, args.listeners, args.chunk_size, seed=args.seed)
+
+    started = time.perf_counter()
+    try:
+        segmentation = train_segmentation(make_chunks, n_segments=args.segments, passes=args.passes,
+                                          path=args.output)
+    except ValueError as e:
+        print(f"Could not read listeners: {e}", file=sys.stderr)
+        return 2
+
+    print(f"Segmented {segmentation.n_listeners:,} listeners into {segmentation.n_segments} segments "
+          f"in {time.perf_counter() - started:.1f} s")
+    for label, share in segmentation.shares().items():
+        print(f"  {label}: {share:.1%}")
+    print(f"Segmentation written to {args.output}")
+    return 0
+
+def learn(args):
+    from modules.backtesting import HORIZON_DAYS
+    from modules.online_learning import OutcomeLog, load_online_learner, realized_outcome_batches
+    from utils.data_simulation import generate_historical_trends
+
+    log = OutcomeLog(args.log)
+    learner = load_online_learner(args.models, log=log)
+
+    def report(label):
+        metrics = learner.metrics()
+        latency = ("n/a" if metrics['update_p50_ms'] is None
+                   else f"p50 {metrics['update_p50_ms']:.1f} ms, p99 {metrics['update_p99_ms']:.1f} ms")
+        print(f"{label}: {metrics['updates']:,} updates, update latency {latency}", flush=True)
+        for name, model in metrics['models'].items():
+            drift = "n/a" if model['drift_ratio'] is None else f"{model['drift_ratio']:.2f}"
+            flag = " DRIFTING" if model['drifting'] else ""
+            print(f"  {name}: {model['samples']:,} outcomes, version {model['version']}, "
+                  f"serving {model['serving']}, drift {drift}{flag}", flush=True)
+
+    # Catch up on outcomes logged since the models were saved
+    if learner.poll_log():
+        learner.flush()
+        report("Log replayed")
+
+    if args.tracks:
+        curves = generate_historical_trends(args.tracks, history_days=args.days - HORIZON_DAYS,
+                                            outcome_days=HORIZON_DAYS, seed=args.seed)
+        for features, outcomes, observed_at in realized_outcome_batches(curves, max_workers=args.workers):
+            log.append(features, outcomes, observed_at)
+            learner.poll_log()
+            learner.flush()
+            report(f"Outcomes of {observed_at.date()}")
+
+    learner.save(args.models)
+    print(f"Online models written to {args.models}")
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SonicSeer 2040 batch tools")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    score_parser = subparsers.add_parser(
+        'score',
+        help="Score a roster of tracks",
+        description="Predict virality, trend duration, metrics and recommendations for each track."
+    )
+    score_parser.add_argument('input', help="CSV file, Parquet file or directory of Parquet partitions")
+    score_parser.add_argument('-o', '--output', required=True, help="Output .csv or .parquet file")
+    score_parser.add_argument('--workers', type=int, help="Worker processes (default: CPU count)")
+    score_parser.add_argument('--chunk-size', type=int,
+                              help="Rows per output write and progress report")
+    score_parser.add_argument('--seed', type=int, help="Base simulator seed for reproducible scores")
+    score_parser.add_argument('--feature-store', metavar='PATH',
+                              help="SQLite feature store reused across runs on the same day")
+    score_parser.set_defaults(handler=score)
+
+    detect_parser = subparsers.add_parser(
+        'detect',
+        help="Detect breakouts in an engagement event stream",
+        description="Run the EWMA z-score and CUSUM breakout detector over a file of "
+                    "timestamp,track_id,engagement lines."
+    )
+    detect_parser.add_argument('events', help="Event file to read, or to tail with --follow")
+    detect_parser.add_argument('--follow', action='store_true', help="Keep reading lines appended to the file")
+    detect_parser.add_argument('--alerts', metavar='PATH', help="Append alerts to this CSV instead of printing them")
+    detect_parser.add_argument('--batch-size', type=int, default=100_000, help="Most events per detector batch")
+    detect_parser.set_defaults(handler=detect)
+
+    ingest_parser = subparsers.add_parser(
+        'ingest',
+        help="Ingest platform engagement feeds into the trend store",
+        description="Consume one timestamp,track_id,engagement feed per platform and write it into the trend "
+                    "store the app reads observed platform shares from."
+    )
+    ingest_parser.add_argument('--feed', action='append', required=True, metavar='PLATFORM=SOURCE',
+                               help="Feed of one platform; SOURCE is file:PATH, tcp:HOST:PORT or an http(s):// URL")
+    ingest_parser.add_argument('--store', default=os.path.join('data', 'trend_store.db'),
+                               help="SQLite trend store (default: data/trend_store.db)")
+    ingest_parser.add_argument('--follow', action='store_true', help="Keep waiting for new file and HTTP lines")
+    ingest_parser.add_argument('--report-every', type=float, default=10.0, help="Seconds between metric reports")
+    ingest_parser.set_defaults(handler=ingest)
+
+    backtest_parser = subparsers.add_parser(
+        'backtest',
+        help="Backtest the prediction models with rolling forecast origins",
+        description="Replay simulated track histories, score every registered model at each forecast origin "
+                    "from the data before it, and compare with the realized outcomes."
+    )
+    backtest_parser.add_argument('--tracks', type=int, default=500, help="Simulated track histories")
+    backtest_parser.add_argument('--days', type=int, default=90, help="Days per history")
+    backtest_parser.add_argument('--workers', type=int, help="Worker processes (default: CPU count)")
+    backtest_parser.add_argument('--seed', type=int, default=0, help="Seed of the simulated histories")
+    backtest_parser.add_argument('-o', '--output', help="CSV file for the per-origin errors")
+    backtest_parser.set_defaults(handler=backtest)
+
+    tune_parser = subparsers.add_parser(
+        'tune',
+        help="Tune a prediction model's hyperparameters",
+        description="Successive-halving search over the model hyperparameters with forward-chaining CV on "
+                    "simulated histories, ranking candidates by error and prediction latency. The winner is "
+                    "saved with its configuration in the model's metadata, and the app's predictions use "
+                    "it from then on."
+    )
+    tune_parser.add_argument('--model', choices=['virality', 'trend_duration'], default='virality',
+                             help="Registered model to tune")
+    tune_parser.add_argument('--model-type', action='append', choices=['random_forest', 'gradient_boosting'],
+                             help="Model type to search; repeat for several (default: all)")
+    tune_parser.add_argument('--tracks', type=int, default=500, help="Simulated track histories")
+    tune_parser.add_argument('--days', type=int, default=90, help="Days per history")
+    tune_parser.add_argument('--latency-weight', type=float, default=0.01,
+                             help="Objective points per millisecond of prediction latency")
+    tune_parser.add_argument('--workers', type=int, help="Worker processes (default: CPU count)")
+    tune_parser.add_argument('--seed', type=int, default=0, help="Seed of the simulated histories")
+    tune_parser.add_argument('--model-dir', default='models/trained', help="Directory the tuned model is saved to")
+    tune_parser.add_argument('--dry-run', action='store_true', help="Report the winner without saving it")
+    tune_parser.set_defaults(handler=tune)
+
+    calibrate_parser = subparsers.add_parser(
+        'calibrate',
+        help="Calibrate the prediction models' intervals",
+        description="Score simulated histories at rolling forecast origins and store each model's residuals "
+                    "against the realized outcomes next to the model, for split-conformal prediction intervals."
+    )
+    calibrate_parser.add_argument('--tracks', type=int, default=2000, help="Simulated track histories")
+    calibrate_parser.add_argument('--days', type=int, default=90, help="Days per history")
+    calibrate_parser.add_argument('--bins', type=int, default=5, help="Bins of predicted values calibrated separately")
+    calibrate_parser.add_argument('--coverage', type=float, default=0.8, help="Interval coverage to report")
+    calibrate_parser.add_argument('--workers', type=int, help="Worker processes (default: CPU count)")
+    calibrate_parser.add_argument('--seed', type=int, default=1,
+                                  help="Seed of the simulated histories; keep it apart from the training seed")
+    calibrate_parser.add_argument('--model-dir', default='models/trained', help="Directory of the model files")
+    calibrate_parser.add_argument('--dry-run', action='store_true', help="Report the calibration without saving it")
+    calibrate_parser.set_defaults(handler=calibrate)
+
+    segment_parser = subparsers.add_parser(
+        'segment',
+        help="Learn audience segments from listener vectors",
+        description="Cluster listener vectors with mini-batch k-means, reading them chunk by chunk, and save the "
+                    "segments the app's demographic chart shows."
+    )
+    segment_parser.add_argument('--input', metavar='PATH',
+                                help="CSV of listener vectors (default: simulated listeners)")
+    segment_parser.add_argument('--listeners', type=int, default=1_000_000, help="Simulated listeners")
+    segment_parser.add_argument('--segments', type=int, default=5, help="Number of segments")
+    segment_parser.add_argument('--chunk-size', type=int, default=100_000, help="Listeners read per chunk")
+    segment_parser.add_argument('--passes', type=int, default=1, help="Passes of k-means updates over the chunks")
+    segment_parser.add_argument('--seed', type=int, default=0, help="Seed of the simulated listeners")
+    segment_parser.add_argument('-o', '--output',
+                                default=os.path.join('models', 'trained', 'audience_segmentation.pkl'), help="Segmentation artifact (default: models/trained/audience_segmentation.pkl)")
+    segment_parser.set_defaults(handler=segment)
+
+    learn_parser = subparsers.add_parser(
+        'learn',
+        help="Update the online models from realized outcomes",
+        description="Append realized outcomes of simulated tracks to the outcome log as their forecast periods "
+                    "end, update the online models in micro-batches, and report drift and update latency."
+    )
+    learn_parser.add_argument('--tracks', type=int, default=500,
+                              help="Simulated tracks whose outcomes are logged; 0 only learns the existing log")
+    learn_parser.add_argument('--days', type=int, default=120, help="Days per simulated history")
+    learn_parser.add_argument('--seed', type=int, default=0, help="Seed of the simulated histories")
+    learn_parser.add_argument('--workers', type=int, help="Worker processes computing features (default: CPU count)")
+    learn_parser.add_argument('--log', default=os.path.join('data', 'outcome_log.csv'),
+                              help="Outcome log (default: data/outcome_log.csv)")
+    learn_parser.add_argument('--models', default=os.path.join('models', 'trained', 'online_models.pkl'),
+                              help="Online models (default: models/trained/online_models.pkl)")
+    learn_parser.set_defaults(handler=learn)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+if __name__ == '__main__':
+    sys.exit(main())
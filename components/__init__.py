@@ -1,14 +1,21 @@
 # This file makes the components directory a Python package
-# Import key components to make them available at the package level
-
-from .sidebar import render_sidebar
-from .trend_charts import render_trend_chart
-from .metrics_display import render_metrics
-from .recommendation_cards import render_recommendations
-
-__all__ = [
-    'render_sidebar',
-    'render_trend_chart',
-    'render_metrics',
-    'render_recommendations'
-]
\ No newline at end of file
+# Key functions are exported at the package level but imported on first access,
+# so importing the package does not pull in heavy dependencies like scikit-learn
+
+import importlib
+
+_EXPORTS = {
+    'render_sidebar': '.sidebar',
+    'render_trend_chart': '.trend_charts',
+    'render_platform_analysis': '.trend_charts',
+    'render_metrics': '.metrics_display',
+    'render_recommendations': '.recommendation_cards'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,67 @@
+import hmac
+import os
+
+import streamlit as st
+from utils.caching import get_cache_summaries, clear_data_caches
+
+# Environment variable holding the token that ?admin=<token> must match;
+# without it the admin panels are never shown
+ADMIN_TOKEN_ENV = 'SONICSEER_ADMIN_TOKEN'
+
+def is_admin_view():
+    """
+    Check whether the admin panel was requested with the configured ?admin=<token>.
+    
+    Returns:
+        bool: True if the admin panel should be shown
+    """
+    token = os.environ.get(ADMIN_TOKEN_ENV)
+    requested = st.experimental_get_query_params().get('admin', [''])[0]
+    return bool(token) and hmac.compare_digest(requested.encode(), token.encode())
+
+def render_cache_admin():
+    """
+    Render cache sizes and hit rates for tuning memory per server.
+    """
+    with st.sidebar.expander("Cache Admin", expanded=False):
+        summaries = get_cache_summaries()
+        
+        if not summaries:
+            st.caption("No caches registered yet")
+            return
+        
+        import pandas as pd
+        
+        table = pd.DataFrame(summaries)
+        table['hit_rate'] = (table['hit_rate'] * 100).round(1)
+        table['est_size_kb'] = table['est_size_kb'].round(1)
+        
+        total_kb = table['est_size_kb'].sum()
+        total_calls = table['calls'].sum()
+        overall_hit_rate = table['hits'].sum() / total_calls * 100 if total_calls else 0.0
+        
+        st.markdown(f"**Estimated size:** {total_kb:,.1f} KB &nbsp; **Hit rate:** {overall_hit_rate:.1f}%")
+        st.dataframe(table.set_index('cache'), use_container_width=True)
+        st.caption("Sizes are estimated from the most recent misses, up to each cache's max_entries")
+        
+        if st.button("Clear data caches"):
+            clear_data_caches()
+            st.experimental_rerun()
+
+def render_online_learning_admin():
+    """
+    Render the online models' samples, drift and update latency.
+    """
+    with st.sidebar.expander("Online Learning", expanded=False):
+        import pandas as pd
+        from components.pipeline_cache import get_online_learner
+        
+        metrics = get_online_learner().metrics()
+        latency = ("n/a" if metrics['update_p50_ms'] is None
+                   else f"p50 {metrics['update_p50_ms']:.1f} ms, p99 {metrics['update_p99_ms']:.1f} ms")
+        st.markdown(f"**Updates:** {metrics['updates']:,} &nbsp; **Queued:** {metrics['queued_batches']} "
+                    f"&nbsp; **Update latency:** {latency}")
+        
+        table = pd.DataFrame(metrics['models']).T
+        st.dataframe(table, use_container_width=True)
+        st.caption("Drift is the MAE of recent outcomes, scored before learning them, over the reference MAE")
@@ -1,12 +1,23 @@
 import streamlit as st
-from modules.visualization import create_radar_chart
+from components.pipeline_cache import cached_radar_chart, cached_marketing_metrics
+from modules.prediction_intervals import DEFAULT_COVERAGE
 
-def render_metrics(metrics):
+def _range_line(value_range, fmt, unit='', source=None):
+    # Calibrated prediction interval under a metric card's value, if there is one
+    if value_range is None:
+        return ""
+    low, high = value_range
+    label = f"{DEFAULT_COVERAGE:.0%} range" + (f" ({source})" if source else "")
+    return (f"<p style='font-size:13px;margin:0 0 6px 0;color:#c9b6ff;'>"
+            f"{label}: {low:{fmt}}&ndash;{high:{fmt}}{unit}</p>")
+
+def render_metrics(metrics, radar_fig=None):
     """
     Render the metrics display component.
     
     Args:
         metrics (dict): Dictionary containing trend metrics
+        radar_fig (plotly.graph_objects.Figure, optional): Prebuilt radar chart
     """
     st.markdown("<div class='holographic'>", unsafe_allow_html=True)
     st.subheader("Virality Metrics")
@@ -18,7 +29,7 @@ def render_metrics(metrics):
     st.markdown(f"""
     <div class='metric-card'>
         <h3 style='margin:0;font-size:16px;'>Virality Score</h3>
-        <p style='font-size:28px;margin:10px 0;color:#BD4DE6;'>{metrics.get('virality_score', 0):.1f}<span style='font-size:16px;'>/100</span></p>
+        <p style='font-size:28px;margin:10px 0;color:#BD4DE6;'>{metrics.get('virality_score', 0):.1f}<span style='font-size:16px;'>/100</span></p>{_range_line(metrics.get('virality_range'), '.1f')}
         <p style='font-size:12px;margin:0;'>Quantum-calculated probability</p>
     </div>
     """, unsafe_allow_html=True)
@@ -32,12 +43,20 @@ def render_metrics(metrics):
     </div>
     """, unsafe_allow_html=True)
     
-    # Trend Duration
+    # Trend Duration; a growth curve's duration is shown with the duration model's range
+    if metrics.get('growth_model'):
+        duration_desc = (f"Until growth fades ({metrics['growth_model']} fit: fastest growth "
+                         f"{metrics['inflection_day']}, ceiling {metrics['carrying_capacity']:,})")
+        duration_range = _range_line(metrics.get('model_trend_duration_range'), 'd', ' days',
+                                     source=f"duration model: {metrics.get('model_trend_duration')} days")
+    else:
+        duration_desc = "Expected active period"
+        duration_range = _range_line(metrics.get('trend_duration_range'), 'd', ' days')
     st.markdown(f"""
     <div class='metric-card'>
         <h3 style='margin:0;font-size:16px;'>Trend Duration</h3>
-        <p style='font-size:28px;margin:10px 0;color:#BD4DE6;'>{metrics.get('trend_duration', 0)} days</p>
-        <p style='font-size:12px;margin:0;'>Expected active period</p>
+        <p style='font-size:28px;margin:10px 0;color:#BD4DE6;'>{metrics.get('trend_duration', 0)} days</p>{duration_range}
+        <p style='font-size:12px;margin:0;'>{duration_desc}</p>
     </div>
     """, unsafe_allow_html=True)
     
@@ -67,27 +86,23 @@ def render_metrics(metrics):
     st.subheader("Neural-Sonic Pattern Analysis")
     
     # Create and display radar chart
-    radar_fig = create_radar_chart(metrics)
+    if radar_fig is None:
+        radar_fig = cached_radar_chart(metrics)
     st.plotly_chart(radar_fig, use_container_width=True)
     
     st.markdown("</div>", unsafe_allow_html=True)
 
-def render_marketing_metrics(metrics):
+def render_marketing_metrics(metrics, marketing_metrics=None):
     """
     Render additional marketing-related metrics.
     
     Args:
         metrics (dict): Dictionary containing metrics data
+        marketing_metrics (list, optional): Precomputed marketing metric dictionaries
     """
     # Get marketing metrics
-    from utils.metrics_calculation import generate_marketing_metrics
-    
-    marketing_metrics = generate_marketing_metrics(
-        neural_connection=metrics.get('neural_connection', 0.8),
-        emotional_intensity=metrics.get('emotional_intensity', 7),
-        meme_potential=metrics.get('meme_potential', 0.7),
-        virality_score=metrics.get('virality_score', 50)
-    )
+    if marketing_metrics is None:
+        marketing_metrics = cached_marketing_metrics(metrics)
     
     st.subheader("Neural-Enhanced Marketing Opportunities")
     
@@ -0,0 +1,450 @@
+import os
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from modules.pipeline import (
+    simulate_trend,
+    preprocess_buckets,
+    compute_features,
+    predict_outcomes,
+    compute_metrics,
+    select_params,
+    SIMULATION_PARAMS,
+    METRICS_PARAMS,
+    RADAR_PARAMS,
+    PLATFORM_PARAMS,
+    DEMOGRAPHIC_PARAMS,
+    RECOMMENDATION_PARAMS,
+    MARKETING_PARAMS
+)
+from modules.prediction_models import load_prediction_models
+from modules.prediction_intervals import load_calibrations
+from modules.recommendation import generate_artist_recommendations
+from modules.visualization import (
+    create_trend_chart,
+    create_radar_chart,
+    create_platform_distribution_chart,
+    create_demographic_chart,
+    create_similar_trajectories_chart,
+    create_regional_engagement_chart
+)
+from utils.caching import tracked_cache_data, tracked_cache_resource
+from modules.trajectory_index import TrajectoryIndex
+from modules.engagement_cube import GLOBAL_REGION, EngagementCube
+from modules.time_buckets import EngagementPyramid
+from modules.leaderboard import FEATURE_WINDOW, TrendingLeaderboard
+from modules.trend_store import DEFAULT_STORE_PATH, TrendStore
+from modules.online_learning import ONLINE_MODELS_PATH, OUTCOME_LOG_PATH, OutcomeLog, load_online_learner
+from modules.audience_segmentation import CHUNK_ROWS, SEGMENTATION_PATH, load_segmentation, train_segmentation
+from utils.data_simulation import (
+    generate_engagement_events,
+    generate_engagement_updates,
+    generate_historical_trends,
+    generate_hourly_engagement,
+    generate_listener_chunks,
+    generate_platform_distribution,
+    generate_track_catalog
+)
+from utils.metrics_calculation import calculate_demographic_appeal, generate_marketing_metrics
+
+# Figures are larger than stage outputs, so chart caches keep fewer entries
+CHART_CACHE_MAX_ENTRIES = 64
+
+# Simulated past tracks searched for similar trajectories, and matches shown
+TRAJECTORY_CATALOG_SIZE = 200_000
+SIMILAR_TRAJECTORIES = 4
+
+# Simulated raw engagement rows aggregated into the region/genre/day cube,
+# the days they span, and the days shown in the regional chart
+ENGAGEMENT_EVENTS = 2_000_000
+ENGAGEMENT_DAYS = 90
+REGIONAL_CHART_DAYS = 60
+
+# Pipeline state key of the session's engagement feed pyramid, and the most
+# recent trends it keeps; older ones are dropped as new ones are appended
+FEED_STATE_KEY = 'engagement_feed_pyramid'
+FEED_MAX_TRACKS = 8
+
+# Simulated tracks ranked on the trending leaderboard; each gets a new day
+# of engagement for every day that passes
+LEADERBOARD_CATALOG_SIZE = 200_000
+
+# Days of ingested platform engagement behind the observed platform shares
+OBSERVED_SHARE_DAYS = 7
+
+# Simulated listeners segmented when no trained segmentation artifact exists
+SEGMENTATION_LISTENERS = 300_000
+
+# Serialize catching the shared cube and leaderboard up to today across sessions
+_cube_catch_up_lock = threading.Lock()
+_leaderboard_catch_up_lock = threading.Lock()
+
+@tracked_cache_resource('prediction_models')
+def get_prediction_models():
+    """
+    Load the virality and trend duration models once per server process.
+
+    Returns:
+        dict: Models keyed by 'virality' and 'trend_duration'
+    """
+    return load_prediction_models()
+
+@tracked_cache_resource('prediction_calibrations')
+def get_prediction_calibrations():
+    """
+    Load the models' prediction interval calibrations once per server process.
+
+    Returns:
+        dict: ConformalCalibration per calibrated model
+    """
+    return load_calibrations()
+
+@tracked_cache_data('simulate')
+def _simulate_trend(simulation_params):
+    return simulate_trend(simulation_params)
+
+def cached_simulate_trend(params):
+    """
+    Simulate trend data, cached by the simulation parameters only.
+    """
+    return _simulate_trend(select_params(params, SIMULATION_PARAMS))
+
+@tracked_cache_data('preprocess')
+def _preprocess_buckets(buckets, resolution):
+    return preprocess_buckets(buckets, resolution)
+
+def cached_preprocess_feed(feed, track_id, days):
+    """
+    Preprocess the last days of a track in the engagement feed, cached by the buckets read.
+
+    The window is read from the pyramid level that covers the days in at most
+    MAX_CHART_POINTS buckets, so a month of history is read from daily buckets.
+
+    Returns:
+        tuple: (resolution, preprocessed history)
+    """
+    resolution, buckets = feed.window(track_id, days)
+    return resolution, _preprocess_buckets(buckets, resolution)
+
+@tracked_cache_data('features')
+def cached_compute_features(processed, resolution='day'):
+    """
+    Extract model features, cached by the preprocessed history and its resolution.
+    """
+    return compute_features(processed, resolution)
+
+@tracked_cache_resource('online_learner')
+def get_online_learner():
+    """
+    Load the online outcome models once per server process.
+
+    Returns:
+        OnlineLearner: Models saved at ONLINE_MODELS_PATH, learning from OUTCOME_LOG_PATH
+    """
+    return load_online_learner(ONLINE_MODELS_PATH, log=OutcomeLog(OUTCOME_LOG_PATH))
+
+def current_online_models():
+    """
+    The latest online models, after queueing outcomes newly appended to the log.
+
+    Queued outcomes are learned in the background, so this never waits for
+    an update; later calls pick up the swapped-in models.
+
+    Returns:
+        dict: OnlineRegressor per outcome
+    """
+    learner = get_online_learner()
+    if os.path.exists(OUTCOME_LOG_PATH):
+        learner.poll_log()
+    return learner.models()
+
+def online_models_version():
+    """
+    Version of the online models the predict stage would use, polling the log first.
+
+    Returns:
+        tuple: Outcome log offset learned up to, and (name, version) per online model
+    """
+    online_models = current_online_models()
+    return get_online_learner().log_offset, tuple((name, model.version) for name, model in online_models.items())
+
+@tracked_cache_data('predict')
+def _predict_outcomes(features, online_versions, _models, _online_models, _calibrations):
+    return predict_outcomes(features, models=_models, online_models=_online_models, calibrations=_calibrations)
+
+def cached_predict_outcomes(features):
+    """
+    Run the predictors with the shared models, cached by the features and online model versions.
+    """
+    online_models = current_online_models()
+    online_versions = tuple((name, model.version) for name, model in online_models.items())
+    return _predict_outcomes(features, online_versions, get_prediction_models(), online_models,
+                             get_prediction_calibrations())
+
+@tracked_cache_data('metrics')
+def _compute_metrics(trend_data, metrics_params, predictions):
+    return compute_metrics(trend_data, metrics_params, predictions)
+
+def cached_compute_metrics(trend_data, params, predictions):
+    """
+    Calculate forecast metrics, cached by trend data, metric parameters and predictions.
+    """
+    return _compute_metrics(trend_data, select_params(params, METRICS_PARAMS), predictions)
+
+@tracked_cache_data('trend_chart', max_entries=CHART_CACHE_MAX_ENTRIES)
+def _trend_chart(trend_data, genre, peak_day):
+    return create_trend_chart(trend_data, genre, {'peak_day': peak_day})
+
+def cached_trend_chart(trend_data, genre, metrics):
+    """
+    Build the trend chart, cached by the trend data, genre and peak day.
+    """
+    return _trend_chart(trend_data, genre, metrics.get('peak_day'))
+
+@tracked_cache_resource('trajectory_index')
+def get_trajectory_index():
+    """
+    Index the simulated past trajectories once per server process.
+
+    Returns:
+        TrajectoryIndex: DTW index over the catalog's engagement curves
+    """
+    curves = generate_historical_trends(TRAJECTORY_CATALOG_SIZE, seed=0)
+    return TrajectoryIndex(curves, track_ids=[f"track-{i}" for i in range(len(curves))])
+
+@tracked_cache_data('similar_trajectories', max_entries=CHART_CACHE_MAX_ENTRIES)
+def cached_similar_trajectories_chart(trend_data):
+    """
+    Find past tracks whose history matches the trend and chart them, cached by the trend data.
+    """
+    history = trend_data[~trend_data['is_forecast']]
+    precedents = get_trajectory_index().precedents(history['engagement'].to_numpy(), k=SIMILAR_TRAJECTORIES)
+    return create_similar_trajectories_chart(history, precedents)
+
+def build_engagement_feed(trend_data, state):
+    """
+    Append the hourly engagement events behind a trend's observed days to the session feed.
+
+    The pyramid holds mutable per-track state, so it is kept in the
+    pipeline's state rather than in a pickling data cache. Each observed
+    history is its own track of the feed, identified by its dates and
+    values, so returning to recent parameters reuses the buckets appended
+    then; only the last FEED_MAX_TRACKS trends are kept.
+
+    Args:
+        trend_data (pd.DataFrame): Simulated trend data
+        state (MutableMapping): The pipeline's per-session state
+
+    Returns:
+        tuple: (EngagementPyramid of the session, track id of the trend)
+    """
+    history = trend_data.loc[~trend_data['is_forecast'], ['date', 'engagement']]
+    track_id = int(pd.util.hash_pandas_object(history, index=False).sum())
+    feed = state.setdefault(FEED_STATE_KEY, EngagementPyramid())
+    if track_id not in feed:
+        events = generate_hourly_engagement(trend_data, seed=0)
+        feed.append(track_id, events['timestamp'], events['engagement'])
+        for old_track in feed.tracks[:-FEED_MAX_TRACKS]:
+            feed.discard(old_track)
+    return feed, track_id
+
+@tracked_cache_resource('engagement_cube')
+def get_engagement_cube():
+    """
+    Aggregate the simulated engagement rows into a cube once per server process.
+
+    Returns:
+        EngagementCube: Engagement by region, genre and day through today
+    """
+    cube = EngagementCube()
+    cube.ingest(generate_engagement_events(ENGAGEMENT_EVENTS, ENGAGEMENT_DAYS, seed=0))
+    return cube
+
+def current_engagement_cube():
+    """
+    The shared engagement cube, with rows for any days since it was built ingested.
+
+    Returns:
+        EngagementCube: Engagement by region, genre and day through today
+    """
+    cube = get_engagement_cube()
+    with _cube_catch_up_lock:
+        today = np.datetime64(datetime.now().date(), 'D')
+        missing = int((today - cube.end).astype(np.int64))
+        if missing > 0:
+            cube.ingest(generate_engagement_events(ENGAGEMENT_EVENTS // ENGAGEMENT_DAYS * missing, missing,
+                                                   end_date=today, seed=cube.version))
+    return cube
+
+@tracked_cache_data('regional_chart', max_entries=CHART_CACHE_MAX_ENTRIES)
+def _regional_chart(regions, genre, cube_version):
+    cube = get_engagement_cube()
+    start = cube.end - (REGIONAL_CHART_DAYS - 1)
+    series = {region: cube.query(region, genre, start=start) for region in regions}
+    if len(regions) > 1 and GLOBAL_REGION not in regions:
+        series["Selected markets"] = cube.query(regions, genre, start=start)
+    selected = cube.query(regions, genre, start=start)['engagement'].sum()
+    total = cube.query(GLOBAL_REGION, genre, start=start)['engagement'].sum()
+    return create_regional_engagement_chart(series, genre), selected / total if total else 0.0
+
+def cached_regional_chart(params):
+    """
+    Chart daily engagement of the selected regions for the genre from the cube.
+
+    Cached by the regions, genre and cube version, so new ingested days
+    produce a new chart.
+
+    Returns:
+        tuple: (figure, share of the genre's engagement in the selected regions)
+    """
+    cube = current_engagement_cube()
+    return _regional_chart(tuple(params['regions']), params['genre'], cube.version)
+
+@tracked_cache_resource('trending_leaderboard')
+def get_trending_leaderboard():
+    """
+    Rank the simulated track catalog by trending score once per server process.
+
+    Returns:
+        TrendingLeaderboard: Leaderboard over LEADERBOARD_CATALOG_SIZE tracks, through today
+    """
+    catalog, history = generate_track_catalog(LEADERBOARD_CATALOG_SIZE, FEATURE_WINDOW + 1, seed=0)
+    return TrendingLeaderboard(catalog['track_id'], catalog['genre'], catalog['region'], history,
+                               end=np.datetime64(datetime.now().date(), 'D'))
+
+def current_trending_leaderboard():
+    """
+    The shared leaderboard, with a new day of engagement recorded for every track for each day since it was built.
+
+    Reruns within a day leave it unchanged, so momentum and mean_growth
+    always span FEATURE_WINDOW days.
+
+    Returns:
+        TrendingLeaderboard: Leaderboard through today
+    """
+    leaderboard = get_trending_leaderboard()
+    with _leaderboard_catch_up_lock:
+        today = np.datetime64(datetime.now().date(), 'D')
+        # Days older than the window would be shifted out again before today
+        leaderboard.end = max(leaderboard.end, today - (FEATURE_WINDOW + 1))
+        while leaderboard.end < today:
+            day = leaderboard.end + 1
+            engagement = generate_engagement_updates(leaderboard.latest(leaderboard.track_ids),
+                                                     seed=int(day.astype(np.int64)))
+            leaderboard.record_many(leaderboard.track_ids, engagement)
+            leaderboard.end = day
+    return leaderboard
+
+@tracked_cache_data('radar_chart', max_entries=CHART_CACHE_MAX_ENTRIES)
+def _radar_chart(radar_params):
+    return create_radar_chart(radar_params)
+
+def cached_radar_chart(params):
+    """
+    Build the radar chart, cached by the audio parameters it plots.
+    """
+    return _radar_chart(select_params(params, RADAR_PARAMS))
+
+@tracked_cache_resource('trend_store')
+def get_trend_store():
+    """
+    Open the trend store that `cli.py ingest` writes platform engagement into.
+
+    Returns:
+        TrendStore: Store at DEFAULT_STORE_PATH
+    """
+    return TrendStore(DEFAULT_STORE_PATH)
+
+def observed_platform_shares():
+    """
+    Share of ingested engagement per platform over the last OBSERVED_SHARE_DAYS days.
+
+    Returns:
+        dict: Shares keyed by platform; empty when nothing has been ingested
+    """
+    if not os.path.exists(DEFAULT_STORE_PATH):
+        return {}
+    return get_trend_store().platform_shares(OBSERVED_SHARE_DAYS)
+
+@tracked_cache_data('platform_chart', max_entries=CHART_CACHE_MAX_ENTRIES)
+def _platform_chart(platform_params, observed):
+    platforms = generate_platform_distribution(**platform_params)
+    return create_platform_distribution_chart(platforms, observed=dict(observed))
+
+def observed_platform_version():
+    """
+    Version of the ingested platform data the platform chart shows.
+
+    Returns:
+        tuple: (platform, share) pairs of observed_platform_shares
+    """
+    return tuple(observed_platform_shares().items())
+
+def cached_platform_chart(params):
+    """
+    Build the platform distribution chart, cached by its parameters and the observed shares.
+    """
+    observed = observed_platform_version()
+    return _platform_chart(select_params(params, PLATFORM_PARAMS), observed)
+
+@tracked_cache_data('demographic_chart', max_entries=CHART_CACHE_MAX_ENTRIES)
+def _demographic_chart(demographic_params):
+    demographics = calculate_demographic_appeal(**demographic_params)
+    return create_demographic_chart(demographics)
+
+def cached_demographic_chart(params):
+    """
+    Build the demographic donut chart, cached by its parameters.
+    """
+    return _demographic_chart(select_params(params, DEMOGRAPHIC_PARAMS))
+
+@tracked_cache_resource('audience_segmentation')
+def get_audience_segmentation():
+    """
+    Load the learned audience segments once per server process.
+
+    Without a trained artifact at SEGMENTATION_PATH, segments are learned
+    from SEGMENTATION_LISTENERS simulated listeners instead, without saving.
+
+    Returns:
+        AudienceSegmentation: Trained segmentation
+    """
+    segmentation = load_segmentation(SEGMENTATION_PATH)
+    if segmentation is None:
+        segmentation = train_segmentation(lambda: generate_listener_chunks(SEGMENTATION_LISTENERS, CHUNK_ROWS, seed=0),
+                                          path=None)
+    return segmentation
+
+@tracked_cache_data('segment_chart', max_entries=CHART_CACHE_MAX_ENTRIES)
+def _segment_chart(demographic_params):
+    appeal = get_audience_segmentation().segment_appeal(demographic_params)
+    return create_demographic_chart(appeal, title="Learned Audience Segments")
+
+def cached_segment_chart(params):
+    """
+    Build the demographic donut over the learned audience segments, cached by its parameters.
+    """
+    return _segment_chart(select_params(params, DEMOGRAPHIC_PARAMS))
+
+@tracked_cache_data('recommendations')
+def _recommendations(recommendation_params):
+    return generate_artist_recommendations(recommendation_params)
+
+def cached_recommendations(params):
+    """
+    Generate artist recommendations, cached by the parameters they read.
+    """
+    return _recommendations(select_params(params, RECOMMENDATION_PARAMS))
+
+@tracked_cache_data('marketing_metrics')
+def _marketing_metrics(marketing_params, virality_score):
+    return generate_marketing_metrics(virality_score=virality_score, **marketing_params)
+
+def cached_marketing_metrics(params):
+    """
+    Generate marketing metrics, cached by their parameters and virality score.
+    """
+    return _marketing_metrics(select_params(params, MARKETING_PARAMS), params.get('virality_score', 50))
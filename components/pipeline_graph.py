@@ -0,0 +1,74 @@
+from components.pipeline_cache import (
+    cached_simulate_trend,
+    cached_preprocess_feed,
+    cached_compute_features,
+    cached_predict_outcomes,
+    cached_compute_metrics,
+    cached_trend_chart,
+    cached_similar_trajectories_chart,
+    build_engagement_feed,
+    cached_radar_chart,
+    cached_platform_chart,
+    observed_platform_version,
+    online_models_version,
+    cached_demographic_chart,
+    cached_recommendations,
+    cached_marketing_metrics
+)
+from modules.pipeline import (
+    PipelineStage,
+    IncrementalPipeline,
+    SIMULATION_PARAMS,
+    METRICS_PARAMS,
+    RADAR_PARAMS,
+    PLATFORM_PARAMS,
+    DEMOGRAPHIC_PARAMS,
+    RECOMMENDATION_PARAMS,
+    MARKETING_PARAMS
+)
+
+def _engagement_feed(params, trend_data, state):
+    return build_engagement_feed(trend_data, state)
+
+def _preprocess(params, trend_data, engagement_feed):
+    # The observed days are read back from the feed at the level that fits them
+    feed, track_id = engagement_feed
+    return cached_preprocess_feed(feed, track_id, days=int((~trend_data['is_forecast']).sum()))
+
+def _features(params, preprocessed):
+    resolution, processed = preprocessed
+    return cached_compute_features(processed, resolution)
+
+def _predict(params, features):
+    return cached_predict_outcomes(features)
+
+def _metrics(params, trend_data, predictions):
+    return cached_compute_metrics(trend_data, params, predictions)
+
+def _trend_chart(params, trend_data, metrics):
+    return cached_trend_chart(trend_data, params['genre'], metrics)
+
+def _similar_trajectories(params, trend_data):
+    return cached_similar_trajectories_chart(trend_data)
+
+def _marketing_metrics(params, metrics):
+    return cached_marketing_metrics({**params, 'virality_score': metrics['virality_score']})
+
+# The app's prediction pipeline; each stage lists the sidebar parameters,
+# upstream stages and outside state (swapped-in online models, ingested
+# platform shares) it depends on, so a rerun only re-executes what changed
+APP_PIPELINE = IncrementalPipeline([
+    PipelineStage('simulate', cached_simulate_trend, params=SIMULATION_PARAMS),
+    PipelineStage('engagement_feed', _engagement_feed, deps=('simulate',), stateful=True),
+    PipelineStage('preprocess', _preprocess, deps=('simulate', 'engagement_feed')),
+    PipelineStage('features', _features, deps=('preprocess',)),
+    PipelineStage('predict', _predict, deps=('features',), inputs=(online_models_version,)),
+    PipelineStage('metrics', _metrics, params=METRICS_PARAMS, deps=('simulate', 'predict')),
+    PipelineStage('trend_chart', _trend_chart, params=('genre',), deps=('simulate', 'metrics')),
+    PipelineStage('similar_trajectories', _similar_trajectories, deps=('simulate',)),
+    PipelineStage('radar_chart', cached_radar_chart, params=RADAR_PARAMS),
+    PipelineStage('platform_chart', cached_platform_chart, params=PLATFORM_PARAMS, inputs=(observed_platform_version,)),
+    PipelineStage('demographic_chart', cached_demographic_chart, params=DEMOGRAPHIC_PARAMS),
+    PipelineStage('recommendations', cached_recommendations, params=RECOMMENDATION_PARAMS),
+    PipelineStage('marketing_metrics', _marketing_metrics, params=MARKETING_PARAMS, deps=('metrics',))
+])
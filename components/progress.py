@@ -0,0 +1,103 @@
+import streamlit as st
+import pandas as pd
+from contextlib import contextmanager
+
+# Spinner message shown while each pipeline stage runs
+STAGE_MESSAGES = {
+    'simulate': 'Initializing quantum neural pathways...',
+    'engagement_feed': 'Bucketing the hourly engagement feed...',
+    'preprocess': 'Analyzing memetic resonance patterns...',
+    'features': 'Calculating cross-platform harmonic frequencies...',
+    'predict': 'Integrating neural-collective consciousness data...',
+    'metrics': 'Computing virality metrics...',
+    'trend_chart': 'Generating sensory-enhanced visualization...',
+    'similar_trajectories': 'Searching past trajectories for precedents...',
+    'radar_chart': 'Mapping neural-sonic patterns...',
+    'platform_chart': 'Projecting cross-platform distribution...',
+    'demographic_chart': 'Resolving demographic neural resonance...',
+    'recommendations': 'Composing optimization recommendations...',
+    'marketing_metrics': 'Estimating marketing opportunities...',
+    'charts': 'Rendering sensory-enhanced visualization...'
+}
+
+# Number of runs kept in the per-session timing log
+TIMING_LOG_SIZE = 20
+
+class StageProgress:
+    """
+    Progress display driven by the real pipeline stages.
+
+    Args:
+        timer (StageTimer): Timer that records the stage durations
+        placeholder: Streamlit placeholder used for the completed-stage list
+    """
+
+    def __init__(self, timer, placeholder):
+        self.timer = timer
+        self.placeholder = placeholder
+        self.skipped = []
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Show a spinner while the stage runs, then list its measured duration.
+        """
+        with st.spinner(STAGE_MESSAGES.get(name, name)):
+            with self.timer.stage(name):
+                yield
+
+        self._render()
+
+    def skip(self, names):
+        """
+        List stages whose inputs did not change and were reused.
+        """
+        self.skipped.extend(names)
+        self._render()
+
+    def _render(self):
+        lines = [
+            f"<p style='font-size:12px;margin:2px 0;'>&#10003; {STAGE_MESSAGES.get(t['stage'], t['stage'])} "
+            f"<span style='color:#BD4DE6;'>{t['seconds'] * 1000:.1f} ms</span></p>"
+            for t in self.timer.timings
+        ]
+        if self.skipped:
+            lines.append(
+                f"<p style='font-size:12px;margin:2px 0;color:#9067ff;'>&#8631; Unchanged, reused: "
+                f"{', '.join(self.skipped)}</p>"
+            )
+        self.placeholder.markdown("".join(lines), unsafe_allow_html=True)
+
+def record_timing_log(timer, skipped=None):
+    """
+    Append the timer's stages to the per-session timing log.
+
+    Args:
+        timer (StageTimer): Timer holding the stages of the current run
+        skipped (list, optional): Stages reused without re-executing
+    """
+    entry = timer.as_log_entry()
+    entry['skipped'] = list(skipped or [])
+
+    log = st.session_state.setdefault('timing_log', [])
+    log.append(entry)
+    del log[:-TIMING_LOG_SIZE]
+
+def render_timing_log():
+    """
+    Render the per-session timing log as a table of stage durations in ms.
+    """
+    log = st.session_state.get('timing_log', [])
+    if not log:
+        return
+
+    rows = []
+    for entry in reversed(log):
+        row = {'run': entry['timestamp']}
+        row.update({t['stage']: round(t['seconds'] * 1000, 1) for t in entry['stages']})
+        row['total'] = round(entry['total_seconds'] * 1000, 1)
+        row['skipped'] = ", ".join(entry.get('skipped', []))
+        rows.append(row)
+
+    with st.expander("Session Timing Log (ms)"):
+        st.dataframe(pd.DataFrame(rows), use_container_width=True)
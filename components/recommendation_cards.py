@@ -1,18 +1,26 @@
 import streamlit as st
-from modules.recommendation import generate_artist_recommendations, analyze_potential_collaborations
+from modules.recommendation import analyze_potential_collaborations
+from utils.caching import tracked_cache_resource
 
-def render_recommendations(params):
+# Simulated artists searched for collaborators
+CATALOG_SIZE = 250_000
+
+def render_recommendations(params, recommendations=None):
     """
     Render artist recommendations based on analysis.
     
     Args:
         params (dict): Parameters dictionary
+        recommendations (list, optional): Precomputed recommendation strings
     """
     st.markdown("<div class='holographic'>", unsafe_allow_html=True)
     st.subheader("Optimization Recommendations")
     
     # Generate artist recommendations
-    artist_recommendations = generate_artist_recommendations(params)
+    artist_recommendations = recommendations
+    if artist_recommendations is None:
+        from components.pipeline_cache import cached_recommendations
+        artist_recommendations = cached_recommendations(params)
     
     # Display recommendations as numbered list
     for i, rec in enumerate(artist_recommendations):
@@ -20,40 +28,65 @@ def render_recommendations(params):
     
     st.markdown("</div>", unsafe_allow_html=True)
 
+@tracked_cache_resource('collaborator_index')
+def get_collaborator_index():
+    """
+    Build the simulated artist catalog and its collaborator index once per server process.
+    
+    Returns:
+        tuple: (catalog indexed by artist_id, CollaboratorIndex)
+    """
+    from modules.collaborator_index import COLLABORATOR_ROLES, build_collaborator_index
+    from utils.data_simulation import generate_artist_catalog
+    
+    catalog = generate_artist_catalog(CATALOG_SIZE, COLLABORATOR_ROLES, seed=0)
+    index = build_collaborator_index(catalog)
+    return catalog.set_index('artist_id'), index
+
 def render_collaboration_suggestions(params):
     """
     Render collaboration suggestions for artists.
     
+    For each suggested collaborator type, shows the catalog artist of that
+    type whose audio profile is nearest to the current parameters.
+    
     Args:
         params (dict): Parameters dictionary
     """
+    from modules.collaborator_index import artist_vectors
+    
     st.markdown("<div class='rotating-border'>", unsafe_allow_html=True)
     st.subheader("Potential Neural Collaborations")
     
     # Get collaboration suggestions
     collaborations = analyze_potential_collaborations(params)
+    catalog, index = get_collaborator_index()
+    vector = artist_vectors([params])[0]
     
-    # Display collaborations
+    # Display the closest artist of each suggested type
     cols = st.columns(len(collaborations))
-    for i, col in enumerate(cols):
+    for role, col in zip(collaborations, cols):
+        match = index.query(vector, k=1, role=role)[0]
         with col:
             st.markdown(f"""
             <div class='metric-card' style='text-align:center;'>
-                <h3 style='font-size:18px;'>{collaborations[i]}</h3>
-                <p style='font-size:14px;margin-top:10px;'>Resonance Match: {int(80 + i * 3)}%</p>
+                <h3 style='font-size:18px;'>{catalog.at[match['artist_id'], 'name']}</h3>
+                <p style='font-size:14px;color:#9067ff;margin:5px 0;'>{role}</p>
+                <p style='font-size:14px;margin-top:10px;'>Resonance Match: {match['match']:.0f}%</p>
             </div>
             """, unsafe_allow_html=True)
     
     st.markdown("</div>", unsafe_allow_html=True)
 
-def render_case_studies():
-    """
-    Render case studies of successful trend predictions.
+@tracked_cache_resource('case_studies')
+def get_case_studies():
     """
-    st.markdown("<div class='holographic' style='margin-top:30px;'>", unsafe_allow_html=True)
-    st.header("Success Stories")
+    Get the static case-study content shown on the landing page.
     
-    case_studies = [
+    Returns:
+        list: List of case study dictionaries
+    """
+    return [
         {
             "artist": "Neural Nexus",
             "genre": "Quantum Trap",
@@ -73,6 +106,15 @@ def render_case_studies():
             "prediction": "SonicSeer identified optimal emotional resonance parameters"
         }
     ]
+
+def render_case_studies():
+    """
+    Render case studies of successful trend predictions.
+    """
+    st.markdown("<div class='holographic' style='margin-top:30px;'>", unsafe_allow_html=True)
+    st.header("Success Stories")
+    
+    case_studies = get_case_studies()
     
     cols = st.columns(3)
     for i, col in enumerate(cols):
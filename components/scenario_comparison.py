@@ -0,0 +1,151 @@
+import json
+import streamlit as st
+import pandas as pd
+from concurrent.futures.process import BrokenProcessPool
+from modules.parameters import PARAM_DEFAULTS, validate_params
+from modules.scenarios import MIN_SCENARIOS, MAX_SCENARIOS, create_scenario_pool, run_scenarios
+from modules.visualization import create_scenario_comparison_chart
+from utils.caching import tracked_cache_resource
+
+@tracked_cache_resource('scenario_pool')
+def get_scenario_pool():
+    """
+    Get the worker pool shared by all scenario comparisons on this server.
+
+    Returns:
+        ProcessPoolExecutor: Process pool sized for the largest comparison
+    """
+    return create_scenario_pool()
+
+def _scenario_from_params(params, name):
+    # Sidebar params also carry UI flags (button, checkboxes) outside the schema
+    return {'name': name, 'params': validate_params({key: params[key] for key in PARAM_DEFAULTS if key in params})}
+
+def _load_scenario_set(uploaded_file):
+    """
+    Parse an uploaded JSON list of parameter sets.
+
+    Each item is a parameter dictionary following the sidebar schema, with an
+    optional 'name' key.
+    """
+    items = json.load(uploaded_file)
+    if not isinstance(items, list):
+        raise ValueError("Scenario file must contain a JSON list of parameter sets")
+
+    scenarios = []
+    for i, item in enumerate(items[:MAX_SCENARIOS]):
+        item = dict(item)
+        name = item.pop('name', f"Scenario {i + 1}")
+        scenarios.append({'name': name, 'params': validate_params(item)})
+    return scenarios, len(items) > MAX_SCENARIOS
+
+def render_scenario_comparison(params):
+    """
+    Render the scenario comparison mode: build a set of scenarios, run them
+    in parallel and compare their trajectories and metrics.
+
+    Args:
+        params (dict): Current sidebar parameters
+    """
+    queue = st.session_state.setdefault('scenarios', [])
+
+    st.markdown("<div class='rotating-border'>", unsafe_allow_html=True)
+    st.header("Release Scenario Comparison")
+    st.markdown(
+        f"Queue {MIN_SCENARIOS}-{MAX_SCENARIOS} parameter sets from the sidebar or a JSON file, "
+        "then run them side by side."
+    )
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if st.button("Add current parameters", disabled=len(queue) >= MAX_SCENARIOS):
+            queue.append(_scenario_from_params(params, f"Scenario {len(queue) + 1}"))
+
+    with col2:
+        if st.button("Clear scenarios"):
+            queue.clear()
+            st.session_state.pop('scenario_results', None)
+
+    with col3:
+        uploaded = st.file_uploader("Load scenario set (JSON)", type=['json'])
+
+    # Load each uploaded file once, not on every rerun
+    if uploaded is not None and st.session_state.get('scenario_upload') != (uploaded.name, uploaded.size):
+        st.session_state['scenario_upload'] = (uploaded.name, uploaded.size)
+        try:
+            scenarios, truncated = _load_scenario_set(uploaded)
+            queue[:] = scenarios
+            if truncated:
+                st.warning(f"Only the first {MAX_SCENARIOS} scenarios were loaded")
+        except (ValueError, TypeError) as e:
+            st.error(f"Invalid scenario file: {e}")
+
+    if queue:
+        st.dataframe(pd.DataFrame([
+            {
+                'scenario': scenario['name'],
+                'genre': scenario['params']['genre'],
+                'tempo': scenario['params']['tempo'],
+                'regions': ", ".join(scenario['params']['regions']),
+                'model': scenario['params']['model_selection'],
+                'forecast_days': scenario['params']['forecast_days'],
+                'forecast_method': scenario['params']['forecast_method']
+            }
+            for scenario in queue
+        ]).set_index('scenario'), use_container_width=True)
+
+    if st.button("Run comparison", disabled=len(queue) < MIN_SCENARIOS):
+        with st.spinner(f"Running {len(queue)} scenarios in parallel..."):
+            try:
+                results = run_scenarios([scenario['params'] for scenario in queue], executor=get_scenario_pool())
+            except BrokenProcessPool:
+                get_scenario_pool.clear()
+                results = run_scenarios([scenario['params'] for scenario in queue], executor=get_scenario_pool())
+        st.session_state['scenario_results'] = {'names': [scenario['name'] for scenario in queue], **results}
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    results = st.session_state.get('scenario_results')
+    if results:
+        render_scenario_results(results)
+
+def render_scenario_results(results):
+    """
+    Render overlaid trajectories and a metrics table for compared scenarios.
+
+    Args:
+        results (dict): Output of run_scenarios with the scenario names added
+    """
+    scenarios = results['scenarios']
+    names = results['names']
+
+    st.markdown("<div class='holographic'>", unsafe_allow_html=True)
+
+    fig = create_scenario_comparison_chart(scenarios, names)
+    st.plotly_chart(fig, use_container_width=True)
+
+    table = pd.DataFrame([
+        {
+            'scenario': name,
+            'tempo': scenario['params']['tempo'],
+            'regions': ", ".join(scenario['params']['regions']),
+            'model': scenario['params']['model_selection'],
+            'virality_score': round(scenario['metrics']['virality_score'], 1),
+            'peak_day': scenario['metrics']['peak_day'],
+            'peak_engagement': int(scenario['metrics']['peak_engagement']),
+            'total_engagement': int(scenario['metrics']['total_engagement']),
+            'trend_duration': scenario['metrics']['trend_duration'],
+            'runtime_ms': round(scenario['seconds'] * 1000, 1)
+        }
+        for name, scenario in zip(names, scenarios)
+    ]).set_index('scenario')
+    st.dataframe(table, use_container_width=True)
+
+    st.caption(
+        f"Wall time {results['wall_seconds'] * 1000:.0f} ms for {len(scenarios)} scenarios "
+        f"(sequential work {results['scenario_seconds'] * 1000:.0f} ms, slowest scenario "
+        f"{max(scenario['seconds'] for scenario in scenarios) * 1000:.0f} ms)"
+    )
+
+    st.markdown("</div>", unsafe_allow_html=True)
@@ -1,4 +1,9 @@
 import streamlit as st
+from modules.parameters import GENRES, REGIONS, PREDICTION_MODELS, FORECAST_METHODS, PARAM_RANGES, PARAM_DEFAULTS
+
+def _slider(label, name):
+    low, high = PARAM_RANGES[name]
+    return st.slider(label, low, high, PARAM_DEFAULTS[name])
 
 def render_sidebar():
     """
@@ -17,45 +22,20 @@ def render_sidebar():
         st.subheader("Trend Parameters")
         
         # Genre selection
-        params['genre'] = st.selectbox(
-            "Base Music Genre",
-            [
-                "Synth-Neural Pop", 
-                "Quantum Trap", 
-                "NeuroWave", 
-                "Holographic Folk", 
-                "Bio-Electronic", 
-                "Orbital Ambient",
-                "Virtual Reality Metal",
-                "AI-Generated Classical",
-                "Memory-Infused Jazz",
-                "Biofeedback House"
-            ]
-        )
+        params['genre'] = st.selectbox("Base Music Genre", GENRES)
         
         # Target markets
         params['regions'] = st.multiselect(
             "Target Neural-Markets",
-            [
-                "Global Neural Network", 
-                "North American Consciousness", 
-                "European Thought-Sphere", 
-                "Asian Collective",
-                "African Harmony Nexus",
-                "South American Flow", 
-                "Oceanic Dream Web",
-                "Lunar Colony Network",
-                "Mars Outpost Stream",
-                "Orbital Habitat Collective"
-            ],
-            default=["Global Neural Network"]
+            REGIONS,
+            default=PARAM_DEFAULTS['regions']
         )
         
         # Audio parameters
-        params['tempo'] = st.slider("Quantum Rhythm Frequency (BPM)", 60, 200, 120)
-        params['emotional_intensity'] = st.slider("Emotional Resonance Factor", 1, 10, 7)
-        params['neural_connection'] = st.slider("Neural Connection Strength", 0.0, 1.0, 0.8)
-        params['synthetic_vocal_pct'] = st.slider("Synthetic Vocal Integration (%)", 0, 100, 40)
+        params['tempo'] = _slider("Quantum Rhythm Frequency (BPM)", 'tempo')
+        params['emotional_intensity'] = _slider("Emotional Resonance Factor", 'emotional_intensity')
+        params['neural_connection'] = _slider("Neural Connection Strength", 'neural_connection')
+        params['synthetic_vocal_pct'] = _slider("Synthetic Vocal Integration (%)", 'synthetic_vocal_pct')
         
         st.markdown("</div>", unsafe_allow_html=True)
         
@@ -63,11 +43,11 @@ def render_sidebar():
         st.markdown("<div class='holographic'>", unsafe_allow_html=True)
         st.subheader("Advanced Quantum Parameters")
         
-        params['meme_potential'] = st.slider("Meme Potential Score", 0.0, 1.0, 0.7)
-        params['algorithmic_boost'] = st.slider("Platform Algorithm Boost Factor", 1, 10, 7)
-        params['novelty_factor'] = st.slider("Novelty Vector Magnitude", 0.0, 1.0, 0.6)
-        params['cultural_resonance'] = st.slider("Cultural Wavelength Resonance", 0.0, 1.0, 0.75)
-        params['celebrity_influence'] = st.slider("Celebrity Neural-Network Influence", 0.0, 1.0, 0.5)
+        params['meme_potential'] = _slider("Meme Potential Score", 'meme_potential')
+        params['algorithmic_boost'] = _slider("Platform Algorithm Boost Factor", 'algorithmic_boost')
+        params['novelty_factor'] = _slider("Novelty Vector Magnitude", 'novelty_factor')
+        params['cultural_resonance'] = _slider("Cultural Wavelength Resonance", 'cultural_resonance')
+        params['celebrity_influence'] = _slider("Celebrity Neural-Network Influence", 'celebrity_influence')
         
         st.markdown("</div>", unsafe_allow_html=True)
         
@@ -75,22 +55,20 @@ def render_sidebar():
         st.markdown("<div class='rotating-border'>", unsafe_allow_html=True)
         st.subheader("Cognitive-Enhanced AI Model")
         
-        params['model_selection'] = st.radio(
-            "Prediction Algorithm",
-            [
-                "Quantum Neural Network (QNN)",
-                "Consciousness-Graph Analysis",
-                "Temporal Wavefront Predictor",
-                "Neural-Memetic Diffusion",
-                "Bio-Rhythmic Pattern Matcher"
-            ]
-        )
+        params['model_selection'] = st.radio("Prediction Algorithm", PREDICTION_MODELS)
         st.markdown("</div>", unsafe_allow_html=True)
         
         # Forecast horizon
-        params['forecast_days'] = st.slider("Forecast Horizon (days)", 1, 60, 14)
+        params['forecast_days'] = _slider("Forecast Horizon (days)", 'forecast_days')
+        params['forecast_method'] = st.selectbox("Forecast Engine", FORECAST_METHODS)
+        
+        # Demo pacing pads each pipeline stage for presentations
+        params['demo_pacing'] = st.checkbox("Demo pacing", value=False)
+        
+        # Scenario comparison replaces the single prediction view
+        params['comparison_mode'] = st.checkbox("Scenario comparison mode", value=False)
         
         # Process button
         params['process_btn'] = st.button("Generate Quantum Prediction")
         
-        return params
\ No newline at end of file
+        return params
@@ -1,9 +1,18 @@
 import streamlit as st
-import time
-from modules.visualization import create_trend_chart, create_radar_chart, create_platform_distribution_chart
-from utils.data_simulation import generate_platform_distribution
+from components.pipeline_cache import (
+    cached_trend_chart,
+    cached_similar_trajectories_chart,
+    cached_regional_chart,
+    current_trending_leaderboard,
+    cached_platform_chart,
+    cached_demographic_chart,
+    cached_segment_chart
+)
 
-def render_trend_chart(trend_data, genre, metrics):
+# Views of the demographic donut: the formula's age groups or the learned segments
+AUDIENCE_VIEWS = ["Age groups", "Learned segments"]
+
+def render_trend_chart(trend_data, genre, metrics, fig=None):
     """
     Render the main trend chart visualization.
     
@@ -11,29 +20,130 @@ def render_trend_chart(trend_data, genre, metrics):
         trend_data (pd.DataFrame): DataFrame with trend data
         genre (str): Music genre
         metrics (dict): Metrics dictionary
+        fig (plotly.graph_objects.Figure, optional): Prebuilt trend chart
     """
-    # Show processing animations for futuristic feel
-    with st.spinner('Initializing quantum neural pathways...'):
-        time.sleep(1.5)
-    with st.spinner('Analyzing memetic resonance patterns...'):
-        time.sleep(2)
-    with st.spinner('Calculating cross-platform harmonic frequencies...'):
-        time.sleep(1.5)
-    with st.spinner('Integrating neural-collective consciousness data...'):
-        time.sleep(2)
-    with st.spinner('Generating sensory-enhanced visualization...'):
-        time.sleep(1)
-    
     # Create container for trend chart
     st.markdown("<div class='rotating-border'>", unsafe_allow_html=True)
     st.subheader("Trend Trajectory Forecast")
     
     # Create and display the trend chart
-    fig = create_trend_chart(trend_data, genre, metrics)
+    if fig is None:
+        fig = cached_trend_chart(trend_data, genre, metrics)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+
+def render_similar_trajectories(trend_data, fig=None):
+    """
+    Render past tracks whose engagement history matched the current trend.
+    
+    Args:
+        trend_data (pd.DataFrame): DataFrame with trend data
+        fig (plotly.graph_objects.Figure, optional): Prebuilt similar-trajectories chart
+    """
+    st.markdown("<div class='rotating-border'>", unsafe_allow_html=True)
+    st.subheader("Historical Precedents")
+    
+    if fig is None:
+        fig = cached_similar_trajectories_chart(trend_data)
     st.plotly_chart(fig, use_container_width=True)
+    st.caption("Nearest past tracks by dynamic time warping over the observed days; "
+               "dotted lines show what happened to them next.")
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+
+# Zoom levels of the engagement detail chart, in days
+ZOOM_LEVELS = {"48 hours": 2, "7 days": 7, "30 days": 30}
+
+def render_engagement_detail(feed, track_id):
+    """
+    Render the observed engagement at the resolution that suits the chosen zoom.
+    
+    Args:
+        feed (EngagementPyramid): Bucketed engagement feed of the session
+        track_id: Track of the current trend in the feed
+    """
+    from modules.visualization import create_engagement_detail_chart
+    
+    st.markdown("<div class='rotating-border'>", unsafe_allow_html=True)
+    st.subheader("Engagement Feed")
+    
+    zoom = st.select_slider("Zoom", options=list(ZOOM_LEVELS), value="7 days")
+    resolution, buckets = feed.window(track_id, ZOOM_LEVELS[zoom])
+    st.plotly_chart(create_engagement_detail_chart(buckets, resolution), use_container_width=True)
+    st.caption(f"{len(buckets)} one-{resolution} buckets, read from the feed's pre-aggregated "
+               "hour/day/week pyramid.")
     
     st.markdown("</div>", unsafe_allow_html=True)
+
+def render_regional_engagement(params):
+    """
+    Render daily engagement of the genre in the selected target neural-markets.
     
+    Args:
+        params (dict): Parameters dictionary from the sidebar
+    """
+    st.markdown("<div class='rotating-border'>", unsafe_allow_html=True)
+    st.subheader("Target Neural-Market Engagement")
+    
+    if params['regions']:
+        fig, share = cached_regional_chart(params)
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption(f"The selected markets account for {share:.1%} of {params['genre']} engagement "
+                   "over the period shown.")
+    else:
+        st.info("Select at least one target neural-market in the sidebar.")
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+
+# Tracks listed on the trending leaderboard
+TRENDING_TOP_K = 10
+
+def render_trending_leaderboard(params):
+    """
+    Render the fastest-rising tracks of the genre or of all genres, per market.
+    
+    Args:
+        params (dict): Parameters dictionary from the sidebar
+    """
+    import pandas as pd
+    from modules.engagement_cube import GLOBAL_REGION
+    
+    st.markdown("<div class='rotating-border'>", unsafe_allow_html=True)
+    st.subheader("Trending Now")
+    
+    leaderboard = current_trending_leaderboard()
+    col1, col2 = st.columns(2)
+    with col1:
+        genre = st.selectbox("Leaderboard genre", [params['genre'], "All genres"])
+    with col2:
+        markets = [GLOBAL_REGION] + [region for region in params['regions'] if region != GLOBAL_REGION]
+        region = st.selectbox("Leaderboard market", markets)
+    
+    top = leaderboard.top(TRENDING_TOP_K, genre=None if genre == "All genres" else genre, region=region)
+    table = pd.DataFrame([{
+        'Track': entry['track_id'],
+        'Genre': entry['genre'],
+        'Market': entry['region'],
+        'Momentum': f"{entry['momentum']:+.0%}",
+        'Mean daily growth': f"{entry['mean_growth']:+.1%}",
+        'Score': round(entry['score'], 3)
+    } for entry in top], index=pd.RangeIndex(1, len(top) + 1, name='Rank'))
+    st.dataframe(table, use_container_width=True)
+    st.caption(f"Ranked by momentum plus mean daily growth over the last week across {len(leaderboard):,} "
+               f"tracks, through {leaderboard.end}; {leaderboard.updates:,} engagement updates applied so far.")
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+
+def render_platform_analysis(metrics, platform_fig=None, demographic_fig=None):
+    """
+    Render the cross-platform distribution and demographic appeal charts.
+    
+    Args:
+        metrics (dict): Metrics dictionary including the song parameters
+        platform_fig (plotly.graph_objects.Figure, optional): Prebuilt platform chart
+        demographic_fig (plotly.graph_objects.Figure, optional): Prebuilt demographic chart
+    """
     # Create container for additional visualizations
     st.markdown("<div class='rotating-border'>", unsafe_allow_html=True)
     st.header("Cross-Platform Neural Virality Prediction")
@@ -42,58 +152,18 @@ def render_trend_chart(trend_data, genre, metrics):
     col1, col2 = st.columns(2)
     
     with col1:
-        # Generate and display platform distribution
-        platforms = generate_platform_distribution(
-            meme_potential=metrics.get('meme_potential', 0.7),
-            neural_connection=metrics.get('neural_connection', 0.8),
-            cultural_resonance=metrics.get('cultural_resonance', 0.75),
-            tempo=metrics.get('tempo', 120),
-            synthetic_vocal_pct=metrics.get('synthetic_vocal_pct', 50),
-            celebrity_influence=metrics.get('celebrity_influence', 0.5),
-            emotional_intensity=metrics.get('emotional_intensity', 7),
-            novelty_factor=metrics.get('novelty_factor', 0.6)
-        )
-        
-        platform_fig = create_platform_distribution_chart(platforms)
+        # Display platform distribution
+        if platform_fig is None:
+            platform_fig = cached_platform_chart(metrics)
         st.plotly_chart(platform_fig, use_container_width=True)
     
     with col2:
-        # Generate and display demographic appeal
-        from utils.metrics_calculation import calculate_demographic_appeal
-        
-        demographics = calculate_demographic_appeal(
-            novelty_factor=metrics.get('novelty_factor', 0.6),
-            meme_potential=metrics.get('meme_potential', 0.7),
-            tempo=metrics.get('tempo', 120),
-            neural_connection=metrics.get('neural_connection', 0.8),
-            cultural_resonance=metrics.get('cultural_resonance', 0.75),
-            emotional_intensity=metrics.get('emotional_intensity', 7),
-            celebrity_influence=metrics.get('celebrity_influence', 0.5)
-        )
-        
-        # Create demographic donut chart
-        import plotly.graph_objects as go
-        
-        fig = go.Figure(data=[go.Pie(
-            labels=list(demographics.keys()),
-            values=list(demographics.values()),
-            hole=.5,
-            marker=dict(
-                colors=['#BD4DE6', '#9067ff', '#6e45e2', '#4527a0', '#311b92'],
-                line=dict(color='#000000', width=1)
-            ),
-            textfont=dict(color='white'),
-            textinfo='label+percent'
-        )])
-        
-        fig.update_layout(
-            title="Demographic Neural Resonance",
-            plot_bgcolor='rgba(10, 10, 26, 0)',
-            paper_bgcolor='rgba(10, 10, 26, 0)',
-            font_color='#e0e0ff',
-            showlegend=False,
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        # Display demographic appeal
+        audience_view = st.radio("Audience view", AUDIENCE_VIEWS, horizontal=True)
+        if audience_view == "Learned segments":
+            demographic_fig = cached_segment_chart(metrics)
+        elif demographic_fig is None:
+            demographic_fig = cached_demographic_chart(metrics)
+        st.plotly_chart(demographic_fig, use_container_width=True)
     
-    st.markdown("</div>", unsafe_allow_html=True)
\ No newline at end of file
+    st.markdown("</div>", unsafe_allow_html=True)
@@ -1,12 +1,29 @@
 # This file makes the models directory a Python package
-# Import key functions to make them available at the package level
+# Key functions are exported at the package level but imported on first access,
+# so importing the package does not pull in heavy dependencies like scikit-learn
 
-from .model_loader import load_model, save_model
-from .feature_engineering import extract_advanced_features, create_feature_matrix
+import importlib
 
-__all__ = [
-    'load_model',
-    'save_model',
-    'extract_advanced_features',
-    'create_feature_matrix'
-]
\ No newline at end of file
+_EXPORTS = {
+    'load_model': '.model_loader',
+    'save_model': '.model_loader',
+    'extract_advanced_features': '.feature_engineering',
+    'create_feature_matrix': '.feature_engineering',
+    'extract_feature_record': '.feature_engineering',
+    'FeatureRecord': '.feature_schema',
+    'FEATURE_COLUMNS': '.feature_schema',
+    'build_feature_matrix': '.feature_schema',
+    'interaction_terms': '.interaction_features',
+    'build_interactions': '.interaction_features',
+    'RunningScaler': '.feature_scaler',
+    'load_scaler': '.feature_scaler',
+    'update_scaler': '.feature_scaler'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,53 +1,54 @@
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler
 
-def extract_advanced_features(trend_data, audio_params=None):
+from models.feature_schema import (
+    AUDIO_FEATURES,
+    FeatureRecord,
+    allocate_features,
+    audio_features_into,
+    trend_features_into
+)
+from models.interaction_features import build_interactions, interaction_names, interaction_terms
+
+def extract_feature_record(trend_data, audio_params=None):
     """
-    Extract advanced features from trend data and audio parameters.
+    Extract the feature vector of one track as a compact record.
     
     Args:
         trend_data (pd.DataFrame): DataFrame with trend data
-        audio_params (dict, optional): Dictionary of audio parameters
+        audio_params (dict, optional): Dictionary of audio parameters; parameters
+            outside the feature schema are ignored
         
     Returns:
-        pd.DataFrame: DataFrame with engineered features
+        FeatureRecord: Features in FEATURE_COLUMNS order
     """
     if trend_data.empty:
         raise ValueError("Trend data is empty")
     
-    features = pd.DataFrame()
+    row = allocate_features(1)
     
     # Time series features from trend data
     if 'engagement' in trend_data.columns:
-        # Basic trend metrics
-        features['recent_engagement'] = [trend_data['engagement'].values[-1]]
-        features['max_engagement'] = [trend_data['engagement'].max()]
-        features['engagement_growth_pct'] = [(trend_data['engagement'].values[-1] / trend_data['engagement'].values[0]) - 1 
-                                             if trend_data['engagement'].values[0] > 0 else 0]
-        
-        # Calculate trend stability (inverse of volatility)
-        if len(trend_data) >= 7:
-            volatility = trend_data['engagement'].rolling(window=7).std().mean() / trend_data['engagement'].mean()
-            features['trend_stability'] = [1 - min(volatility, 1)]
-        else:
-            features['trend_stability'] = [0.5]  # Default for short series
+        trend_features_into(row, trend_data['engagement'].to_numpy().reshape(1, -1))
     
     # Add audio parameters if provided
     if audio_params:
-        for param_name, param_value in audio_params.items():
-            # Convert percentage values to 0-1 range
-            if param_name in ['tempo']:
-                # Normalize tempo to 0-1 range (assuming 60-180 bpm range)
-                features[param_name] = [(param_value - 60) / 120 if 60 <= param_value <= 180 else 0.5]
-            elif param_name in ['emotional_intensity', 'algorithmic_boost']:
-                # Convert 1-10 scale to 0-1
-                features[param_name] = [param_value / 10]
-            else:
-                # Assume other parameters are already in 0-1 range
-                features[param_name] = [param_value]
+        audio_features_into(row, [audio_params])
     
-    return features
+    return FeatureRecord.from_array(row[0])
+
+def extract_advanced_features(trend_data, audio_params=None):
+    """
+    Extract advanced features from trend data and audio parameters.
+    
+    Args:
+        trend_data (pd.DataFrame): DataFrame with trend data
+        audio_params (dict, optional): Dictionary of audio parameters
+        
+    Returns:
+        pd.DataFrame: One-row DataFrame with engineered features in FEATURE_COLUMNS order
+    """
+    return extract_feature_record(trend_data, audio_params).to_frame()
 
 def create_feature_matrix(trend_features, audio_features):
     """
@@ -68,46 +69,44 @@ def create_feature_matrix(trend_features, audio_features):
     
     return combined
 
-def normalize_features(features):
+def normalize_features(features, scaler=None, model_path='models/trained/virality_predictor.pkl'):
     """
-    Normalize features for model input.
+    Normalize features for model input with the scaler stored next to the model.
     
     Args:
         features (pd.DataFrame): Feature matrix
+        scaler (RunningScaler, optional): Preloaded scaler; skips loading from model_path
+        model_path (str): Path to the model whose scaler is applied
         
     Returns:
         np.ndarray: Normalized features
     """
-    scaler = StandardScaler()
-    normalized = scaler.fit_transform(features)
+    if scaler is None:
+        from models.feature_scaler import load_scaler
+        scaler = load_scaler(model_path)
     
-    return normalized
+    return scaler.transform(features)
 
-def create_interaction_features(features):
+def create_interaction_features(features, degree=2, whitelist=None):
     """
     Create interaction features to capture relationships between variables.
     
     Args:
         features (pd.DataFrame): Original feature matrix
+        degree (int): Highest interaction order; 2 gives pairs, 3 adds triples
+        whitelist (iterable, optional): Columns to interact; defaults to the
+            audio parameters present in features
         
     Returns:
         pd.DataFrame: Feature matrix with interaction terms
     """
-    # Create a copy to avoid modifying the original
-    enhanced = features.copy()
-    
-    # Define pairs of features to interact
-    interaction_pairs = [
-        ('emotional_intensity', 'neural_connection'),
-        ('meme_potential', 'novelty_factor'),
-        ('tempo', 'emotional_intensity'),
-        ('neural_connection', 'meme_potential')
-    ]
+    if whitelist is None:
+        whitelist = [name for name in AUDIO_FEATURES if name in features.columns]
     
-    # Create interaction terms
-    for feat1, feat2 in interaction_pairs:
-        if feat1 in features.columns and feat2 in features.columns:
-            interaction_name = f"{feat1}_x_{feat2}"
-            enhanced[interaction_name] = features[feat1] * features[feat2]
+    terms = interaction_terms(features.columns, degree, whitelist)
+    interactions = build_interactions(features.to_numpy(dtype=np.float64), terms, dtype=np.float64)
     
-    return enhanced
\ No newline at end of file
+    return pd.concat([
+        features,
+        pd.DataFrame(interactions, columns=interaction_names(terms, features.columns), index=features.index)
+    ], axis=1)
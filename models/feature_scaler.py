@@ -0,0 +1,180 @@
+import hashlib
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+class RunningScaler:
+    """
+    Standardize features with a running mean and variance.
+
+    Statistics are merged batch by batch (Chan et al.'s parallel update), so
+    the scaler can be updated from streaming data without keeping or
+    refitting on past samples. The transform matches sklearn's
+    StandardScaler fitted on all samples seen so far.
+    """
+    def __init__(self, feature_names=None, model_version=None):
+        self.feature_names = list(feature_names) if feature_names is not None else None
+        self.model_version = model_version
+        self.n_samples_seen = 0
+        self.mean = None
+        self.var = None
+
+    def _as_array(self, features):
+        if isinstance(features, pd.DataFrame):
+            if self.feature_names is None:
+                self.feature_names = list(features.columns)
+            features = features[self.feature_names].to_numpy(dtype=np.float64)
+        features = np.asarray(features, dtype=np.float64)
+        return features.reshape(1, -1) if features.ndim == 1 else features
+
+    def partial_fit(self, features):
+        """
+        Update the running statistics with a batch of samples.
+
+        Args:
+            features (pd.DataFrame or np.ndarray): Samples, one per row
+
+        Returns:
+            RunningScaler: self
+        """
+        batch = self._as_array(features)
+        batch = batch[np.isfinite(batch).all(axis=1)]
+        if len(batch) == 0:
+            return self
+
+        batch_count = len(batch)
+        batch_mean = batch.mean(axis=0)
+        batch_var = batch.var(axis=0)
+
+        if self.n_samples_seen == 0:
+            self.mean, self.var = batch_mean, batch_var
+        else:
+            total = self.n_samples_seen + batch_count
+            delta = batch_mean - self.mean
+            m2 = (self.var * self.n_samples_seen + batch_var * batch_count
+                  + delta ** 2 * self.n_samples_seen * batch_count / total)
+            self.mean = self.mean + delta * batch_count / total
+            self.var = m2 / total
+
+        self.n_samples_seen += batch_count
+        return self
+
+    @property
+    def scale(self):
+        if self.var is None:
+            return None
+        scale = np.sqrt(self.var)
+        # Constant features are centred but not scaled, as in StandardScaler
+        scale[scale == 0] = 1.0
+        return scale
+
+    def transform(self, features):
+        """
+        Standardize features with the current statistics.
+
+        An unfitted scaler returns the features unchanged rather than
+        fitting on the input, so single rows keep their values.
+
+        Args:
+            features (pd.DataFrame or np.ndarray): Samples, one per row
+
+        Returns:
+            np.ndarray: Standardized features
+        """
+        values = self._as_array(features)
+        if self.n_samples_seen == 0:
+            return values
+        return (values - self.mean) / self.scale
+
+def scaler_path(model_path):
+    """
+    Get the path of the scaler stored next to a model file.
+
+    Args:
+        model_path (str): Path to the model file
+
+    Returns:
+        str: Path to the scaler file
+    """
+    return f"{os.path.splitext(model_path)[0]}.scaler.pkl"
+
+def model_version(model_path):
+    """
+    Identify a model by a hash of its file contents.
+
+    Args:
+        model_path (str): Path to the model file
+
+    Returns:
+        str: Short content hash, or 'untrained' if the file is missing or empty
+    """
+    try:
+        with open(model_path, 'rb') as f:
+            content = f.read()
+    except FileNotFoundError:
+        content = b''
+    return hashlib.sha256(content).hexdigest()[:12] if content else 'untrained'
+
+def load_scaler(model_path):
+    """
+    Load the scaler belonging to a model.
+
+    A scaler saved for a different version of the model is discarded, so
+    retraining or replacing the model starts fresh statistics.
+
+    Args:
+        model_path (str): Path to the model file
+
+    Returns:
+        RunningScaler: Stored scaler, or an unfitted one for the current model version
+    """
+    version = model_version(model_path)
+    try:
+        with open(scaler_path(model_path), 'rb') as f:
+            scaler = pickle.load(f)
+    except (FileNotFoundError, EOFError):
+        return RunningScaler(model_version=version)
+
+    if scaler.model_version != version:
+        print(f"Scaler for {model_path} was fitted for model version {scaler.model_version}, "
+              f"current version is {version}; starting a new scaler")
+        return RunningScaler(model_version=version)
+    return scaler
+
+def save_scaler(scaler, model_path):
+    """
+    Save a scaler next to its model.
+
+    Args:
+        scaler (RunningScaler): Scaler to save
+        model_path (str): Path to the model file the scaler belongs to
+
+    Returns:
+        str: Path the scaler was written to
+    """
+    path = scaler_path(model_path)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    # Write then rename, so readers never see a partial file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(scaler, f)
+    os.replace(tmp_path, path)
+    return path
+
+def update_scaler(features, model_path):
+    """
+    Update a model's stored scaler with a batch of streaming samples.
+
+    Args:
+        features (pd.DataFrame or np.ndarray): New samples, one per row
+        model_path (str): Path to the model file the scaler belongs to
+
+    Returns:
+        RunningScaler: The updated scaler
+    """
+    scaler = load_scaler(model_path).partial_fit(features)
+    save_scaler(scaler, model_path)
+    return scaler
@@ -0,0 +1,175 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Fixed column order of the model feature vector
+TREND_FEATURES = ('recent_engagement', 'max_engagement', 'engagement_growth_pct', 'trend_stability')
+AUDIO_FEATURES = ('tempo', 'emotional_intensity', 'neural_connection', 'synthetic_vocal_pct', 'meme_potential',
+                  'algorithmic_boost', 'novelty_factor', 'cultural_resonance', 'celebrity_influence')
+FEATURE_COLUMNS = TREND_FEATURES + AUDIO_FEATURES
+
+# Listener vectors for audience segmentation: age and listening behaviour, then
+# the listener's preferred value of each audio parameter the demographic chart
+# reads, on the 0-1 scale of normalize_audio_column
+LISTENER_BEHAVIOUR = ('age', 'daily_sessions', 'skip_rate', 'share_rate')
+LISTENER_AFFINITIES = ('novelty_factor', 'meme_potential', 'tempo', 'neural_connection', 'cultural_resonance',
+                       'emotional_intensity', 'celebrity_influence')
+LISTENER_FEATURES = LISTENER_BEHAVIOUR + LISTENER_AFFINITIES
+
+FEATURE_DTYPE = np.float32
+
+# Bump when a feature's calculation changes so stored feature rows are recomputed
+FEATURE_VERSION = 1
+
+# Audio parameters on a 1-10 scale, converted to 0-1
+TEN_POINT_FEATURES = ('emotional_intensity', 'algorithmic_boost')
+
+# Rolling window for trend stability, and the value used for shorter series
+STABILITY_WINDOW = 7
+DEFAULT_STABILITY = 0.5
+
+# Tracks processed per vectorized block, bounding the rolling-window temporaries
+BLOCK_SIZE = 65536
+
+class FeatureRecord:
+    """
+    Feature vector of a single track, in FEATURE_COLUMNS order.
+
+    Uses __slots__ so a record is a fixed set of floats rather than a
+    per-instance dict or a one-row DataFrame.
+    """
+    __slots__ = FEATURE_COLUMNS
+
+    def __init__(self, **values):
+        for name in FEATURE_COLUMNS:
+            setattr(self, name, float(values.get(name, 0.0)))
+
+    @classmethod
+    def from_array(cls, row):
+        record = cls.__new__(cls)
+        for name, value in zip(FEATURE_COLUMNS, row):
+            setattr(record, name, float(value))
+        return record
+
+    def to_array(self):
+        return np.array([getattr(self, name) for name in FEATURE_COLUMNS], dtype=FEATURE_DTYPE)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in FEATURE_COLUMNS}
+
+    def to_frame(self):
+        import pandas as pd
+        return pd.DataFrame([self.to_array()], columns=list(FEATURE_COLUMNS))
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name):.4g}" for name in FEATURE_COLUMNS)
+        return f"FeatureRecord({values})"
+
+def allocate_features(n_tracks):
+    """
+    Preallocate a feature matrix for n_tracks tracks.
+
+    Args:
+        n_tracks (int): Number of rows
+
+    Returns:
+        np.ndarray: Zero-filled (n_tracks, len(FEATURE_COLUMNS)) float32 array
+    """
+    return np.zeros((n_tracks, len(FEATURE_COLUMNS)), dtype=FEATURE_DTYPE)
+
+def trend_features_into(out, engagement):
+    """
+    Write trend features for a block of equal-length engagement series.
+
+    Args:
+        out (np.ndarray): Destination rows of a feature matrix
+        engagement (np.ndarray): (n_tracks, n_days) engagement values
+    """
+    engagement = np.asarray(engagement, dtype=np.float64)
+    first, last = engagement[:, 0], engagement[:, -1]
+
+    out[:, 0] = last
+    out[:, 1] = engagement.max(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[:, 2] = np.where(first > 0, last / np.where(first > 0, first, 1) - 1, 0)
+
+    if engagement.shape[1] >= STABILITY_WINDOW:
+        windows = sliding_window_view(engagement, STABILITY_WINDOW, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volatility = windows.std(axis=2, ddof=1).mean(axis=1) / engagement.mean(axis=1)
+        out[:, 3] = 1 - np.minimum(volatility, 1)
+    else:
+        out[:, 3] = DEFAULT_STABILITY
+
+def normalize_audio_column(name, column):
+    """
+    Normalize the raw values of one audio parameter as the feature schema does.
+
+    Tempo is mapped from 60-180 bpm to 0-1 (0.5 outside that range), 1-10
+    scale parameters are divided by 10, and the rest are taken as given.
+
+    Args:
+        name (str): Audio parameter name from AUDIO_FEATURES
+        column (np.ndarray): Raw parameter values
+
+    Returns:
+        np.ndarray: Normalized float64 values
+    """
+    column = np.asarray(column, dtype=np.float64)
+    if name == 'tempo':
+        return np.where((column >= 60) & (column <= 180), (column - 60) / 120, 0.5)
+    if name in TEN_POINT_FEATURES:
+        return column / 10
+    return column
+
+def audio_features_into(out, audio_params):
+    """
+    Write normalized audio features for a block of tracks.
+
+    Values are normalized with normalize_audio_column. Missing parameters are 0.
+
+    Args:
+        out (np.ndarray): Destination rows of a feature matrix
+        audio_params (list): Parameter dictionaries, one per row of out
+    """
+    offset = len(TREND_FEATURES)
+    for j, name in enumerate(AUDIO_FEATURES):
+        column = np.fromiter((params.get(name, 0.0) for params in audio_params), dtype=np.float64,
+                             count=len(audio_params))
+        column = normalize_audio_column(name, column)
+        if name == 'tempo':
+            # A missing tempo is 0, like any other missing parameter
+            column[[name not in params for params in audio_params]] = 0.0
+        out[:, offset + j] = column
+
+def build_feature_matrix(engagement, audio_params, out=None):
+    """
+    Build the feature matrix for many tracks directly into a 2-D array.
+
+    Args:
+        engagement (np.ndarray or list): (n_tracks, n_days) engagement array,
+            or a list of per-track engagement series of varying length
+        audio_params (list): Audio parameter dictionaries, one per track
+        out (np.ndarray, optional): Preallocated array from allocate_features
+
+    Returns:
+        np.ndarray: (n_tracks, len(FEATURE_COLUMNS)) float32 feature matrix
+    """
+    n_tracks = len(audio_params)
+    if len(engagement) != n_tracks:
+        raise ValueError(f"Got {len(engagement)} engagement series for {n_tracks} parameter sets")
+    if out is None:
+        out = allocate_features(n_tracks)
+
+    if isinstance(engagement, np.ndarray) and engagement.ndim == 2:
+        for start in range(0, n_tracks, BLOCK_SIZE):
+            block = slice(start, start + BLOCK_SIZE)
+            trend_features_into(out[block], engagement[block])
+    else:
+        for i, series in enumerate(engagement):
+            trend_features_into(out[i:i + 1], np.asarray(series).reshape(1, -1))
+
+    for start in range(0, n_tracks, BLOCK_SIZE):
+        block = slice(start, start + BLOCK_SIZE)
+        audio_features_into(out[block], audio_params[block])
+
+    return out
@@ -0,0 +1,100 @@
+from itertools import combinations
+
+import numpy as np
+
+from models.feature_schema import AUDIO_FEATURES, BLOCK_SIZE, FEATURE_COLUMNS
+
+def interaction_terms(columns=FEATURE_COLUMNS, degree=2, whitelist=None):
+    """
+    List the interaction terms of a feature matrix.
+
+    Args:
+        columns (sequence): Column names of the feature matrix
+        degree (int): Highest interaction order; 2 gives pairs, 3 adds triples
+        whitelist (iterable, optional): Columns allowed in interactions;
+            defaults to the audio parameters
+
+    Returns:
+        list: Tuples of column indices, pairs first, each in column order
+
+    Raises:
+        ValueError: If the degree is below 2 or a whitelisted column is unknown
+    """
+    if degree < 2:
+        raise ValueError(f"Interaction degree must be at least 2, got {degree}")
+
+    columns = list(columns)
+    whitelist = AUDIO_FEATURES if whitelist is None else list(whitelist)
+    unknown = [name for name in whitelist if name not in columns]
+    if unknown:
+        raise ValueError(f"Unknown interaction columns: {unknown}")
+
+    indices = sorted({columns.index(name) for name in whitelist})
+    return [term for order in range(2, degree + 1) for term in combinations(indices, order)]
+
+def interaction_names(terms, columns=FEATURE_COLUMNS):
+    """
+    Name interaction terms as 'a_x_b' and 'a_x_b_x_c'.
+
+    Args:
+        terms (list): Index tuples from interaction_terms
+        columns (sequence): Column names of the feature matrix
+
+    Returns:
+        list: Column names of the interaction matrix
+    """
+    return ["_x_".join(columns[i] for i in term) for term in terms]
+
+def build_interactions(features, terms, dtype=np.float32, sparse=False, block_size=BLOCK_SIZE):
+    """
+    Compute interaction terms of a feature matrix, block by block.
+
+    Only the interaction columns are returned; the base columns are not
+    copied. Higher-order terms reuse the product of their leading columns
+    when that term is also requested, so each triple costs one multiply.
+
+    Args:
+        features (np.ndarray): (n_rows, n_features) feature matrix
+        terms (list): Index tuples from interaction_terms
+        dtype (np.dtype): Output dtype
+        sparse (bool): Return a scipy.sparse CSR matrix instead of a dense array
+        block_size (int): Rows per block, bounding temporary memory
+
+    Returns:
+        np.ndarray or scipy.sparse.csr_matrix: (n_rows, len(terms)) interactions;
+            dense output is column-major
+    """
+    features = np.asarray(features)
+    n_rows = features.shape[0]
+
+    # Reuse the product of a term's leading columns when it is also a term
+    positions = {term: j for j, term in enumerate(terms)}
+    plan = [(j, positions.get(term[:-1], -1) if len(term) > 2 else -1, term) for j, term in enumerate(terms)]
+
+    def fill(out, block):
+        for j, prefix, term in plan:
+            if prefix >= 0:
+                np.multiply(out[:, prefix], block[:, term[-1]], out=out[:, j])
+            else:
+                np.multiply(block[:, term[0]], block[:, term[1]], out=out[:, j])
+                for i in term[2:]:
+                    out[:, j] *= block[:, i]
+
+    # Column-major output keeps every multiply on contiguous memory
+    if sparse:
+        from scipy import sparse as sp
+        buffer = np.empty((min(block_size, n_rows), len(terms)), dtype=dtype, order='F')
+        blocks = []
+    else:
+        result = np.empty((n_rows, len(terms)), dtype=dtype, order='F')
+
+    for start in range(0, n_rows, block_size):
+        block = np.asfortranarray(features[start:start + block_size], dtype=dtype)
+        out = buffer[:len(block)] if sparse else result[start:start + len(block)]
+        fill(out, block)
+        if sparse:
+            blocks.append(sp.csr_matrix(out))
+
+    if not sparse:
+        return result
+    return sp.vstack(blocks, format='csr') if blocks else sp.csr_matrix((0, len(terms)), dtype=dtype)
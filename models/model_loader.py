@@ -1,17 +1,87 @@
+import json
 import pickle
 import os
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from datetime import datetime
 
+# Hyperparameters of the default models; tuned values in a model's metadata override them
+DEFAULT_HYPERPARAMETERS = {
+    'random_forest': {
+        'n_estimators': 100,
+        'max_depth': 10,
+        'min_samples_split': 5,
+        'min_samples_leaf': 2,
+        'random_state': 42
+    },
+    'gradient_boosting': {
+        'n_estimators': 100,
+        'learning_rate': 0.1,
+        'max_depth': 5,
+        'random_state': 42
+    }
+}
+
+def metadata_path(model_path):
+    """
+    Get the path of the metadata stored next to a model file.
+    
+    Args:
+        model_path (str): Path to the model file
+        
+    Returns:
+        str: Path to the JSON metadata file
+    """
+    return f"{os.path.splitext(model_path)[0]}.meta.json"
+
+def load_model_metadata(model_path):
+    """
+    Load the metadata stored next to a model, such as its tuned configuration.
+    
+    Args:
+        model_path (str): Path to the model file
+        
+    Returns:
+        dict: Stored metadata, or an empty dict if there is none
+    """
+    try:
+        with open(metadata_path(model_path)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_model_metadata(metadata, model_path):
+    """
+    Save metadata next to a model.
+    
+    Args:
+        metadata (dict): JSON-serializable metadata
+        model_path (str): Path to the model file the metadata belongs to
+        
+    Returns:
+        str: Path the metadata was written to
+    """
+    path = metadata_path(model_path)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    
+    # Write then rename, so readers never see a partial file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(metadata, f, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
 def load_model(model_path, default_model_type='random_forest'):
     """
     Load a trained model from disk.
     
+    If the file cannot be loaded, a default model is created with the model
+    type and hyperparameters recorded in the model's metadata, if any.
+    
     Args:
         model_path (str): Path to the saved model file
         default_model_type (str): Type of model to create if loading fails
+            and the metadata names none
         
     Returns:
         object: Loaded model object
@@ -22,7 +92,9 @@ def load_model(model_path, default_model_type='random_forest'):
         return model
     except (FileNotFoundError, EOFError) as e:
         print(f"Error loading model from {model_path}: {e}")
-        return create_default_model(default_model_type)
+        metadata = load_model_metadata(model_path)
+        return create_default_model(metadata.get('model_type', default_model_type),
+                                    hyperparameters=metadata.get('hyperparameters'))
 
 def save_model(model, model_path):
     """
@@ -49,33 +121,26 @@ def save_model(model, model_path):
         print(f"Error saving model to {model_path}: {e}")
         return False
 
-def create_default_model(model_type='random_forest'):
+def create_default_model(model_type='random_forest', hyperparameters=None):
     """
     Create a new default model of the specified type.
     
     Args:
         model_type (str): Type of model to create
+        hyperparameters (dict, optional): Values overriding DEFAULT_HYPERPARAMETERS
         
     Returns:
         object: Created model object
     """
-    if model_type == 'random_forest':
-        return RandomForestRegressor(
-            n_estimators=100,
-            max_depth=10,
-            min_samples_split=5,
-            min_samples_leaf=2,
-            random_state=42
-        )
-    elif model_type == 'gradient_boosting':
-        return GradientBoostingRegressor(
-            n_estimators=100,
-            learning_rate=0.1,
-            max_depth=5,
-            random_state=42
-        )
-    else:
+    from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+    
+    if model_type not in DEFAULT_HYPERPARAMETERS:
         raise ValueError(f"Unknown model type: {model_type}")
+    params = {**DEFAULT_HYPERPARAMETERS[model_type], **(hyperparameters or {})}
+    
+    if model_type == 'random_forest':
+        return RandomForestRegressor(**params)
+    return GradientBoostingRegressor(**params)
 
 def predict_with_model(model, features, fallback_function=None):
     """
@@ -1,18 +1,28 @@
 # This file makes the modules directory a Python package
-# Import key functions to make them available at the package level
+# Key functions are exported at the package level but imported on first access,
+# so importing the package does not pull in heavy dependencies like scikit-learn
 
-from .data_processing import preprocess_data, extract_features
-from .prediction_models import predict_virality, predict_trend_duration
-from .visualization import create_trend_chart, create_radar_chart, create_platform_distribution_chart
-from .recommendation import generate_artist_recommendations
+import importlib
 
-__all__ = [
-    'preprocess_data',
-    'extract_features',
-    'predict_virality',
-    'predict_trend_duration',
-    'create_trend_chart',
-    'create_radar_chart',
-    'create_platform_distribution_chart',
-    'generate_artist_recommendations'
-]
\ No newline at end of file
+_EXPORTS = {
+    'preprocess_data': '.data_processing',
+    'extract_features': '.data_processing',
+    'predict_virality': '.prediction_models',
+    'predict_trend_duration': '.prediction_models',
+    'create_trend_chart': '.visualization',
+    'create_radar_chart': '.visualization',
+    'create_platform_distribution_chart': '.visualization',
+    'create_demographic_chart': '.visualization',
+    'create_scenario_comparison_chart': '.visualization',
+    'generate_artist_recommendations': '.recommendation',
+    'generate_roster_recommendations': '.recommendation',
+    'run_scenarios': '.scenarios'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
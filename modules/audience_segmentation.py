@@ -0,0 +1,263 @@
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from models.feature_scaler import RunningScaler
+from models.feature_schema import LISTENER_AFFINITIES, LISTENER_FEATURES, normalize_audio_column
+
+# Artifact the app loads the segmentation from, and `cli.py segment` writes
+SEGMENTATION_PATH = os.path.join('models', 'trained', 'audience_segmentation.pkl')
+
+# Segments learned by default, one per slice of the demographic donut
+N_SEGMENTS = 5
+
+# Listeners read per training chunk, and per k-means mini-batch within a chunk
+CHUNK_ROWS = 100_000
+MINI_BATCH_ROWS = 4096
+
+# Listeners per block of vectorized segment assignment, bounding the distance matrix
+ASSIGN_BLOCK_ROWS = 65_536
+
+# Smallest share of a segment's slice in the donut, before renormalizing
+MIN_SEGMENT_SHARE = 0.01
+
+# Width of the track-to-segment match kernel, in 0-1 affinity units per axis
+AFFINITY_BANDWIDTH = 0.2
+
+# Age brackets segments are named by, matching calculate_demographic_appeal
+AGE_BRACKETS = ((18, "13-17"), (25, "18-24"), (35, "25-34"), (45, "35-44"), (float('inf'), "45+"))
+
+# Name of the affinity that sets a segment apart most
+AFFINITY_NAMES = {
+    'novelty_factor': "Novelty Seekers",
+    'meme_potential': "Meme Sharers",
+    'tempo': "High-Tempo",
+    'neural_connection': "Neural Natives",
+    'cultural_resonance': "Culture Curators",
+    'emotional_intensity': "Emotional Listeners",
+    'celebrity_influence': "Celebrity Followers"
+}
+
+def read_listener_chunks(path, chunk_size=CHUNK_ROWS):
+    """
+    Read listener vectors from a CSV file chunk by chunk.
+
+    Args:
+        path (str): CSV file with one column per LISTENER_FEATURES name
+        chunk_size (int): Rows per chunk
+
+    Yields:
+        np.ndarray: (rows, len(LISTENER_FEATURES)) float32 listener vectors
+    """
+    for chunk in pd.read_csv(path, usecols=list(LISTENER_FEATURES), chunksize=chunk_size):
+        yield chunk[list(LISTENER_FEATURES)].to_numpy(dtype=np.float32)
+
+class AudienceSegmentation:
+    """
+    Listener segments learned with mini-batch k-means.
+
+    Listener vectors are standardized with a RunningScaler and clustered
+    with scikit-learn's MiniBatchKMeans, both updated chunk by chunk, so
+    the training data never has to fit in memory. Segments are named after
+    their centre's age bracket and the affinity that sets them apart most.
+
+    Args:
+        n_segments (int): Number of segments
+        random_state (int): Seed of the k-means initialization
+    """
+    def __init__(self, n_segments=N_SEGMENTS, random_state=0):
+        from sklearn.cluster import MiniBatchKMeans
+
+        self.n_segments = n_segments
+        self.scaler = RunningScaler(feature_names=LISTENER_FEATURES)
+        self.kmeans = MiniBatchKMeans(n_clusters=n_segments, batch_size=MINI_BATCH_ROWS, n_init=3,
+                                      random_state=random_state)
+        self.counts = np.zeros(n_segments, dtype=np.int64)
+        self.labels = []
+        self.n_listeners = 0
+
+    def _chunk(self, features):
+        features = np.asarray(features, dtype=np.float64).reshape(-1, len(LISTENER_FEATURES))
+        return features[np.isfinite(features).all(axis=1)]
+
+    def partial_fit(self, features):
+        """
+        Update the segment centres with a chunk of listeners.
+
+        The scaler must have seen the training data first (see fit), so
+        every chunk is standardized with the same statistics.
+
+        Args:
+            features (np.ndarray): (rows, len(LISTENER_FEATURES)) listener vectors
+
+        Returns:
+            AudienceSegmentation: self
+        """
+        chunk = self.scaler.transform(self._chunk(features))
+        for start in range(0, len(chunk), MINI_BATCH_ROWS):
+            batch = chunk[start:start + MINI_BATCH_ROWS]
+            # The first mini-batch seeds the centres, so it needs a point per segment
+            if not hasattr(self.kmeans, 'cluster_centers_') and len(batch) < self.n_segments:
+                continue
+            self.kmeans.partial_fit(batch)
+        return self
+
+    def fit(self, make_chunks, passes=1):
+        """
+        Learn segments from listener chunks that need not fit in memory together.
+
+        One pass fits the scaler, `passes` passes update the centres, and a
+        last pass counts the listeners per segment.
+
+        Args:
+            make_chunks (callable): Returns a fresh iterator of listener chunks on each call
+            passes (int): Passes of k-means updates over the chunks
+
+        Returns:
+            AudienceSegmentation: self
+        """
+        for chunk in make_chunks():
+            self.scaler.partial_fit(self._chunk(chunk))
+        for _ in range(passes):
+            for chunk in make_chunks():
+                self.partial_fit(chunk)
+
+        self.counts = np.zeros(self.n_segments, dtype=np.int64)
+        centers = self.centers()
+        for chunk in make_chunks():
+            self.counts += np.bincount(self.assign(chunk), minlength=self.n_segments)
+        self.n_listeners = int(self.counts.sum())
+        self.labels = self._name_segments(centers)
+        return self
+
+    def centers(self):
+        """
+        Segment centres in the original listener feature units.
+
+        Returns:
+            np.ndarray: (n_segments, len(LISTENER_FEATURES)) centres
+        """
+        return self.kmeans.cluster_centers_ * self.scaler.scale + self.scaler.mean
+
+    def _name_segments(self, centers):
+        affinity_columns = [LISTENER_FEATURES.index(name) for name in LISTENER_AFFINITIES]
+        # Standardized affinities: how far each centre leans from the average listener
+        leaning = self.kmeans.cluster_centers_[:, affinity_columns]
+        names = []
+        for center, lean in zip(centers, leaning):
+            bracket = next(label for limit, label in AGE_BRACKETS if center[0] < limit)
+            name = f"{bracket} {AFFINITY_NAMES[LISTENER_AFFINITIES[int(np.argmax(lean))]]}"
+            names.append(name if name not in names else f"{name} {names.count(name) + 1}")
+        return names
+
+    def assign(self, features):
+        """
+        Assign listeners to their nearest segment in vectorized blocks.
+
+        Args:
+            features (np.ndarray): (rows, len(LISTENER_FEATURES)) listener vectors
+
+        Returns:
+            np.ndarray: Segment index of each row
+        """
+        features = np.asarray(features, dtype=np.float64).reshape(-1, len(LISTENER_FEATURES))
+        centers = self.kmeans.cluster_centers_
+        center_norms = (centers ** 2).sum(axis=1)
+        mean, scale = self.scaler.mean, self.scaler.scale
+
+        segments = np.empty(len(features), dtype=np.int64)
+        for start in range(0, len(features), ASSIGN_BLOCK_ROWS):
+            block = (features[start:start + ASSIGN_BLOCK_ROWS] - mean) / scale
+            # |x - c|^2 without the |x|^2 term, which is the same for every centre
+            distances = center_norms - 2 * block @ centers.T
+            segments[start:start + ASSIGN_BLOCK_ROWS] = distances.argmin(axis=1)
+        return segments
+
+    def shares(self):
+        """
+        Share of the training listeners in each segment.
+
+        Returns:
+            dict: Shares keyed by segment name
+        """
+        total = max(int(self.counts.sum()), 1)
+        return {label: count / total for label, count in zip(self.labels, self.counts)}
+
+    def segment_appeal(self, track_params):
+        """
+        Share of a track's expected audience coming from each segment.
+
+        Each segment's weight is its size times its listening sessions
+        times a Gaussian match between the track's audio parameters and
+        the segment's affinities.
+
+        Args:
+            track_params (dict): Sidebar values of the LISTENER_AFFINITIES parameters
+
+        Returns:
+            dict: Appeal shares summing to 1, keyed by segment name
+        """
+        track = np.array([normalize_audio_column(name, track_params[name]) for name in LISTENER_AFFINITIES])
+        centers = self.centers()
+        affinities = centers[:, [LISTENER_FEATURES.index(name) for name in LISTENER_AFFINITIES]]
+        sessions = np.maximum(centers[:, LISTENER_FEATURES.index('daily_sessions')], 0)
+
+        distance = ((affinities - track) ** 2).mean(axis=1)
+        weights = self.counts * sessions * np.exp(-distance / (2 * AFFINITY_BANDWIDTH ** 2))
+        if weights.sum() <= 0:
+            weights = self.counts.astype(np.float64)
+        # Every segment keeps a visible slice of at least MIN_SEGMENT_SHARE before renormalizing
+        weights = np.maximum(weights / max(weights.sum(), 1e-12), MIN_SEGMENT_SHARE)
+        weights = weights / weights.sum()
+        return {label: float(weight) for label, weight in zip(self.labels, weights)}
+
+def train_segmentation(make_chunks, n_segments=N_SEGMENTS, passes=1, path=SEGMENTATION_PATH, random_state=0):
+    """
+    Learn audience segments from listener chunks and save them.
+
+    Args:
+        make_chunks (callable): Returns a fresh iterator of listener chunks on each call
+        n_segments (int): Number of segments
+        passes (int): Passes of k-means updates over the chunks
+        path (str, optional): Where to save the segmentation; None to skip saving
+        random_state (int): Seed of the k-means initialization
+
+    Returns:
+        AudienceSegmentation: The trained segmentation
+    """
+    segmentation = AudienceSegmentation(n_segments, random_state=random_state).fit(make_chunks, passes=passes)
+    if path is not None:
+        save_segmentation(segmentation, path)
+    return segmentation
+
+def save_segmentation(segmentation, path=SEGMENTATION_PATH):
+    """
+    Save a segmentation, replacing the artifact atomically.
+
+    Returns:
+        str: Path the segmentation was written to
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    # Write then rename, so the app never loads a partial file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(segmentation, f)
+    os.replace(tmp_path, path)
+    return path
+
+def load_segmentation(path=SEGMENTATION_PATH):
+    """
+    Load a saved segmentation.
+
+    Returns:
+        AudienceSegmentation: The stored segmentation, or None if the artifact is missing or empty
+    """
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except (FileNotFoundError, EOFError):
+        print(f"Segmentation not found at {path}")
+        return None
@@ -0,0 +1,217 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from modules.data_processing import FEATURE_NAMES, extract_features, preprocess_data
+from modules.prediction_models import MODEL_REGISTRY, load_prediction_models
+from modules.scenarios import default_worker_count
+
+# Days of history before the first forecast origin, and days between origins
+MIN_HISTORY_DAYS = 14
+ORIGIN_STEP_DAYS = 7
+
+# Days after each origin in which outcomes are realized
+HORIZON_DAYS = 30
+
+# Days averaged into the engagement level at an origin
+LEVEL_DAYS = 3
+
+# Range predict_trend_duration returns, in days
+DURATION_RANGE = (3, 30)
+
+# Models loaded once per worker process by _init_worker
+_worker_models = None
+
+def _init_worker():
+    global _worker_models
+    _worker_models = load_prediction_models()
+
+def rolling_origins(n_days, min_history=MIN_HISTORY_DAYS, step=ORIGIN_STEP_DAYS, horizon=HORIZON_DAYS):
+    """
+    Forecast origins of a rolling-origin backtest.
+
+    Args:
+        n_days (int): Days of history per track
+        min_history (int): Days observed before the first origin
+        step (int): Days between origins
+        horizon (int): Days after each origin that must be observed
+
+    Returns:
+        list: Origins, as the number of days observed before each
+    """
+    return list(range(min_history, n_days - horizon + 1, step))
+
+def realized_outcomes(curves, origin, horizon=HORIZON_DAYS):
+    """
+    What actually happened after an origin, on the scales the predictors use.
+
+    Realized virality is the percentile (0-100) of each track's engagement
+    growth over the horizon among all tracks at the origin. Realized trend
+    duration is the number of days until the 3-day engagement average falls
+    below its level at the origin, clipped to DURATION_RANGE; trends that
+    outlast the horizon count as the horizon.
+
+    Args:
+        curves (np.ndarray): (n_tracks, n_days) daily engagement
+        origin (int): Days observed before the origin
+        horizon (int): Days after the origin
+
+    Returns:
+        dict: 'virality' and 'trend_duration' arrays, one value per track
+    """
+    before = curves[:, origin - LEVEL_DAYS:origin].mean(axis=1)
+    after = curves[:, origin:origin + horizon]
+    growth = after.mean(axis=1) / np.maximum(before, 1e-9) - 1
+    virality = pd.Series(growth).rank(pct=True).to_numpy() * 100
+
+    level = np.lib.stride_tricks.sliding_window_view(after, LEVEL_DAYS, axis=1).mean(axis=2)
+    below = level < before[:, None]
+    duration = np.where(below.any(axis=1), below.argmax(axis=1) + LEVEL_DAYS, horizon)
+    return {
+        'virality': virality,
+        'trend_duration': np.clip(duration, *DURATION_RANGE).astype(np.float64),
+        'growth': growth
+    }
+
+def history_features(history, start_date):
+    """
+    Model features of each track from its daily history, as the app computes them.
+
+    Args:
+        history (np.ndarray): (n_tracks, n_days) daily engagement up to a forecast origin
+        start_date (datetime-like): Date of the first day
+
+    Returns:
+        list: Single-row feature DataFrames, one per track
+    """
+    dates = pd.date_range(start_date, periods=history.shape[1], freq='D')
+    return [extract_features(preprocess_data(pd.DataFrame({'date': dates, 'engagement': curve})))
+            for curve in history]
+
+def history_feature_matrix(task):
+    """
+    history_features as one array, for training; runs in worker processes.
+
+    Args:
+        task (tuple): (history np.ndarray, start_date), as history_features takes them
+
+    Returns:
+        np.ndarray: (n_tracks, len(FEATURE_NAMES)) features, NaN replaced by 0
+    """
+    history, start_date = task
+    features = pd.concat(history_features(history, start_date), ignore_index=True)
+    return np.nan_to_num(features[list(FEATURE_NAMES)].to_numpy(dtype=np.float64))
+
+def _score_origin(task):
+    # Features and predictions from the days before the origin only
+    history, start_date = task
+    models = _worker_models or {}
+
+    started = time.perf_counter()
+    features = history_features(history, start_date)
+    feature_seconds = time.perf_counter() - started
+
+    predictions, seconds = {}, {}
+    for name, (predict, _) in MODEL_REGISTRY.items():
+        started = time.perf_counter()
+        predictions[name] = np.array([float(predict(row, model=models.get(name))) for row in features])
+        seconds[name] = time.perf_counter() - started
+    return predictions, seconds, feature_seconds
+
+def _spearman(x, y):
+    if np.std(x) == 0 or np.std(y) == 0:
+        return float('nan')
+    return float(pd.Series(x).corr(pd.Series(y), method='spearman'))
+
+def run_backtest(curves, start_date=None, origins=None, horizon=HORIZON_DAYS, executor=None, max_workers=None):
+    """
+    Replay history with rolling forecast origins and score every model in MODEL_REGISTRY.
+
+    At each origin the tracks' features are computed from the days before
+    it only, every registered predictor scores them, and the predictions
+    are compared with realized_outcomes. Origins run in a process pool.
+
+    Args:
+        curves (np.ndarray): (n_tracks, n_days) daily engagement, such as
+            generate_historical_trends returns
+        start_date (datetime-like, optional): Date of the first day; defaults to n_days ago
+        origins (list, optional): Days observed before each origin; defaults to rolling_origins()
+        horizon (int): Days after each origin in which outcomes are realized
+        executor (concurrent.futures.Executor, optional): Pool to reuse; a
+            temporary process pool is created if omitted
+        max_workers (int, optional): Size of the temporary pool
+
+    Returns:
+        dict: 'origins' (pd.DataFrame of errors per origin and model),
+            'summary' (pd.DataFrame of errors and scoring throughput per model),
+            'predictions' (pd.DataFrame of every prediction and its realized
+            outcome) and 'wall_seconds'
+    """
+    curves = np.asarray(curves, dtype=np.float64)
+    n_tracks, n_days = curves.shape
+    if start_date is None:
+        start_date = pd.Timestamp.now().normalize() - pd.Timedelta(days=n_days)
+    origins = rolling_origins(n_days, horizon=horizon) if origins is None else list(origins)
+    if not origins:
+        raise ValueError(f"{n_days} days leave no origin with {MIN_HISTORY_DAYS} days of history "
+                         f"and {horizon} days of outcomes")
+
+    # Workers only receive the days before each origin
+    tasks = [(curves[:, :origin], start_date) for origin in origins]
+    started = time.perf_counter()
+    if executor is None:
+        workers = max_workers or default_worker_count(len(tasks))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            results = list(pool.map(_score_origin, tasks))
+    else:
+        results = list(executor.map(_score_origin, tasks))
+    wall_seconds = time.perf_counter() - started
+
+    rows, predicted_rows = [], []
+    pooled = {name: ([], [], []) for name in MODEL_REGISTRY}
+    for origin, (predictions, seconds, feature_seconds) in zip(origins, results):
+        realized = realized_outcomes(curves, origin, horizon)
+        origin_date = (pd.Timestamp(start_date) + pd.Timedelta(days=origin)).date()
+        for name, predicted in predictions.items():
+            actual = realized[name]
+            error = predicted - actual
+            rows.append({
+                'origin': origin_date,
+                'model': name,
+                'mae': float(np.abs(error).mean()),
+                'rmse': float(np.sqrt((error ** 2).mean())),
+                'bias': float(error.mean()),
+                'spearman': _spearman(predicted, actual),
+                'predictions': n_tracks,
+                'score_seconds': seconds[name],
+                'feature_seconds': feature_seconds
+            })
+            predicted_rows.append(pd.DataFrame({'model': name, 'origin': origin_date, 'predicted': predicted,
+                                                'actual': actual}))
+            pooled[name][0].append(predicted)
+            pooled[name][1].append(actual)
+            pooled[name][2].append(seconds[name])
+
+    summary = []
+    for name, (predicted, actual, seconds) in pooled.items():
+        predicted, actual = np.concatenate(predicted), np.concatenate(actual)
+        error = predicted - actual
+        summary.append({
+            'model': name,
+            'origins': len(origins),
+            'predictions': len(predicted),
+            'mae': float(np.abs(error).mean()),
+            'rmse': float(np.sqrt((error ** 2).mean())),
+            'bias': float(error.mean()),
+            'spearman': _spearman(predicted, actual),
+            'predictions_per_second': len(predicted) / sum(seconds) if sum(seconds) else 0.0
+        })
+
+    return {
+        'origins': pd.DataFrame(rows),
+        'summary': pd.DataFrame(summary),
+        'predictions': pd.concat(predicted_rows, ignore_index=True),
+        'wall_seconds': wall_seconds
+    }
@@ -0,0 +1,249 @@
+import os
+import time
+import math
+from datetime import date
+from itertools import repeat
+
+import pandas as pd
+
+from modules.data_processing import FEATURE_NAMES
+from modules.feature_store import input_hash, pipeline_feature_store
+from modules.parameters import PARAM_DEFAULTS, validate_params
+from modules.pipeline import SIMULATION_PARAMS, select_params
+from modules.recommendation import generate_artist_recommendations, generate_roster_recommendations
+from modules.scenarios import create_scenario_pool, default_worker_count, run_scenario
+
+# Tracks scored between output writes and progress reports
+DEFAULT_CHUNK_SIZE = 500
+
+# Separator for list-valued columns (regions, recommendations) in flat files
+LIST_SEPARATOR = ';'
+
+OUTPUT_COLUMNS = ['track_id', 'virality_score', 'virality_low', 'virality_high', 'trend_duration',
+                  'trend_duration_low', 'trend_duration_high', 'model_trend_duration', 'model_trend_duration_low',
+                  'model_trend_duration_high', 'peak_day', 'peak_engagement', 'total_engagement', 'recommendations']
+
+def _range_bounds(metrics, key):
+    # NaN rather than None keeps the column float in every chunk, as Parquet needs
+    low, high = metrics.get(key) or (math.nan, math.nan)
+    return float(low), float(high)
+
+def _is_columnar(path):
+    return os.path.isdir(path) or path.endswith('.parquet')
+
+def read_tracks(path):
+    """
+    Read tracks to score from a CSV file or a Parquet file/directory.
+
+    Each row holds one track's parameters using the sidebar schema column
+    names, plus an optional 'track_id' column. Missing or empty values take
+    the sidebar defaults; 'regions' may be a list or a ';'-separated string.
+
+    Args:
+        path (str): CSV file, Parquet file or directory of Parquet partitions
+
+    Returns:
+        list: (track_id, params) tuples with validated parameters
+
+    Raises:
+        ValueError: If a row contains an invalid parameter
+    """
+    frame = pd.read_parquet(path) if _is_columnar(path) else pd.read_csv(path)
+    columns = [column for column in frame.columns if column in PARAM_DEFAULTS]
+
+    tracks = []
+    for i, row in enumerate(frame.to_dict('records')):
+        track_id = row.get('track_id', i)
+        params = {}
+        for column in columns:
+            value = row[column]
+            if isinstance(value, str) and column == 'regions':
+                value = [region.strip() for region in value.split(LIST_SEPARATOR) if region.strip()]
+            elif isinstance(value, float) and math.isnan(value):
+                continue
+            elif hasattr(value, 'tolist'):
+                # numpy scalars and Parquet list columns
+                value = value.tolist()
+            params[column] = value
+
+        try:
+            tracks.append((track_id, validate_params(params)))
+        except ValueError as e:
+            raise ValueError(f"Track {track_id!r} (row {i + 1}): {e}") from e
+
+    return tracks
+
+def score_track(track_id, params, seed=None, features=None, recommend=True):
+    """
+    Score one track: simulate, preprocess, extract features, predict,
+    calculate metrics and generate recommendations.
+
+    Args:
+        track_id: Identifier copied to the output row
+        params (dict): Validated parameter set
+        seed (int, optional): Seed for the trend simulator
+        features (np.ndarray, optional): Stored feature vector in FEATURE_NAMES
+            order; skips preprocessing and feature extraction
+        recommend (bool): Generate recommendations; batch callers evaluate
+            them for a whole chunk instead
+
+    Returns:
+        tuple: Flat output row, and the computed feature vector (None when
+            features were given)
+    """
+    stored = features is not None
+    if stored:
+        features = pd.DataFrame([features], columns=list(FEATURE_NAMES))
+
+    result = run_scenario(params, seed, features=features)
+    metrics = result['metrics']
+    virality_low, virality_high = _range_bounds(metrics, 'virality_range')
+    duration_low, duration_high = _range_bounds(metrics, 'trend_duration_range')
+    # The duration model's own estimate, which is trend_duration unless a growth curve set it
+    model_key = 'trend_duration' if metrics['growth_model'] is None else 'model_trend_duration'
+    model_low, model_high = _range_bounds(metrics, f"{model_key}_range")
+
+    row = {
+        'track_id': track_id,
+        'virality_score': round(float(metrics['virality_score']), 2),
+        'virality_low': round(virality_low, 2),
+        'virality_high': round(virality_high, 2),
+        'trend_duration': int(metrics['trend_duration']),
+        'trend_duration_low': duration_low,
+        'trend_duration_high': duration_high,
+        'model_trend_duration': int(metrics[model_key]),
+        'model_trend_duration_low': model_low,
+        'model_trend_duration_high': model_high,
+        'peak_day': metrics['peak_day'],
+        'peak_engagement': int(metrics['peak_engagement']),
+        'total_engagement': int(metrics['total_engagement']),
+        'recommendations': LIST_SEPARATOR.join(generate_artist_recommendations(params)) if recommend else None
+    }
+    return row, None if stored else result['features'][list(FEATURE_NAMES)].to_numpy()[0]
+
+class ChunkWriter:
+    """
+    Append chunks of output rows to a CSV or Parquet file.
+    """
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.rows_written = 0
+        self._parquet_writer = None
+        self._started = False
+
+    def write(self, rows):
+        frame = pd.DataFrame(rows, columns=OUTPUT_COLUMNS)
+
+        if self.output_path.endswith('.parquet'):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.output_path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            frame.to_csv(self.output_path, mode='a' if self._started else 'w',
+                         header=not self._started, index=False)
+
+        self._started = True
+        self.rows_written += len(rows)
+
+    def close(self):
+        # Always leave a file behind, even for an empty input
+        if not self._started:
+            self.write([])
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+def score_tracks(tracks, output_path, max_workers=None, chunk_size=DEFAULT_CHUNK_SIZE, seed=None,
+                 feature_store=None, report=print):
+    """
+    Score tracks across a process pool, writing results in chunks.
+
+    Args:
+        tracks (list): (track_id, params) tuples from read_tracks
+        output_path (str): Output .csv or .parquet file
+        max_workers (int, optional): Worker processes; defaults to the CPU count
+        chunk_size (int): Rows per output write and progress report
+        seed (int, optional): Base simulator seed; track i uses seed + i
+        feature_store (str, optional): SQLite feature store; features already
+            stored for a track today from the same simulation parameters and
+            seed are reused, the rest are computed and stored. Needs a seed,
+            since unseeded histories differ on every run
+        report (callable): Receives progress lines
+
+    Returns:
+        dict: Tracks scored, elapsed seconds, throughput, worker count and,
+            with a feature store, its hit/miss summary
+    """
+    workers = max_workers or default_worker_count(os.cpu_count() or 1)
+    seeds = [None if seed is None else seed + i for i in range(len(tracks))]
+    track_ids = [track_id for track_id, _ in tracks]
+    param_sets = [params for _, params in tracks]
+
+    start = time.perf_counter()
+    if feature_store and seed is None:
+        report("Feature store not used: features of unseeded tracks are simulated afresh on every run")
+        feature_store = None
+    store = pipeline_feature_store(feature_store) if feature_store else None
+    as_of_date = date.today().isoformat()
+    # Features depend on the simulated history only, so only its parameters and seed key them
+    hashes = ({track_id: input_hash(select_params(params, SIMULATION_PARAMS), track_seed)
+               for track_id, params, track_seed in zip(track_ids, param_sets, seeds)} if store else {})
+    stored = store.get_many(track_ids, as_of_date, input_hashes=hashes) if store else {}
+    features = [stored.get(track_id) for track_id in track_ids]
+
+    writer = ChunkWriter(output_path)
+    rows, computed = [], []
+
+    def flush():
+        # Recommendations for the whole chunk come from one rule-table evaluation
+        offset = writer.rows_written
+        recommendations = generate_roster_recommendations(param_sets[offset:offset + len(rows)])
+        for row, messages in zip(rows, recommendations):
+            row['recommendations'] = LIST_SEPARATOR.join(messages)
+
+        writer.write(rows)
+        if store and computed:
+            store.put_many(computed, as_of_date, input_hashes=hashes)
+        rows.clear()
+        computed.clear()
+
+    try:
+        with create_scenario_pool(workers) as pool:
+            # Hand tasks to workers in batches; results still stream back in input order
+            batch = max(1, min(chunk_size, len(tracks) // (workers * 4)))
+            for row, vector in pool.map(score_track, track_ids, param_sets, seeds, features, repeat(False),
+                                       chunksize=batch):
+                rows.append(row)
+                if vector is not None:
+                    computed.append((row['track_id'], vector))
+                if len(rows) >= chunk_size:
+                    flush()
+                    elapsed = time.perf_counter() - start
+                    report(f"Scored {writer.rows_written}/{len(tracks)} tracks "
+                           f"({writer.rows_written / elapsed:.1f} tracks/s)")
+            if rows:
+                flush()
+    finally:
+        writer.close()
+        if store:
+            store.close()
+
+    elapsed = time.perf_counter() - start
+    scored = writer.rows_written
+    summary = {
+        'tracks': scored,
+        'seconds': elapsed,
+        'tracks_per_second': scored / elapsed if elapsed else 0.0,
+        'workers': workers
+    }
+    report(f"Scored {scored} tracks in {elapsed:.2f}s with {workers} workers "
+           f"({summary['tracks_per_second']:.1f} tracks/s) -> {output_path}")
+
+    if store:
+        summary['feature_store'] = store.summary()
+        report(f"Feature store: {store.hits} hits, {store.misses} misses "
+               f"({summary['feature_store']['hit_rate']:.0%} hit rate) for {as_of_date}")
+    return summary
@@ -0,0 +1,226 @@
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from models.feature_schema import AUDIO_FEATURES, FEATURE_DTYPE, normalize_audio_column
+from modules.recommendation import COLLABORATION_RULES
+
+# Collaborator types suggested by the collaboration rules
+COLLABORATOR_ROLES = tuple(rule.template for rule in COLLABORATION_RULES.rules)
+
+# Per-axis scale after schema normalization; the vocal percentage is 0-100
+# in the feature schema, so it is scaled to 0-1 like the other axes
+AXIS_SCALE = np.array([0.01 if name == 'synthetic_vocal_pct' else 1.0 for name in AUDIO_FEATURES])
+
+# Largest distance between two vectors whose axes all lie in 0-1
+MAX_DISTANCE = float(np.sqrt(len(AUDIO_FEATURES)))
+
+# Inserts are searched by brute force until the buffer reaches this size,
+# or this fraction of the tree, and then merged into a rebuilt tree
+MIN_REBUILD_SIZE = 4096
+REBUILD_FRACTION = 0.05
+
+# Leaf size of the k-d tree
+LEAF_SIZE = 32
+
+def artist_vectors(audio_params):
+    """
+    Convert audio parameters into index vectors.
+
+    Args:
+        audio_params (pd.DataFrame, dict or list): Columns of raw audio parameters
+            (a catalog frame or a dict of arrays), or a list of parameter dictionaries
+
+    Returns:
+        np.ndarray: (n_artists, len(AUDIO_FEATURES)) float32 vectors with every axis in 0-1
+    """
+    if isinstance(audio_params, list):
+        columns = {name: [params.get(name, 0.0) for params in audio_params] for name in AUDIO_FEATURES}
+    else:
+        columns = audio_params
+
+    vectors = np.empty((len(columns[AUDIO_FEATURES[0]]), len(AUDIO_FEATURES)), dtype=FEATURE_DTYPE)
+    for j, name in enumerate(AUDIO_FEATURES):
+        vectors[:, j] = normalize_audio_column(name, columns[name]) * AXIS_SCALE[j]
+    return vectors
+
+def match_percentage(distances):
+    """
+    Convert vector distances into a 0-100 match percentage.
+
+    Args:
+        distances (np.ndarray): Euclidean distances between index vectors
+
+    Returns:
+        np.ndarray: 100 for identical vectors, falling linearly to 0 at MAX_DISTANCE
+    """
+    return np.clip(100 * (1 - np.asarray(distances) / MAX_DISTANCE), 0, 100)
+
+class CollaboratorIndex:
+    """
+    Nearest-neighbour index over artist audio vectors.
+
+    Artists live in a k-d tree plus a small insert buffer. Queries search
+    both and merge the results, so inserts are visible immediately; the
+    buffer is folded into a rebuilt tree once it grows past
+    max(MIN_REBUILD_SIZE, REBUILD_FRACTION * tree size).
+
+    Args:
+        artist_ids (sequence): Artist identifiers
+        vectors (np.ndarray): Vectors from artist_vectors, one row per artist
+        roles (sequence): Collaborator role of each artist
+    """
+    def __init__(self, artist_ids, vectors, roles):
+        self.role_names = list(COLLABORATOR_ROLES)
+        self._ids = []
+        self._roles = np.empty(0, dtype=np.int16)
+        self._vectors = np.empty((0, len(AUDIO_FEATURES)), dtype=FEATURE_DTYPE)
+        self._buffer = []
+        self._buffer_vectors = None
+        self._tree = None
+        self.rebuilds = 0
+
+        self._append(artist_ids, vectors, roles)
+        self.rebuild()
+
+    def __len__(self):
+        return len(self._ids)
+
+    @property
+    def buffered(self):
+        """Number of inserted artists not yet merged into the tree."""
+        return len(self._ids) - self._vectors.shape[0]
+
+    def _role_codes(self, roles):
+        codes = []
+        for role in roles:
+            if role not in self.role_names:
+                self.role_names.append(role)
+            codes.append(self.role_names.index(role))
+        return np.array(codes, dtype=np.int16)
+
+    def _append(self, artist_ids, vectors, roles):
+        artist_ids = list(artist_ids)
+        vectors = np.asarray(vectors, dtype=FEATURE_DTYPE).reshape(-1, len(AUDIO_FEATURES))
+        if not len(artist_ids) == len(vectors) == len(roles):
+            raise ValueError(f"Got {len(artist_ids)} ids, {len(vectors)} vectors and {len(roles)} roles")
+
+        # Roles repeat across a catalog, so map each distinct role once
+        if not isinstance(roles, (pd.Series, pd.Categorical)):
+            roles = np.asarray(roles, dtype=object)
+        inverse, uniques = pd.factorize(roles)
+        self._ids.extend(artist_ids)
+        self._roles = np.concatenate([self._roles, self._role_codes(uniques)[inverse]])
+        self._buffer.append(vectors)
+        self._buffer_vectors = None
+
+    def add(self, artist_ids, vectors, roles):
+        """
+        Insert artists; they are returned by queries immediately.
+
+        Args:
+            artist_ids (sequence): Artist identifiers
+            vectors (np.ndarray): Vectors from artist_vectors
+            roles (sequence): Collaborator role of each artist
+        """
+        self._append(artist_ids, vectors, roles)
+        if self.buffered >= max(MIN_REBUILD_SIZE, REBUILD_FRACTION * self._vectors.shape[0]):
+            self.rebuild()
+
+    def rebuild(self):
+        """
+        Merge buffered inserts into a new k-d tree.
+        """
+        if self._buffer:
+            self._vectors = np.concatenate([self._vectors] + self._buffer)
+            self._buffer = []
+            self._buffer_vectors = None
+        # Unbalanced, non-compacted trees build several times faster with similar query times
+        self._tree = cKDTree(self._vectors, leafsize=LEAF_SIZE, balanced_tree=False, compact_nodes=False)
+        self.rebuilds += 1
+
+    def _search_tree(self, vector, k, role_code):
+        n_tree = self._vectors.shape[0]
+        if n_tree == 0:
+            return np.empty(0), np.empty(0, dtype=np.int64)
+
+        if role_code is None:
+            distances, rows = self._tree.query(vector, k=min(k, n_tree))
+            return np.atleast_1d(distances), np.atleast_1d(rows)
+
+        # Widen the search until k neighbours have the role or the whole tree was searched
+        width = k * 2 * len(self.role_names)
+        while True:
+            distances, rows = self._tree.query(vector, k=min(width, n_tree))
+            distances, rows = np.atleast_1d(distances), np.atleast_1d(rows)
+            keep = self._roles[rows] == role_code
+            if keep.sum() >= k or width >= n_tree:
+                return distances[keep][:k], rows[keep][:k]
+            width *= 4
+
+    def _search_buffer(self, vector, k, role_code):
+        if not self._buffer:
+            return np.empty(0), np.empty(0, dtype=np.int64)
+        if self._buffer_vectors is None:
+            self._buffer_vectors = np.concatenate(self._buffer)
+
+        offset = self._vectors.shape[0]
+        distances = np.sqrt(((self._buffer_vectors - vector) ** 2).sum(axis=1))
+        rows = np.arange(offset, offset + len(distances))
+        if role_code is not None:
+            keep = self._roles[offset:] == role_code
+            distances, rows = distances[keep], rows[keep]
+        if len(distances) > k:
+            nearest = np.argpartition(distances, k - 1)[:k]
+            distances, rows = distances[nearest], rows[nearest]
+        return distances, rows
+
+    def query(self, vector, k=5, role=None):
+        """
+        Find the artists most similar to a vector.
+
+        Args:
+            vector (np.ndarray): Query vector from artist_vectors
+            k (int): Number of artists to return
+            role (str, optional): Only return artists with this collaborator role
+
+        Returns:
+            list: Up to k dictionaries with artist_id, role, distance and match
+                (percentage), most similar first
+        """
+        vector = np.asarray(vector, dtype=FEATURE_DTYPE).reshape(-1)
+        role_code = None
+        if role is not None:
+            if role not in self.role_names:
+                return []
+            role_code = self.role_names.index(role)
+
+        tree_distances, tree_rows = self._search_tree(vector, k, role_code)
+        buffer_distances, buffer_rows = self._search_buffer(vector, k, role_code)
+        distances = np.concatenate([tree_distances, buffer_distances])
+        rows = np.concatenate([tree_rows, buffer_rows]).astype(np.int64)
+
+        order = np.argsort(distances, kind='stable')[:k]
+        matches = match_percentage(distances[order])
+        return [
+            {
+                'artist_id': self._ids[row],
+                'role': self.role_names[self._roles[row]],
+                'distance': float(distances[i]),
+                'match': float(match)
+            }
+            for i, row, match in zip(order, rows[order], matches)
+        ]
+
+def build_collaborator_index(catalog):
+    """
+    Build a collaborator index from an artist catalog.
+
+    Args:
+        catalog (pd.DataFrame): Catalog with artist_id, role and audio parameter
+            columns, such as generate_artist_catalog returns
+
+    Returns:
+        CollaboratorIndex: Index over every artist in the catalog
+    """
+    return CollaboratorIndex(catalog['artist_id'].tolist(), artist_vectors(catalog), catalog['role'])
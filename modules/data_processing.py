@@ -1,13 +1,35 @@
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler
 
-def preprocess_data(df):
+from modules.time_buckets import PERIODS_PER_DAY
+
+# Columns produced by extract_features; bump FEATURE_VERSION when their
+# calculation changes so stored feature rows are recomputed
+FEATURE_NAMES = ('mean_engagement', 'std_engagement', 'max_engagement', 'min_engagement',
+                 'mean_growth', 'growth_volatility', 'momentum', 'mean_acceleration')
+FEATURE_VERSION = 1
+
+def window_periods(days, resolution='day'):
+    """
+    Number of rows spanning a window of days at a time-bucket resolution.
+
+    Args:
+        days (float): Window length in days
+        resolution (str): 'hour', 'day' or 'week'
+
+    Returns:
+        int: Rows in the window, at least 1
+    """
+    return max(1, int(round(days * PERIODS_PER_DAY[resolution])))
+
+def preprocess_data(df, resolution='day'):
     """
     Preprocess raw trend data for analysis.
     
     Args:
-        df (pd.DataFrame): Raw data frame with trend data
+        df (pd.DataFrame): Raw data frame with trend data, one row per bucket
+        resolution (str): Bucket width of the rows ('hour', 'day' or 'week');
+            rolling windows stay 3 and 7 days long at any resolution
         
     Returns:
         pd.DataFrame: Cleaned and preprocessed data
@@ -24,32 +46,36 @@ def preprocess_data(df):
     
     # Calculate additional metrics
     if 'engagement' in data.columns:
-        # Calculate day-over-day growth
+        # Calculate period-over-period growth
         data['growth'] = data['engagement'].pct_change()
         
         # Calculate rolling metrics
-        data['rolling_avg_3d'] = data['engagement'].rolling(window=3, min_periods=1).mean()
-        data['rolling_avg_7d'] = data['engagement'].rolling(window=7, min_periods=1).mean()
+        data['rolling_avg_3d'] = data['engagement'].rolling(window=window_periods(3, resolution), min_periods=1).mean()
+        data['rolling_avg_7d'] = data['engagement'].rolling(window=window_periods(7, resolution), min_periods=1).mean()
         
         # Calculate acceleration (second derivative)
-        data['acceleration'] = data['growth'].pct_change()
+        growth = data['growth'].ffill()
+        data['acceleration'] = growth / growth.shift(1) - 1
     
-    # Fill NaN values
-    data = data.fillna(method='ffill')
+    # Replace infinite growth from zero-engagement days, then fill NaN values
+    data = data.replace([np.inf, -np.inf], np.nan)
+    data = data.ffill()
     
     return data
 
-def extract_features(df, window_size=7):
+def extract_features(df, window_size=7, resolution='day'):
     """
     Extract time series features for predictive modeling.
     
     Args:
         df (pd.DataFrame): Preprocessed trend data
-        window_size (int): Window size for rolling features
+        window_size (int): Window size for rolling features, in days
+        resolution (str): Bucket width of the rows ('hour', 'day' or 'week')
         
     Returns:
         pd.DataFrame: Feature matrix for modeling
     """
+    window_size = window_periods(window_size, resolution)
     if len(df) < window_size:
         raise ValueError(f"DataFrame must have at least {window_size} rows for feature extraction")
     
@@ -58,30 +84,35 @@ def extract_features(df, window_size=7):
     
     if 'engagement' in df.columns:
         # Time series features
-        features['mean_engagement'] = df['engagement'].rolling(window=window_size).mean().values[-1]
-        features['std_engagement'] = df['engagement'].rolling(window=window_size).std().values[-1]
-        features['max_engagement'] = df['engagement'].rolling(window=window_size).max().values[-1]
-        features['min_engagement'] = df['engagement'].rolling(window=window_size).min().values[-1]
+        features['mean_engagement'] = [df['engagement'].rolling(window=window_size).mean().values[-1]]
+        features['std_engagement'] = [df['engagement'].rolling(window=window_size).std().values[-1]]
+        features['max_engagement'] = [df['engagement'].rolling(window=window_size).max().values[-1]]
+        features['min_engagement'] = [df['engagement'].rolling(window=window_size).min().values[-1]]
         
         # Growth and trend features
-        features['mean_growth'] = df['growth'].rolling(window=window_size).mean().values[-1]
-        features['growth_volatility'] = df['growth'].rolling(window=window_size).std().values[-1]
+        features['mean_growth'] = [df['growth'].rolling(window=window_size).mean().values[-1]]
+        features['growth_volatility'] = [df['growth'].rolling(window=window_size).std().values[-1]]
         
         # Momentum and acceleration
-        features['momentum'] = (df['engagement'].values[-1] / df['engagement'].values[-window_size]) - 1
-        features['mean_acceleration'] = df['acceleration'].rolling(window=window_size).mean().values[-1]
+        features['momentum'] = [(df['engagement'].values[-1] / df['engagement'].values[-window_size]) - 1]
+        features['mean_acceleration'] = [df['acceleration'].rolling(window=window_size).mean().values[-1]]
     
     return features
 
-def normalize_features(features):
+def normalize_features(features, scaler=None, model_path='models/trained/virality_predictor.pkl'):
     """
-    Normalize features for model input.
+    Normalize features for model input with the scaler stored next to the model.
     
     Args:
         features (pd.DataFrame): Feature matrix
+        scaler (RunningScaler, optional): Preloaded scaler; skips loading from model_path
+        model_path (str): Path to the model whose scaler is applied
         
     Returns:
-        np.array: Normalized features
+        np.ndarray: Normalized features
     """
-    scaler = StandardScaler()
-    return scaler.fit_transform(features.values.reshape(1, -1))
\ No newline at end of file
+    if scaler is None:
+        from models.feature_scaler import load_scaler
+        scaler = load_scaler(model_path)
+    
+    return scaler.transform(features)
\ No newline at end of file
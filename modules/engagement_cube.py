@@ -0,0 +1,160 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from modules.parameters import GENRES, REGIONS
+
+# Selecting this region means every region; it is answered from a rollup
+GLOBAL_REGION = REGIONS[0]
+
+# Regions and genres that raw rows are recorded under
+CUBE_REGIONS = tuple(region for region in REGIONS if region != GLOBAL_REGION)
+CUBE_GENRES = tuple(GENRES)
+
+# Day capacity added when ingested rows run past the allocated days
+DAY_CHUNK = 64
+
+def _codes(values, categories, name):
+    codes = pd.Categorical(values, categories=categories).codes.astype(np.int64)
+    if (codes < 0).any():
+        unknown = sorted(set(pd.Series(values)[codes < 0].astype(str)))
+        raise ValueError(f"Unknown {name}: {unknown}")
+    return codes
+
+def _day_number(day):
+    return int(np.datetime64(pd.Timestamp(day).date(), 'D').astype(np.int64))
+
+class EngagementCube:
+    """
+    Pre-aggregated engagement sums and row counts by (region, genre, day).
+
+    Rows are aggregated into cells once, on ingest; queries only add up
+    cells. A second array keeps the rollup over all regions per (genre,
+    day), which answers any selection containing GLOBAL_REGION. New days
+    extend the day axis in place, so the cube grows incrementally as
+    rows arrive.
+
+    Args:
+        regions (sequence): Regions rows may belong to
+        genres (sequence): Genres rows may belong to
+    """
+    def __init__(self, regions=CUBE_REGIONS, genres=CUBE_GENRES):
+        self.regions = tuple(regions)
+        self.genres = tuple(genres)
+        # Days are stored as integer day numbers (days since 1970-01-01)
+        self._start = None
+        self.n_days = 0
+        self.n_rows = 0
+        # Bumped on every ingest, so callers can key caches on the cube's contents
+        self.version = 0
+        self._sums = np.zeros((len(self.regions), len(self.genres), 0))
+        self._counts = np.zeros((len(self.regions), len(self.genres), 0), dtype=np.int64)
+        self._global_sums = np.zeros((len(self.genres), 0))
+        self._global_counts = np.zeros((len(self.genres), 0), dtype=np.int64)
+        self._lock = threading.Lock()
+
+    @property
+    def start(self):
+        """First day with cells (np.datetime64), or None when the cube is empty."""
+        return None if self._start is None else np.datetime64(self._start, 'D')
+
+    @property
+    def end(self):
+        """Last day with cells (np.datetime64), or None when the cube is empty."""
+        return None if self._start is None else np.datetime64(self._start + self.n_days - 1, 'D')
+
+    def _grow(self, first, last):
+        # Extend the day axis to cover first..last, keeping DAY_CHUNK spare days at the end
+        start = first if self._start is None else min(self._start, first)
+        shift = 0 if self._start is None else self._start - start
+        n_days = max(shift + self.n_days, last - start + 1)
+        capacity = self._sums.shape[-1]
+        if shift == 0 and n_days <= capacity:
+            self._start, self.n_days = start, n_days
+            return
+
+        new_capacity = n_days + DAY_CHUNK
+        for name in ('_sums', '_counts', '_global_sums', '_global_counts'):
+            old = getattr(self, name)
+            new = np.zeros(old.shape[:-1] + (new_capacity,), dtype=old.dtype)
+            new[..., shift:shift + self.n_days] = old[..., :self.n_days]
+            setattr(self, name, new)
+        self._start, self.n_days = start, n_days
+
+    def ingest(self, rows):
+        """
+        Aggregate raw engagement rows into the cube.
+
+        Args:
+            rows (pd.DataFrame): date, region, genre and engagement columns,
+                such as generate_engagement_events returns
+        """
+        if len(rows) == 0:
+            return
+        days = rows['date'].to_numpy().astype('datetime64[D]').astype(np.int64)
+        region_codes = _codes(rows['region'], self.regions, 'regions')
+        genre_codes = _codes(rows['genre'], self.genres, 'genres')
+        engagement = rows['engagement'].to_numpy(dtype=np.float64)
+
+        with self._lock:
+            self._grow(int(days.min()), int(days.max()))
+            offsets = days - self._start
+
+            # One bincount over flattened (region, genre, day) cells aggregates every row
+            n_cells = len(self.regions) * len(self.genres) * self.n_days
+            cells = (region_codes * len(self.genres) + genre_codes) * self.n_days + offsets
+            shape = (len(self.regions), len(self.genres), self.n_days)
+            sums = np.bincount(cells, weights=engagement, minlength=n_cells).reshape(shape)
+            counts = np.bincount(cells, minlength=n_cells).reshape(shape)
+
+            self._sums[..., :self.n_days] += sums
+            self._counts[..., :self.n_days] += counts
+            self._global_sums[:, :self.n_days] += sums.sum(axis=0)
+            self._global_counts[:, :self.n_days] += counts.sum(axis=0)
+            self.n_rows += len(rows)
+            self.version += 1
+
+    def _day_range(self, start, end):
+        # Slice of the day axis covering start..end, clipped to the cube
+        first = 0 if start is None else max(0, _day_number(start) - self._start)
+        last = self.n_days if end is None else min(self.n_days, _day_number(end) - self._start + 1)
+        return first, max(first, last)
+
+    def query(self, regions, genres=None, start=None, end=None):
+        """
+        Daily engagement of a region and genre selection.
+
+        Args:
+            regions (str or sequence): Selected regions; any selection containing
+                GLOBAL_REGION covers all regions
+            genres (str or sequence, optional): Selected genres; None for all genres
+            start (date-like, optional): First day, inclusive
+            end (date-like, optional): Last day, inclusive
+
+        Returns:
+            pd.DataFrame: date, engagement (sum) and count (rows) per day
+        """
+        regions = [regions] if isinstance(regions, str) else list(regions)
+        genres = list(self.genres) if genres is None else [genres] if isinstance(genres, str) else list(genres)
+        genre_codes = _codes(genres, self.genres, 'genres')
+
+        if self._start is None:
+            return pd.DataFrame({'date': pd.Series([], dtype='datetime64[ns]'), 'engagement': [], 'count': []})
+        first, last = self._day_range(start, end)
+
+        with self._lock:
+            if GLOBAL_REGION in regions:
+                sums = self._global_sums[genre_codes, first:last].sum(axis=0)
+                counts = self._global_counts[genre_codes, first:last].sum(axis=0)
+            else:
+                region_codes = _codes(regions, self.regions, 'regions')
+                cells = np.ix_(region_codes, genre_codes, np.arange(first, last))
+                sums = self._sums[cells].sum(axis=(0, 1))
+                counts = self._counts[cells].sum(axis=(0, 1))
+
+        return pd.DataFrame({
+            'date': pd.to_datetime(np.arange(self._start + first, self._start + last).astype('datetime64[D]')),
+            'engagement': sums,
+            'count': counts
+        })
@@ -0,0 +1,207 @@
+import hashlib
+import json
+import sqlite3
+
+import numpy as np
+
+# Host parameters per SQLite statement stay under the default limit of 999
+LOOKUP_BATCH_SIZE = 900
+
+def feature_version_key(name, columns, version):
+    """
+    Build the version key stored with each feature row.
+
+    The key changes when the feature set's version number or its columns
+    change, so rows computed by older extractors are treated as stale.
+
+    Args:
+        name (str): Feature set name
+        columns (sequence): Feature column names in order
+        version (int): Version number of the extractor
+
+    Returns:
+        str: Version key such as 'pipeline-v1-3f2a9c1e'
+    """
+    digest = hashlib.sha256(",".join(columns).encode()).hexdigest()[:8]
+    return f"{name}-v{version}-{digest}"
+
+def input_hash(*inputs):
+    """
+    Hash the inputs a feature row was computed from.
+
+    Args:
+        *inputs: JSON-serializable values, such as parameters and a seed
+
+    Returns:
+        str: Short digest stored with the row
+    """
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+class FeatureStore:
+    """
+    Feature rows persisted in SQLite, keyed by (track_id, as_of_date, feature_version).
+
+    Each row also records the hash of the inputs it was computed from;
+    a lookup with a different input hash treats the row as stale. Vectors
+    are stored as raw bytes in the given dtype, so point lookups and bulk
+    reads return numpy arrays without per-column parsing.
+    """
+    def __init__(self, path, name, columns, version, dtype=np.float64):
+        self.path = path
+        self.columns = tuple(columns)
+        self.dtype = np.dtype(dtype)
+        self.feature_version = feature_version_key(name, self.columns, version)
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS features ("
+            "track_id TEXT NOT NULL, as_of_date TEXT NOT NULL, feature_version TEXT NOT NULL, "
+            "vector BLOB NOT NULL, input_hash TEXT NOT NULL DEFAULT '', "
+            "PRIMARY KEY (track_id, as_of_date, feature_version)) WITHOUT ROWID"
+        )
+        # Stores created before input hashes get the column; their rows never match a hash
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(features)")]
+        if 'input_hash' not in columns:
+            self._conn.execute("ALTER TABLE features ADD COLUMN input_hash TEXT NOT NULL DEFAULT ''")
+        self._conn.commit()
+
+    def _decode(self, blob):
+        return np.frombuffer(blob, dtype=self.dtype)
+
+    def get(self, track_id, as_of_date, input_hash=''):
+        """
+        Look up one feature row.
+
+        Args:
+            track_id: Track identifier
+            as_of_date (str): ISO date the features describe
+            input_hash (str): Hash of the inputs the row must have been computed from
+
+        Returns:
+            np.ndarray or None: Stored vector, or None if missing or stale
+        """
+        row = self._conn.execute(
+            "SELECT vector FROM features WHERE track_id = ? AND as_of_date = ? AND feature_version = ? "
+            "AND input_hash = ?",
+            (str(track_id), as_of_date, self.feature_version, input_hash)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._decode(row[0])
+
+    def get_many(self, track_ids, as_of_date, input_hashes=None):
+        """
+        Look up the feature rows of many tracks for one day.
+
+        Args:
+            track_ids (iterable): Track identifiers
+            as_of_date (str): ISO date the features describe
+            input_hashes (dict, optional): Input hash each track's row must
+                have been computed from, keyed by track id
+
+        Returns:
+            dict: Stored vectors keyed by the given track ids; missing or
+                stale keys are absent
+        """
+        input_hashes = input_hashes or {}
+        by_key = {str(track_id): track_id for track_id in track_ids}
+        keys = list(by_key)
+        found = {}
+        for start in range(0, len(keys), LOOKUP_BATCH_SIZE):
+            batch = keys[start:start + LOOKUP_BATCH_SIZE]
+            rows = self._conn.execute(
+                f"SELECT track_id, vector, input_hash FROM features WHERE as_of_date = ? AND feature_version = ? "
+                f"AND track_id IN ({','.join('?' * len(batch))})",
+                (as_of_date, self.feature_version, *batch)
+            )
+            for track_id, blob, stored_hash in rows:
+                track_id = by_key[track_id]
+                if stored_hash == input_hashes.get(track_id, ''):
+                    found[track_id] = self._decode(blob)
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items, as_of_date, input_hashes=None):
+        """
+        Store feature rows for one day in a single transaction.
+
+        Args:
+            items (iterable): (track_id, vector) pairs
+            as_of_date (str): ISO date the features describe
+            input_hashes (dict, optional): Hash of the inputs each track's
+                vector was computed from, keyed by track id
+        """
+        input_hashes = input_hashes or {}
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO features (track_id, as_of_date, feature_version, vector, input_hash) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(str(track_id), as_of_date, self.feature_version,
+                  np.ascontiguousarray(vector, dtype=self.dtype).tobytes(), input_hashes.get(track_id, ''))
+                 for track_id, vector in items]
+            )
+
+    def read_day(self, as_of_date):
+        """
+        Bulk-read every current feature row for one day.
+
+        Returns:
+            tuple: (track_ids, matrix) with one row per track
+        """
+        rows = self._conn.execute(
+            "SELECT track_id, vector FROM features WHERE as_of_date = ? AND feature_version = ? ORDER BY track_id",
+            (as_of_date, self.feature_version)
+        ).fetchall()
+        track_ids = [track_id for track_id, _ in rows]
+        matrix = np.frombuffer(b"".join(blob for _, blob in rows), dtype=self.dtype)
+        return track_ids, matrix.reshape(len(rows), len(self.columns))
+
+    def purge_stale(self):
+        """
+        Delete rows written by other feature versions.
+
+        Returns:
+            int: Number of rows deleted
+        """
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM features WHERE feature_version != ?", (self.feature_version,))
+        return cursor.rowcount
+
+    def summary(self):
+        lookups = self.hits + self.misses
+        return {
+            'feature_version': self.feature_version,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def pipeline_feature_store(path):
+    """
+    Open a store for the features extract_features computes for the prediction pipeline.
+
+    Args:
+        path (str): SQLite database file
+
+    Returns:
+        FeatureStore: Store keyed by the pipeline feature version
+    """
+    from modules.data_processing import FEATURE_NAMES, FEATURE_VERSION
+    return FeatureStore(path, 'pipeline', FEATURE_NAMES, FEATURE_VERSION)
@@ -0,0 +1,118 @@
+import numpy as np
+
+# Smoothing weights searched for each series: alpha for the level, and beta
+# for the trend as a fraction of alpha
+ALPHA_GRID = np.linspace(0.1, 1.0, 10)
+BETA_GRID = np.array([0.02, 0.05, 0.1, 0.2, 0.4])
+
+# Damping of the trend per day, searched for each series; 1 would keep a
+# straight-line trend. Weaker damping is left out: one-step errors favour
+# it, but it carries early trends too far over a 14-day horizon
+DAMPING_GRID = np.array([0.6, 0.75, 0.9])
+
+# Days of history used to start the trend estimate
+INIT_TREND_DAYS = 7
+
+# Series fitted per vectorized pass, bounding memory to about
+# FIT_BLOCK_SIZE * len(ALPHA_GRID) * len(BETA_GRID) * len(DAMPING_GRID) values per array
+FIT_BLOCK_SIZE = 4096
+
+def _fit_block(history, alphas, betas, dampings):
+    n_series, n_days = history.shape
+    m = min(INIT_TREND_DAYS, n_days - 1)
+
+    # Every series is fitted for every grid point at once: arrays are (series, grid)
+    level = np.repeat(history[:, :1], len(alphas), axis=1)
+    trend = np.repeat((history[:, m:m + 1] - history[:, :1]) / max(m, 1), len(alphas), axis=1)
+    sse = np.zeros_like(level)
+    error = np.empty_like(level)
+    scratch = np.empty_like(level)
+    trend_gain = alphas * betas
+
+    for t in range(1, n_days):
+        # One-step forecast, its error, then the error-correction updates
+        np.multiply(trend, dampings, out=trend)
+        np.add(level, trend, out=level)
+        np.subtract(history[:, t:t + 1], level, out=error)
+        np.multiply(error, error, out=scratch)
+        sse += scratch
+        np.multiply(error, alphas, out=scratch)
+        level += scratch
+        np.multiply(error, trend_gain, out=scratch)
+        trend += scratch
+
+    best = np.argmin(sse, axis=1)
+    rows = np.arange(n_series)
+    return {
+        'level': level[rows, best],
+        'trend': trend[rows, best],
+        'alpha': alphas[best],
+        'beta': betas[best],
+        'damping': dampings[best],
+        'rmse': np.sqrt(sse[rows, best] / max(n_days - 1, 1))
+    }
+
+def fit_holt(history, alphas=ALPHA_GRID, betas=BETA_GRID, dampings=DAMPING_GRID):
+    """
+    Fit damped-trend Holt exponential smoothing to many series at once.
+
+    Each series gets the (alpha, beta, damping) triple from the grid with
+    the smallest one-step-ahead squared error over its history. The recursion runs once
+    per day over a (series x grid) array, so the cost is a few array
+    operations per day rather than a Python loop per series.
+
+    Args:
+        history (np.ndarray): (n_series, n_days) engagement history, oldest day first
+        alphas (np.ndarray): Level smoothing weights to search
+        betas (np.ndarray): Trend smoothing weights to search, as fractions of alpha
+        dampings (np.ndarray): Trend damping factors per day to search
+
+    Returns:
+        dict: Arrays with one value per series: level and trend after the
+            last day, chosen alpha, beta and damping, and rmse of the
+            one-step errors
+    """
+    history = np.atleast_2d(np.asarray(history, dtype=np.float64))
+    if history.shape[1] < 2:
+        raise ValueError(f"Need at least 2 days of history, got {history.shape[1]}")
+
+    grid_alphas, grid_betas, grid_dampings = (grid.ravel() for grid in
+                                              np.meshgrid(alphas, betas, dampings, indexing='ij'))
+    blocks = [_fit_block(history[start:start + FIT_BLOCK_SIZE], grid_alphas, grid_betas, grid_dampings)
+              for start in range(0, len(history), FIT_BLOCK_SIZE)]
+    return {key: np.concatenate([block[key] for block in blocks]) for key in blocks[0]}
+
+def forecast_holt(fit, horizon):
+    """
+    Forecast fitted series forward.
+
+    Args:
+        fit (dict): Result of fit_holt
+        horizon (int): Days to forecast
+
+    Returns:
+        np.ndarray: (n_series, horizon) forecasts for days 1..horizon after the history
+    """
+    # Cumulative damped trend multiplier of each series: phi + phi^2 + ... + phi^h
+    multipliers = np.cumsum(fit['damping'][:, None] ** np.arange(1, horizon + 1), axis=1)
+    return fit['level'][:, None] + fit['trend'][:, None] * multipliers
+
+def forecast_trend_data(trend_data):
+    """
+    Replace the forecast rows of a trend frame with a Holt forecast of its history.
+
+    Args:
+        trend_data (pd.DataFrame): Frame with date, engagement and is_forecast
+            columns, such as generate_mock_trend_data returns
+
+    Returns:
+        pd.DataFrame: Copy of the frame whose forecast engagement continues the
+            smoothed level and damped trend of the historical rows
+    """
+    is_forecast = trend_data['is_forecast'].to_numpy()
+    history = trend_data.loc[~is_forecast, 'engagement'].to_numpy()
+    forecast = forecast_holt(fit_holt(history), int(is_forecast.sum()))[0]
+
+    trend_data = trend_data.copy()
+    trend_data.loc[is_forecast, 'engagement'] = np.maximum(np.rint(forecast), 0).astype(trend_data['engagement'].dtype)
+    return trend_data
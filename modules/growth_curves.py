@@ -0,0 +1,232 @@
+import numpy as np
+
+# Saturating growth models fitted to engagement histories
+GROWTH_MODELS = ('logistic', 'gompertz')
+
+# A trend is over once daily growth falls below this fraction of its peak
+DECAY_FRACTION = 0.1
+
+# Levenberg-Marquardt settings: iterations, relative change in error or
+# parameters that counts as converged, and the initial and largest damping
+MAX_ITERATIONS = 200
+TOLERANCE = 1e-5
+INITIAL_DAMPING = 1e-2
+MAX_DAMPING = 1e8
+
+# Parameter bounds in fitting units: capacity as a multiple of the series
+# maximum, rate per history window, inflection as a fraction of the window
+PARAM_BOUNDS = np.array([
+    [0.05, 10.0],
+    [0.1, 200.0],
+    [-1.0, 3.0]
+])
+
+# Series fitted per vectorized pass
+FIT_BLOCK_SIZE = 16384
+
+def _evaluate(model, params, tau):
+    # Model values and Jacobian for (capacity, rate, inflection) at the given times
+    capacity, rate, center = params[:, 0:1], params[:, 1:2], params[:, 2:3]
+    x = np.clip(rate * (tau - center), -50, 50)
+    if model == 'logistic':
+        shape = 1 / (1 + np.exp(-x))
+        slope = shape * (1 - shape)
+    else:
+        decay = np.exp(-x)
+        shape = np.exp(-decay)
+        slope = shape * decay
+
+    values = capacity * shape
+    # Parameter-major (3, n_curves, n_days), so each derivative is one contiguous block
+    jacobian = np.empty((3,) + values.shape)
+    jacobian[0] = shape
+    np.multiply(capacity * slope, tau - center, out=jacobian[1])
+    np.multiply(slope, -capacity * rate, out=jacobian[2])
+    return values, jacobian
+
+def _normal_equations(jacobian, residuals):
+    # J^T J and J^T r of every curve, from the six distinct products of the symmetric matrix
+    normal = np.empty((jacobian.shape[1], 3, 3))
+    for i in range(3):
+        for j in range(i, 3):
+            normal[:, i, j] = normal[:, j, i] = np.einsum('nt,nt->n', jacobian[i], jacobian[j])
+    gradient = np.stack([np.einsum('nt,nt->n', jacobian[i], residuals) for i in range(3)], axis=1)
+    return normal, gradient
+
+def _solve3(a, b):
+    # Batched 3x3 solve by cofactors, much faster than np.linalg.solve on tiny systems
+    c00 = a[:, 1, 1] * a[:, 2, 2] - a[:, 1, 2] * a[:, 2, 1]
+    c01 = a[:, 1, 2] * a[:, 2, 0] - a[:, 1, 0] * a[:, 2, 2]
+    c02 = a[:, 1, 0] * a[:, 2, 1] - a[:, 1, 1] * a[:, 2, 0]
+    c11 = a[:, 0, 0] * a[:, 2, 2] - a[:, 0, 2] * a[:, 2, 0]
+    c12 = a[:, 0, 1] * a[:, 2, 0] - a[:, 0, 0] * a[:, 2, 1]
+    c22 = a[:, 0, 0] * a[:, 1, 1] - a[:, 0, 1] * a[:, 1, 0]
+    det = a[:, 0, 0] * c00 + a[:, 0, 1] * c01 + a[:, 0, 2] * c02
+    det = np.where(np.abs(det) > 1e-300, det, 1e-300)
+    # The damped normal matrix is symmetric, so the cofactor matrix is too
+    return np.stack([
+        c00 * b[:, 0] + c01 * b[:, 1] + c02 * b[:, 2],
+        c01 * b[:, 0] + c11 * b[:, 1] + c12 * b[:, 2],
+        c02 * b[:, 0] + c12 * b[:, 1] + c22 * b[:, 2]
+    ], axis=1) / det[:, None]
+
+def _initial_params(model, y):
+    # Capacity a little above the observed maximum, inflection where the
+    # curve first reaches the model's inflection height
+    n_series, n_days = y.shape
+    capacity = 1.2
+    height = capacity / 2 if model == 'logistic' else capacity / np.e
+    reached = y >= height
+    first = np.where(reached.any(axis=1), reached.argmax(axis=1), n_days - 1)
+    return np.column_stack([
+        np.full(n_series, capacity),
+        np.full(n_series, 10.0),
+        first / max(n_days - 1, 1)
+    ])
+
+def _fit_block(model, y):
+    n_series, n_days = y.shape
+    tau = np.linspace(0, 1, n_days)
+    params = _initial_params(model, y)
+    values, jacobian = _evaluate(model, params, tau)
+    residuals = y - values
+    sse = np.einsum('nt,nt->n', residuals, residuals)
+    damping = np.full(n_series, INITIAL_DAMPING)
+    converged = np.zeros(n_series, dtype=bool)
+    iterations = np.zeros(n_series, dtype=np.int32)
+
+    active = np.arange(n_series)
+    for _ in range(MAX_ITERATIONS):
+        if len(active) == 0:
+            break
+        # Marquardt damping scales the diagonal, so each parameter's step adapts to its own curvature
+        normal, gradient = _normal_equations(jacobian[:, active], residuals[active])
+        diagonal = np.arange(3)
+        normal[:, diagonal, diagonal] *= 1 + damping[active, None]
+        normal[:, diagonal, diagonal] += 1e-12
+        step = _solve3(normal, gradient)
+
+        trial = np.clip(params[active] + step, PARAM_BOUNDS[:, 0], PARAM_BOUNDS[:, 1])
+        change = np.abs(trial - params[active]).max(axis=1)
+        trial_values, trial_jacobian = _evaluate(model, trial, tau)
+        trial_residuals = y[active] - trial_values
+        trial_sse = np.einsum('nt,nt->n', trial_residuals, trial_residuals)
+
+        iterations[active] += 1
+        improved = trial_sse < sse[active]
+        accepted = active[improved]
+        gain = sse[accepted] - trial_sse[improved]
+        params[accepted] = trial[improved]
+        jacobian[:, accepted] = trial_jacobian[:, improved]
+        residuals[accepted] = trial_residuals[improved]
+        damping[accepted] /= 10
+        damping[active[~improved]] *= 10
+
+        # Converged once an accepted step barely changes the error or the parameters
+        done = np.zeros(len(active), dtype=bool)
+        small_step = change[improved] <= TOLERANCE * (1 + np.abs(trial[improved]).max(axis=1))
+        done[improved] = (gain <= TOLERANCE * sse[accepted] + 1e-12) | small_step
+        sse[accepted] = trial_sse[improved]
+        # A step that cannot improve even when fully damped means we are at a minimum
+        done |= damping[active] >= MAX_DAMPING
+        converged[active[done]] = True
+        active = active[~done]
+
+    return params, sse, converged, iterations
+
+def _decay_offset(model, rate):
+    # Time after the inflection at which growth falls to DECAY_FRACTION of its peak
+    if model == 'logistic':
+        # Growth is proportional to s(1 - s), which peaks at 1/4
+        share = (1 + np.sqrt(1 - DECAY_FRACTION)) / 2
+        return np.log(share / (1 - share)) / rate
+    # Growth is proportional to u * exp(-u) with u = exp(-x), which peaks at u = 1
+    from scipy.special import lambertw
+    u = -lambertw(-DECAY_FRACTION / np.e, 0).real
+    return -np.log(u) / rate
+
+def fit_growth_curves(curves, model='logistic'):
+    """
+    Fit a saturating growth model to many engagement curves at once.
+
+    Runs Levenberg-Marquardt on every curve in parallel: each iteration
+    builds the 3x3 normal equations of all curves with einsum, solves them
+    in closed form, and accepts or rejects each curve's step separately.
+    Curves drop out of the batch as they converge.
+
+    Args:
+        curves (np.ndarray): (n_curves, n_days) engagement values, oldest day first
+        model (str): 'logistic' (symmetric S-curve) or 'gompertz' (fast rise, long tail)
+
+    Returns:
+        dict: Arrays with one value per curve: carrying_capacity (engagement
+            the curve saturates at), growth_rate (per day), inflection_day
+            (day of peak growth, 0 = first day), decay_day (day growth falls
+            to DECAY_FRACTION of its peak), rmse, converged and iterations
+    """
+    if model not in GROWTH_MODELS:
+        raise ValueError(f"Unknown growth model: {model!r}")
+    curves = np.atleast_2d(np.asarray(curves, dtype=np.float64))
+    n_days = curves.shape[1]
+    if n_days < 4:
+        raise ValueError(f"Need at least 4 days of history, got {n_days}")
+
+    # Fit in units of each curve's maximum and of the whole window
+    scale = curves.max(axis=1)
+    scale = np.where(scale > 0, scale, 1)
+    blocks = [_fit_block(model, curves[start:start + FIT_BLOCK_SIZE] / scale[start:start + FIT_BLOCK_SIZE, None])
+              for start in range(0, len(curves), FIT_BLOCK_SIZE)]
+    params, sse, converged, iterations = (np.concatenate(parts) for parts in zip(*blocks))
+
+    window = n_days - 1
+    rate = params[:, 1] / window
+    inflection = params[:, 2] * window
+    return {
+        'carrying_capacity': params[:, 0] * scale,
+        'growth_rate': rate,
+        'inflection_day': inflection,
+        'decay_day': inflection + _decay_offset(model, rate),
+        'rmse': np.sqrt(sse / n_days) * scale,
+        'converged': converged,
+        'iterations': iterations
+    }
+
+def fit_best_growth_curves(curves):
+    """
+    Fit every model in GROWTH_MODELS and keep the better fit of each curve.
+
+    Args:
+        curves (np.ndarray): (n_curves, n_days) engagement values
+
+    Returns:
+        dict: fit_growth_curves arrays taken from the model with the lower
+            rmse per curve, plus a 'model' array naming it
+    """
+    fits = [fit_growth_curves(curves, model) for model in GROWTH_MODELS]
+    best = np.argmin(np.stack([fit['rmse'] for fit in fits]), axis=0)
+    rows = np.arange(len(best))
+    combined = {key: np.stack([fit[key] for fit in fits])[best, rows] for key in fits[0]}
+    combined['model'] = np.array(GROWTH_MODELS)[best]
+    return combined
+
+def growth_curve_summary(history):
+    """
+    Fit growth curves to one track's history and summarize the better fit.
+
+    Args:
+        history (np.ndarray): Engagement history, oldest day first
+
+    Returns:
+        dict: model, carrying_capacity, inflection_day and decay_day (days
+            from the first day of history), remaining_days (days after the
+            last observed day until growth decays) and converged
+    """
+    fit = fit_best_growth_curves(np.asarray(history, dtype=np.float64).reshape(1, -1))
+    return {
+        'model': str(fit['model'][0]),
+        'carrying_capacity': float(fit['carrying_capacity'][0]),
+        'inflection_day': float(fit['inflection_day'][0]),
+        'decay_day': float(fit['decay_day'][0]),
+        'remaining_days': max(0.0, float(fit['decay_day'][0]) - (len(history) - 1)),
+        'converged': bool(fit['converged'][0])
+    }
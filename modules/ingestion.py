@@ -0,0 +1,295 @@
+import asyncio
+import time
+import urllib.parse
+import urllib.request
+
+import pandas as pd
+
+from modules.spike_detector import EVENT_COLUMNS, parse_event_lines
+
+# Parsed batches each feed may have waiting for the writer; a full queue
+# stops the feed's consumer from reading until the writer catches up
+QUEUE_MAX_BATCHES = 8
+
+# Most lines per parsed batch, and most events per store write
+READ_BATCH_LINES = 10_000
+WRITE_BATCH_ROWS = 50_000
+
+# Seconds between checks of a file or HTTP feed that had nothing new
+POLL_INTERVAL = 0.2
+
+# Bytes read from a file or socket at a time
+READ_CHUNK_BYTES = 1 << 20
+
+def _complete_lines(partial, chunk):
+    # Split off complete lines, returning them with the unfinished remainder
+    text = partial + chunk
+    end = text.rfind("\n") + 1
+    header = ",".join(EVENT_COLUMNS)
+    lines = [line + "\n" for line in text[:end].splitlines() if line.strip() and not line.startswith(header)]
+    return lines, text[end:]
+
+async def file_feed(path, follow=True, poll_interval=POLL_INTERVAL):
+    """
+    Read `timestamp,track_id,engagement` lines from a file as it grows.
+
+    Args:
+        path (str): Event file; it may not exist yet when following
+        follow (bool): Keep waiting for lines appended to the file
+        poll_interval (float): Seconds between checks for new lines
+
+    Yields:
+        list: Complete lines, in file order
+    """
+    while True:
+        try:
+            f = open(path)
+            break
+        except FileNotFoundError:
+            if not follow:
+                return
+            await asyncio.sleep(poll_interval)
+
+    partial = ""
+    with f:
+        while True:
+            chunk = f.read(READ_CHUNK_BYTES)
+            if chunk:
+                lines, partial = _complete_lines(partial, chunk)
+                if lines:
+                    yield lines
+            elif follow:
+                await asyncio.sleep(poll_interval)
+            else:
+                if partial.strip():
+                    yield [partial + "\n"]
+                return
+
+async def socket_feed(host, port):
+    """
+    Read `timestamp,track_id,engagement` lines from a TCP connection until it closes.
+
+    Yields:
+        list: Complete lines, in arrival order
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    partial = ""
+    try:
+        while True:
+            chunk = await reader.read(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            lines, partial = _complete_lines(partial, chunk.decode())
+            if lines:
+                yield lines
+        if partial.strip():
+            yield [partial + "\n"]
+    finally:
+        writer.close()
+
+def _http_get(url):
+    with urllib.request.urlopen(url, timeout=30) as response:
+        return response.read().decode()
+
+async def http_feed(url, follow=True, poll_interval=POLL_INTERVAL):
+    """
+    Poll an HTTP endpoint for `timestamp,track_id,engagement` lines.
+
+    Each request passes `offset`, the number of lines received so far, and
+    the endpoint answers with the lines after it (an empty body when there
+    are none yet).
+
+    Args:
+        url (str): Endpoint URL
+        follow (bool): Keep polling after an empty answer
+        poll_interval (float): Seconds between polls that returned nothing
+
+    Yields:
+        list: Complete lines, in endpoint order
+    """
+    offset = 0
+    separator = '&' if urllib.parse.urlparse(url).query else '?'
+    while True:
+        body = await asyncio.to_thread(_http_get, f"{url}{separator}offset={offset}")
+        lines, _ = _complete_lines("", body if body.endswith("\n") or not body else body + "\n")
+        if lines:
+            offset += len(lines)
+            yield lines
+        elif follow:
+            await asyncio.sleep(poll_interval)
+        else:
+            return
+
+def open_feed(spec, follow=True):
+    """
+    Open a feed from its specification.
+
+    Args:
+        spec (str): 'file:PATH', 'tcp:HOST:PORT' or an http(s):// URL
+        follow (bool): Keep reading file and HTTP feeds after they run dry
+
+    Returns:
+        async iterator: Lists of event lines
+
+    Raises:
+        ValueError: If the specification has no known scheme
+    """
+    if spec.startswith('file:'):
+        return file_feed(spec[len('file:'):], follow=follow)
+    if spec.startswith('tcp:'):
+        host, _, port = spec[len('tcp:'):].rpartition(':')
+        return socket_feed(host or '127.0.0.1', int(port))
+    if spec.startswith(('http://', 'https://')):
+        return http_feed(spec, follow=follow)
+    raise ValueError(f"Unknown feed {spec!r}; expected file:PATH, tcp:HOST:PORT or an http(s):// URL")
+
+class FeedMetrics:
+    """
+    Counters of one platform feed.
+
+    Lag is event-time lag: how far the newest written event is behind now,
+    both in UTC. Dropped counts lines that could not be parsed.
+    """
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.received = 0
+        self.dropped = 0
+        self.written = 0
+        self.writes = 0
+        self.write_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self.max_queued = 0
+        self.newest_event = None
+
+    def summary(self, queued_batches):
+        elapsed = time.perf_counter() - self.started
+        lag = None
+        if self.newest_event is not None:
+            lag = (pd.Timestamp.now(tz='UTC').tz_localize(None) - self.newest_event).total_seconds()
+        return {
+            'received': self.received,
+            'dropped': self.dropped,
+            'written': self.written,
+            'queued_batches': queued_batches,
+            'events_per_second': self.written / elapsed if elapsed else 0.0,
+            'write_ms': self.write_seconds / self.writes * 1000 if self.writes else 0.0,
+            'blocked_seconds': self.blocked_seconds,
+            'max_queued_batches': self.max_queued,
+            'lag_seconds': lag
+        }
+
+class IngestionService:
+    """
+    Ingest per-platform engagement feeds into a TrendStore.
+
+    Every platform feed gets a consumer task that parses its lines into
+    batches and a writer task that coalesces the queued batches into
+    WRITE_BATCH_ROWS-sized store writes, run in a worker thread. The
+    queue between them holds at most QUEUE_MAX_BATCHES batches: when the
+    store falls behind, consumers stop reading, and a socket feed's
+    sender is slowed down by TCP flow control.
+
+    Args:
+        store (TrendStore): Store written to
+        feeds (dict): Async iterators of event lines, keyed by platform
+        queue_batches (int): Queue bound per feed
+        write_rows (int): Events per store write
+    """
+    def __init__(self, store, feeds, queue_batches=QUEUE_MAX_BATCHES, write_rows=WRITE_BATCH_ROWS):
+        self.store = store
+        self.feeds = dict(feeds)
+        self.queue_batches = queue_batches
+        self.write_rows = write_rows
+        self._queues = {}
+        self._metrics = {platform: FeedMetrics() for platform in self.feeds}
+
+    async def _consume(self, platform, feed, queue):
+        metrics = self._metrics[platform]
+        async for lines in feed:
+            for start in range(0, len(lines), READ_BATCH_LINES):
+                batch = lines[start:start + READ_BATCH_LINES]
+                # A malformed batch is dropped rather than ending this and every other feed
+                try:
+                    events = parse_event_lines(batch)
+                except (ValueError, pd.errors.ParserError):
+                    metrics.dropped += len(batch)
+                    continue
+                metrics.dropped += len(batch) - len(events)
+                metrics.received += len(events)
+                began = time.perf_counter()
+                await queue.put(events)
+                metrics.blocked_seconds += time.perf_counter() - began
+                metrics.max_queued = max(metrics.max_queued, queue.qsize())
+        # Tells the writer the feed ended
+        await queue.put(None)
+
+    async def _write(self, platform, queue):
+        metrics = self._metrics[platform]
+        done = False
+        while not done:
+            batches = [await queue.get()]
+            rows = 0 if batches[0] is None else len(batches[0])
+            while rows < self.write_rows and not queue.empty():
+                batches.append(queue.get_nowait())
+                rows += 0 if batches[-1] is None else len(batches[-1])
+            done = any(batch is None for batch in batches)
+            events = [batch for batch in batches if batch is not None]
+            if not events:
+                continue
+
+            frame = pd.concat(events, ignore_index=True)
+            began = time.perf_counter()
+            await asyncio.to_thread(self.store.write_batch, platform, frame)
+            metrics.write_seconds += time.perf_counter() - began
+            metrics.writes += 1
+            metrics.written += len(frame)
+            newest = frame['timestamp'].max()
+            if metrics.newest_event is None or newest > metrics.newest_event:
+                metrics.newest_event = newest
+
+    def metrics(self):
+        """
+        Per-feed counters, throughput and lag.
+
+        Returns:
+            dict: Summary dictionaries keyed by platform
+        """
+        return {
+            platform: metrics.summary(self._queues[platform].qsize() if platform in self._queues else 0)
+            for platform, metrics in self._metrics.items()
+        }
+
+    async def run(self, report=None, report_interval=10.0):
+        """
+        Ingest until every feed ends, or until cancelled.
+
+        Args:
+            report (callable, optional): Called with metrics() every report_interval seconds
+            report_interval (float): Seconds between reports
+
+        Returns:
+            dict: metrics() after the last write
+        """
+        tasks = []
+        for platform, feed in self.feeds.items():
+            self._metrics[platform].started = time.perf_counter()
+            queue = self._queues[platform] = asyncio.Queue(maxsize=self.queue_batches)
+            tasks.append(asyncio.create_task(self._consume(platform, feed, queue)))
+            tasks.append(asyncio.create_task(self._write(platform, queue)))
+
+        reporter = None
+        if report is not None:
+            async def report_periodically():
+                while True:
+                    await asyncio.sleep(report_interval)
+                    report(self.metrics())
+            reporter = asyncio.create_task(report_periodically())
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if reporter is not None:
+                reporter.cancel()
+        return self.metrics()
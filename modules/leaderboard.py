@@ -0,0 +1,230 @@
+import heapq
+import threading
+
+import numpy as np
+
+from modules.engagement_cube import GLOBAL_REGION
+
+# Days behind the momentum and mean_growth features, as in extract_features
+FEATURE_WINDOW = 7
+
+# Trending score: weighted sum of momentum and mean_growth
+MOMENTUM_WEIGHT = 1.0
+GROWTH_WEIGHT = 1.0
+
+def trending_features(values):
+    """
+    momentum and mean_growth of a window of daily engagement, as extract_features computes them.
+
+    Args:
+        values (sequence): The last FEATURE_WINDOW + 1 daily engagement values, oldest first
+
+    Returns:
+        tuple: (momentum, mean_growth); growth from a zero-engagement day counts as 0
+    """
+    previous = values[-FEATURE_WINDOW]
+    momentum = values[-1] / previous - 1 if previous else 0.0
+    growth = 0.0
+    for before, after in zip(values[-FEATURE_WINDOW - 1:-1], values[-FEATURE_WINDOW:]):
+        if before:
+            growth += after / before - 1
+    return momentum, growth / FEATURE_WINDOW
+
+class _IndexedHeap:
+    # Binary max-heap of track indices ordered by a shared score list, with a
+    # position index so any member's score can change in O(log n)
+    def __init__(self, members, scores):
+        self.scores = scores
+        self.heap = sorted(members, key=scores.__getitem__, reverse=True)
+        self.position = {track: i for i, track in enumerate(self.heap)}
+
+    def __len__(self):
+        return len(self.heap)
+
+    def update(self, track):
+        # Restore the heap after the score of a member changed
+        i = self.position[track]
+        if i > 0 and self.scores[track] > self.scores[self.heap[(i - 1) >> 1]]:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def _sift_up(self, i):
+        heap, position, scores = self.heap, self.position, self.scores
+        track = heap[i]
+        score = scores[track]
+        while i > 0:
+            parent = (i - 1) >> 1
+            above = heap[parent]
+            if scores[above] >= score:
+                break
+            heap[i] = above
+            position[above] = i
+            i = parent
+        heap[i] = track
+        position[track] = i
+
+    def _sift_down(self, i):
+        heap, position, scores = self.heap, self.position, self.scores
+        size = len(heap)
+        track = heap[i]
+        score = scores[track]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and scores[heap[right]] > scores[heap[child]]:
+                child = right
+            below = heap[child]
+            if scores[below] <= score:
+                break
+            heap[i] = below
+            position[below] = i
+            i = child
+        heap[i] = track
+        position[track] = i
+
+    def top(self, k):
+        # Best-first walk from the root: only O(k) nodes are visited
+        if not self.heap:
+            return []
+        heap, scores = self.heap, self.scores
+        frontier = [(-scores[heap[0]], 0)]
+        best = []
+        while frontier and len(best) < k:
+            _, i = heapq.heappop(frontier)
+            best.append(heap[i])
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (-scores[heap[child]], child))
+        return best
+
+class TrendingLeaderboard:
+    """
+    Top-K fastest-rising tracks, kept current as daily engagement arrives.
+
+    Each track keeps its last FEATURE_WINDOW + 1 daily values; record()
+    recomputes its momentum and mean_growth from them and repositions it
+    in an indexed max-heap over all tracks and in the heaps of its genre
+    and region, each in O(log n). top() reads the best K without sorting.
+
+    Args:
+        track_ids (sequence): Track identifiers
+        genres (sequence): Genre of each track
+        regions (sequence): Region of each track
+        history (np.ndarray): (n_tracks, FEATURE_WINDOW + 1) daily engagement, oldest first
+        end (np.datetime64, optional): Day of the newest history values, for
+            callers that record new days by date; they advance it themselves
+    """
+    def __init__(self, track_ids, genres, regions, history, end=None):
+        history = np.asarray(history, dtype=np.float64)
+        if history.shape != (len(track_ids), FEATURE_WINDOW + 1):
+            raise ValueError(f"history must be (n_tracks, {FEATURE_WINDOW + 1}), got {history.shape}")
+
+        self.track_ids = list(track_ids)
+        self._index = {track_id: i for i, track_id in enumerate(self.track_ids)}
+        self.genres = [str(genre) for genre in genres]
+        self.regions = [str(region) for region in regions]
+        self._history = history.tolist()
+        self._features = [trending_features(values) for values in self._history]
+        self._scores = [MOMENTUM_WEIGHT * momentum + GROWTH_WEIGHT * growth for momentum, growth in self._features]
+        self.updates = 0
+        self.end = end
+        self._lock = threading.Lock()
+
+        members = {}
+        for i, (genre, region) in enumerate(zip(self.genres, self.regions)):
+            members.setdefault(('genre', genre), []).append(i)
+            members.setdefault(('region', region), []).append(i)
+        self._all = _IndexedHeap(range(len(self.track_ids)), self._scores)
+        self._groups = {key: _IndexedHeap(tracks, self._scores) for key, tracks in members.items()}
+
+    def __len__(self):
+        return len(self.track_ids)
+
+    def latest(self, track_ids):
+        """
+        Most recent daily engagement of each of several tracks.
+
+        Returns:
+            np.ndarray: One value per track id
+        """
+        with self._lock:
+            return np.array([self._history[self._index[track_id]][-1] for track_id in track_ids])
+
+    def record(self, track_id, engagement):
+        """
+        Add a new day of engagement for a track and update its rank.
+
+        Args:
+            track_id: Track identifier
+            engagement (float): Engagement on the new day
+        """
+        i = self._index[track_id]
+        with self._lock:
+            values = self._history[i]
+            del values[0]
+            values.append(float(engagement))
+            momentum, growth = self._features[i] = trending_features(values)
+            self._scores[i] = MOMENTUM_WEIGHT * momentum + GROWTH_WEIGHT * growth
+            self._all.update(i)
+            self._groups[('genre', self.genres[i])].update(i)
+            self._groups[('region', self.regions[i])].update(i)
+            self.updates += 1
+
+    def record_many(self, track_ids, engagement):
+        """
+        Record one new day of engagement for each of several tracks.
+        """
+        for track_id, value in zip(track_ids, engagement):
+            self.record(track_id, value)
+
+    def top(self, k=10, genre=None, region=None):
+        """
+        The k tracks with the highest trending score.
+
+        Args:
+            k (int): Number of tracks
+            genre (str, optional): Only tracks of this genre
+            region (str, optional): Only tracks of this region; GLOBAL_REGION means all
+
+        Returns:
+            list: Dictionaries with track_id, genre, region, score, momentum and
+                mean_growth, highest score first
+        """
+        if region == GLOBAL_REGION:
+            region = None
+        with self._lock:
+            if genre is None and region is None:
+                ranked = self._all.top(k)
+            elif genre is None or region is None:
+                heap = self._groups.get(('genre', genre) if region is None else ('region', region))
+                ranked = heap.top(k) if heap else []
+            else:
+                # Walk the smaller of the two heaps until k tracks match the other filter
+                genre_heap = self._groups.get(('genre', genre))
+                region_heap = self._groups.get(('region', region))
+                ranked = []
+                if genre_heap and region_heap:
+                    heap, attribute, value = ((genre_heap, self.regions, region) if len(genre_heap) <= len(region_heap)
+                                              else (region_heap, self.genres, genre))
+                    width = k
+                    while True:
+                        candidates = heap.top(width)
+                        ranked = [i for i in candidates if attribute[i] == value][:k]
+                        if len(ranked) == k or len(candidates) < width:
+                            break
+                        width *= 4
+
+            return [
+                {
+                    'track_id': self.track_ids[i],
+                    'genre': self.genres[i],
+                    'region': self.regions[i],
+                    'score': self._scores[i],
+                    'momentum': self._features[i][0],
+                    'mean_growth': self._features[i][1]
+                }
+                for i in ranked
+            ]
@@ -0,0 +1,394 @@
+import copy
+import io
+import os
+import pickle
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from models.feature_scaler import RunningScaler
+from modules.backtesting import (DURATION_RANGE, HORIZON_DAYS, history_feature_matrix, realized_outcomes,
+                                 rolling_origins)
+from modules.data_processing import FEATURE_NAMES
+from modules.scenarios import default_worker_count
+
+# Log of realized outcomes the online models learn from, and where they are saved
+OUTCOME_LOG_PATH = os.path.join('data', 'outcome_log.csv')
+ONLINE_MODELS_PATH = os.path.join('models', 'trained', 'online_models.pkl')
+
+# Outcomes learned online, with the range their predictions are clipped to
+OUTCOME_TARGETS = {
+    'virality': (0, 100),
+    'trend_duration': DURATION_RANGE
+}
+LOG_COLUMNS = list(FEATURE_NAMES) + list(OUTCOME_TARGETS) + ['observed_at']
+
+# Outcomes per model update
+MICRO_BATCH_ROWS = 256
+
+# Outcomes an online model must have learned before it replaces the batch model
+MIN_SERVING_SAMPLES = 500
+
+# SGD step size; constant, so the models keep adapting to drift
+LEARNING_RATE = 0.005
+
+# Standardized features are clipped to +/- this many standard deviations, so
+# heavy-tailed features such as acceleration cannot throw off an SGD step
+FEATURE_CLIP = 5.0
+
+# Prediction errors forming the drift reference, errors in the recent window,
+# and the recent/reference MAE ratio reported as drift
+DRIFT_REFERENCE_ROWS = 2000
+DRIFT_WINDOW_ROWS = 2000
+DRIFT_RATIO = 1.5
+
+# Recent update latencies kept for percentiles
+LATENCY_SAMPLES = 1000
+
+class OutcomeLog:
+    """
+    Append-only CSV log of realized outcomes, one row per track and forecast period.
+
+    Readers track a byte offset, so each read returns only the rows appended
+    since the previous one.
+    """
+    def __init__(self, path=OUTCOME_LOG_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, features, outcomes, observed_at=None):
+        """
+        Append realized outcomes.
+
+        Args:
+            features (np.ndarray): (rows, len(FEATURE_NAMES)) features at the forecast origin
+            outcomes (dict): Realized value arrays keyed by OUTCOME_TARGETS name
+            observed_at (datetime-like, optional): When the outcomes were realized; defaults to now
+
+        Returns:
+            int: Number of rows appended
+        """
+        frame = pd.DataFrame(np.asarray(features, dtype=np.float64), columns=list(FEATURE_NAMES))
+        for target in OUTCOME_TARGETS:
+            frame[target] = np.asarray(outcomes[target], dtype=np.float64)
+        frame['observed_at'] = pd.Timestamp(observed_at or datetime.now()).isoformat(timespec='seconds')
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            frame.to_csv(self.path, mode='a', index=False, header=not os.path.exists(self.path))
+        return len(frame)
+
+    def read_new(self, offset=0):
+        """
+        Read the complete rows appended after a byte offset.
+
+        Args:
+            offset (int): Byte offset returned by the previous read; 0 for the whole log
+
+        Returns:
+            tuple: (pd.DataFrame of LOG_COLUMNS rows, byte offset to continue from)
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return pd.DataFrame(columns=LOG_COLUMNS), offset
+
+        # A row still being written is left for the next read
+        end = data.rfind(b"\n") + 1
+        text = data[:end].decode()
+        if offset == 0:
+            text = text.partition("\n")[2]
+        if not text.strip():
+            return pd.DataFrame(columns=LOG_COLUMNS), offset + end
+        return pd.read_csv(io.StringIO(text), names=LOG_COLUMNS, header=None), offset + end
+
+class OnlineRegressor:
+    """
+    Linear model of one outcome, updated with SGD partial_fit.
+
+    Features and the target are standardized with RunningScalers updated
+    on the same micro-batches, features are clipped to FEATURE_CLIP
+    standard deviations, and predictions are clipped to the outcome's range.
+
+    Args:
+        value_range (tuple): (min, max) of the outcome
+        random_state (int): Seed of the SGD sample order
+    """
+    def __init__(self, value_range, random_state=0):
+        from sklearn.linear_model import SGDRegressor
+
+        self.value_range = value_range
+        self.model = SGDRegressor(learning_rate='constant', eta0=LEARNING_RATE, alpha=1e-4,
+                                  random_state=random_state)
+        self.scaler = RunningScaler(feature_names=FEATURE_NAMES)
+        self.target_scaler = RunningScaler()
+        self.samples = 0
+        self.version = 0
+
+    @property
+    def ready(self):
+        return self.samples >= MIN_SERVING_SAMPLES
+
+    def _scaled(self, features):
+        return np.clip(np.nan_to_num(self.scaler.transform(features)), -FEATURE_CLIP, FEATURE_CLIP)
+
+    def predict(self, features):
+        """
+        Predict the outcome for a batch of feature rows.
+
+        Returns:
+            np.ndarray: Predictions clipped to value_range
+        """
+        scaled = self.model.predict(self._scaled(features))
+        values = scaled * self.target_scaler.scale[0] + self.target_scaler.mean[0]
+        return np.clip(values, *self.value_range)
+
+    def partial_fit(self, features, targets):
+        """
+        Update the model with a micro-batch of realized outcomes.
+
+        Returns:
+            OnlineRegressor: self
+        """
+        targets = np.asarray(targets, dtype=np.float64).reshape(-1, 1)
+        self.scaler.partial_fit(features)
+        self.target_scaler.partial_fit(targets)
+        scaled_targets = self.target_scaler.transform(targets)[:, 0]
+        self.model.partial_fit(self._scaled(features), scaled_targets)
+        self.samples += len(targets)
+        self.version += 1
+        return self
+
+class DriftMonitor:
+    """
+    Prequential error drift: each batch is scored before the model learns it.
+
+    The first DRIFT_REFERENCE_ROWS absolute errors of a serving model form
+    the reference; drift is the MAE of the last DRIFT_WINDOW_ROWS errors
+    divided by the reference MAE.
+    """
+    def __init__(self, reference_rows=DRIFT_REFERENCE_ROWS, window_rows=DRIFT_WINDOW_ROWS):
+        self.reference_rows = reference_rows
+        self._reference = []
+        self._recent = deque(maxlen=window_rows)
+
+    def record(self, errors):
+        errors = np.abs(np.asarray(errors, dtype=np.float64)).tolist()
+        missing = self.reference_rows - len(self._reference)
+        if missing > 0:
+            self._reference.extend(errors[:missing])
+            errors = errors[missing:]
+        self._recent.extend(errors)
+
+    def summary(self):
+        reference = float(np.mean(self._reference)) if len(self._reference) == self.reference_rows else None
+        recent = float(np.mean(self._recent)) if self._recent else None
+        ratio = recent / reference if reference and recent is not None else None
+        return {
+            'reference_mae': reference,
+            'recent_mae': recent,
+            'drift_ratio': ratio,
+            'drifting': ratio is not None and ratio > DRIFT_RATIO
+        }
+
+class OnlineLearner:
+    """
+    Online models of every outcome, updated in the background and hot-swapped.
+
+    Realized outcomes are split into MICRO_BATCH_ROWS micro-batches and
+    queued for a worker thread. The worker updates copies of the current
+    models and then replaces the models dict in a single assignment, so
+    requests reading models() never wait for an update and never see a
+    half-updated model.
+
+    Args:
+        models (dict, optional): OnlineRegressor per OUTCOME_TARGETS name; new ones if omitted
+        log (OutcomeLog, optional): Log that poll_log reads new outcomes from
+        log_offset (int): Byte offset of the log already learned
+    """
+    def __init__(self, models=None, log=None, log_offset=0):
+        self._models = models or {target: OnlineRegressor(value_range)
+                                  for target, value_range in OUTCOME_TARGETS.items()}
+        self.log = log
+        self.log_offset = log_offset
+        self.updates = 0
+        self.update_seconds = 0.0
+        self._drift = {target: DriftMonitor() for target in OUTCOME_TARGETS}
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._queue = queue.Queue()
+        self._poll_lock = threading.Lock()
+        self._worker = None
+
+    def models(self):
+        """
+        The current models; updates replace the dict rather than modify it.
+
+        Returns:
+            dict: OnlineRegressor per outcome
+        """
+        return self._models
+
+    def update(self, batch):
+        """
+        Learn one micro-batch of realized outcomes and swap in the updated models.
+
+        Args:
+            batch (pd.DataFrame): FEATURE_NAMES and OUTCOME_TARGETS columns
+
+        Returns:
+            float: Seconds from the start of the update to the swap
+        """
+        started = time.perf_counter()
+        features = np.nan_to_num(batch[list(FEATURE_NAMES)].to_numpy(dtype=np.float64))
+        current = self._models
+        updated = {}
+        for target, model in current.items():
+            targets = batch[target].to_numpy(dtype=np.float64)
+            if model.ready:
+                self._drift[target].record(model.predict(features) - targets)
+            updated[target] = copy.deepcopy(model).partial_fit(features, targets)
+        self._models = updated
+        self.updates += 1
+
+        seconds = time.perf_counter() - started
+        self.update_seconds += seconds
+        self._latencies.append(seconds)
+        return seconds
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            try:
+                self.update(batch)
+            except Exception as e:
+                print(f"Online update failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def submit(self, outcomes):
+        """
+        Queue realized outcomes for background learning and return immediately.
+
+        Args:
+            outcomes (pd.DataFrame): FEATURE_NAMES and OUTCOME_TARGETS columns
+
+        Returns:
+            int: Number of micro-batches queued
+        """
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name='online-learner', daemon=True)
+            self._worker.start()
+        batches = 0
+        for start in range(0, len(outcomes), MICRO_BATCH_ROWS):
+            self._queue.put(outcomes.iloc[start:start + MICRO_BATCH_ROWS])
+            batches += 1
+        return batches
+
+    def poll_log(self):
+        """
+        Queue the outcomes appended to the log since the last poll.
+
+        Returns:
+            int: Number of outcomes queued
+        """
+        if self.log is None:
+            return 0
+        with self._poll_lock:
+            outcomes, self.log_offset = self.log.read_new(self.log_offset)
+        if len(outcomes):
+            self.submit(outcomes)
+        return len(outcomes)
+
+    def flush(self):
+        """Block until every queued micro-batch has been learned."""
+        self._queue.join()
+
+    def metrics(self):
+        """
+        Model, drift and update latency counters.
+
+        Returns:
+            dict: 'updates', 'queued_batches', 'update_p50_ms', 'update_p99_ms'
+                and per-outcome 'models' summaries
+        """
+        latencies = np.array(self._latencies) * 1000
+        return {
+            'updates': self.updates,
+            'queued_batches': self._queue.qsize(),
+            'update_p50_ms': float(np.percentile(latencies, 50)) if len(latencies) else None,
+            'update_p99_ms': float(np.percentile(latencies, 99)) if len(latencies) else None,
+            'models': {
+                target: {'samples': model.samples, 'version': model.version, 'serving': model.ready,
+                         **self._drift[target].summary()}
+                for target, model in self._models.items()
+            }
+        }
+
+    def save(self, path=ONLINE_MODELS_PATH):
+        """
+        Save the current models and the log offset they have learned up to.
+
+        Returns:
+            str: Path the models were written to
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        # Write then rename, so a loading app never reads a partial file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'models': self._models, 'log_offset': self.log_offset}, f)
+        os.replace(tmp_path, path)
+        return path
+
+def load_online_learner(path=ONLINE_MODELS_PATH, log=None):
+    """
+    Load saved online models, or start new ones.
+
+    Args:
+        path (str): File written by OnlineLearner.save
+        log (OutcomeLog, optional): Log to keep learning from, after the saved offset
+
+    Returns:
+        OnlineLearner: Learner with the saved models, if any
+    """
+    try:
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+    except (FileNotFoundError, EOFError):
+        return OnlineLearner(log=log)
+    return OnlineLearner(models=state['models'], log=log, log_offset=state['log_offset'])
+
+def realized_outcome_batches(curves, start_date=None, horizon=HORIZON_DAYS, max_workers=None):
+    """
+    Realized outcomes of simulated tracks, one batch per forecast period as it ends.
+
+    Args:
+        curves (np.ndarray): (n_tracks, n_days) daily engagement
+        start_date (datetime-like, optional): Date of the first day; defaults to n_days ago
+        horizon (int): Days after each origin in which outcomes are realized
+        max_workers (int, optional): Worker processes computing the features
+
+    Yields:
+        tuple: (features np.ndarray, outcomes dict, date the outcomes were realized)
+    """
+    curves = np.asarray(curves, dtype=np.float64)
+    n_days = curves.shape[1]
+    if start_date is None:
+        start_date = pd.Timestamp.now().normalize() - pd.Timedelta(days=n_days)
+    origins = rolling_origins(n_days, horizon=horizon)
+
+    tasks = [(curves[:, :origin], start_date) for origin in origins]
+    with ProcessPoolExecutor(max_workers=max_workers or default_worker_count(len(tasks))) as pool:
+        for origin, features in zip(origins, pool.map(history_feature_matrix, tasks)):
+            outcomes = realized_outcomes(curves, origin, horizon)
+            yield features, outcomes, pd.Timestamp(start_date) + pd.Timedelta(days=origin + horizon)
@@ -0,0 +1,116 @@
+# Parameter schema shared by the sidebar, scenario comparison and headless callers.
+# Kept free of third-party imports so the landing page can use it cheaply.
+
+GENRES = [
+    "Synth-Neural Pop",
+    "Quantum Trap",
+    "NeuroWave",
+    "Holographic Folk",
+    "Bio-Electronic",
+    "Orbital Ambient",
+    "Virtual Reality Metal",
+    "AI-Generated Classical",
+    "Memory-Infused Jazz",
+    "Biofeedback House"
+]
+
+REGIONS = [
+    "Global Neural Network",
+    "North American Consciousness",
+    "European Thought-Sphere",
+    "Asian Collective",
+    "African Harmony Nexus",
+    "South American Flow",
+    "Oceanic Dream Web",
+    "Lunar Colony Network",
+    "Mars Outpost Stream",
+    "Orbital Habitat Collective"
+]
+
+PREDICTION_MODELS = [
+    "Quantum Neural Network (QNN)",
+    "Consciousness-Graph Analysis",
+    "Temporal Wavefront Predictor",
+    "Neural-Memetic Diffusion",
+    "Bio-Rhythmic Pattern Matcher"
+]
+
+# How the forecast part of the trend is produced: Holt smoothing fitted to
+# the simulated history, or the parameter-driven projection of the simulator
+FORECAST_METHODS = [
+    "Holt Exponential Smoothing",
+    "Parametric Projection"
+]
+
+# (min, max) of each numeric sidebar parameter
+PARAM_RANGES = {
+    'tempo': (60, 200),
+    'emotional_intensity': (1, 10),
+    'neural_connection': (0.0, 1.0),
+    'synthetic_vocal_pct': (0, 100),
+    'meme_potential': (0.0, 1.0),
+    'algorithmic_boost': (1, 10),
+    'novelty_factor': (0.0, 1.0),
+    'cultural_resonance': (0.0, 1.0),
+    'celebrity_influence': (0.0, 1.0),
+    'forecast_days': (1, 60)
+}
+
+# Default value of every sidebar parameter
+PARAM_DEFAULTS = {
+    'genre': GENRES[0],
+    'regions': ["Global Neural Network"],
+    'tempo': 120,
+    'emotional_intensity': 7,
+    'neural_connection': 0.8,
+    'synthetic_vocal_pct': 40,
+    'meme_potential': 0.7,
+    'algorithmic_boost': 7,
+    'novelty_factor': 0.6,
+    'cultural_resonance': 0.75,
+    'celebrity_influence': 0.5,
+    'model_selection': PREDICTION_MODELS[0],
+    'forecast_days': 14,
+    'forecast_method': FORECAST_METHODS[0]
+}
+
+def validate_params(params):
+    """
+    Validate a parameter set against the sidebar schema and fill in defaults.
+
+    Args:
+        params (dict): Parameter set, possibly partial
+
+    Returns:
+        dict: Complete parameter set
+
+    Raises:
+        ValueError: If a parameter is unknown or outside its allowed values
+    """
+    unknown = set(params) - set(PARAM_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {sorted(unknown)}")
+
+    validated = {key: params.get(key, default) for key, default in PARAM_DEFAULTS.items()}
+
+    for key, (low, high) in PARAM_RANGES.items():
+        value = validated[key]
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not low <= value <= high:
+            raise ValueError(f"Parameter '{key}' must be a number between {low} and {high}, got {value!r}")
+
+    if validated['genre'] not in GENRES:
+        raise ValueError(f"Unknown genre: {validated['genre']!r}")
+    if validated['model_selection'] not in PREDICTION_MODELS:
+        raise ValueError(f"Unknown prediction model: {validated['model_selection']!r}")
+    if validated['forecast_method'] not in FORECAST_METHODS:
+        raise ValueError(f"Unknown forecast method: {validated['forecast_method']!r}")
+
+    regions = validated['regions']
+    if isinstance(regions, str):
+        regions = [regions]
+    unknown_regions = [region for region in regions if region not in REGIONS]
+    if unknown_regions:
+        raise ValueError(f"Unknown regions: {unknown_regions}")
+    validated['regions'] = list(regions)
+
+    return validated
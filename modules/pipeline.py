@@ -0,0 +1,294 @@
+import logging
+from contextlib import nullcontext
+
+import numpy as np
+
+from utils.data_simulation import generate_mock_trend_data
+from utils.metrics_calculation import generate_forecast_metrics
+from modules.data_processing import preprocess_data, extract_features
+from modules.forecasting import forecast_trend_data
+from modules.parameters import FORECAST_METHODS
+from modules.prediction_models import predict_virality, predict_trend_duration
+from modules.prediction_intervals import DEFAULT_COVERAGE
+
+# Sidebar parameters read by each parameter-driven stage
+SIMULATION_PARAMS = ('forecast_days', 'forecast_method', 'tempo', 'emotional_intensity',
+                     'neural_connection', 'meme_potential', 'algorithmic_boost', 'novelty_factor')
+METRICS_PARAMS = ('emotional_intensity', 'meme_potential', 'neural_connection', 'cultural_resonance')
+RADAR_PARAMS = ('tempo', 'emotional_intensity', 'novelty_factor', 'neural_connection',
+                'meme_potential', 'algorithmic_boost')
+PLATFORM_PARAMS = ('meme_potential', 'neural_connection', 'cultural_resonance', 'tempo',
+                   'synthetic_vocal_pct', 'celebrity_influence', 'emotional_intensity', 'novelty_factor')
+DEMOGRAPHIC_PARAMS = ('novelty_factor', 'meme_potential', 'tempo', 'neural_connection',
+                      'cultural_resonance', 'emotional_intensity', 'celebrity_influence')
+RECOMMENDATION_PARAMS = ('genre', 'regions', 'tempo', 'emotional_intensity', 'synthetic_vocal_pct',
+                         'neural_connection', 'meme_potential')
+MARKETING_PARAMS = ('neural_connection', 'emotional_intensity', 'meme_potential')
+
+logger = logging.getLogger(__name__)
+
+def select_params(params, keys):
+    """
+    Select the subset of parameters a stage depends on.
+
+    Args:
+        params (dict): Parameters dictionary from the sidebar
+        keys (tuple): Parameter names read by the stage
+
+    Returns:
+        dict: Parameters restricted to the given keys
+    """
+    return {key: params[key] for key in keys if key in params}
+
+def simulate_trend(params):
+    """
+    Simulate historical and forecast engagement for a parameter set.
+
+    The history is always simulated from the parameters. The forecast is a
+    Holt smoothing fit to that history unless forecast_method selects the
+    simulator's parametric projection.
+
+    Args:
+        params (dict): Parameters dictionary from the sidebar
+
+    Returns:
+        pd.DataFrame: DataFrame with date, engagement, and is_forecast columns
+    """
+    trend_data = generate_mock_trend_data(
+        forecast_days=params.get('forecast_days', 14),
+        tempo=params.get('tempo', 120),
+        emotional_intensity=params.get('emotional_intensity', 7),
+        neural_connection=params.get('neural_connection', 0.8),
+        meme_potential=params.get('meme_potential', 0.7),
+        algorithmic_boost=params.get('algorithmic_boost', 7),
+        novelty_factor=params.get('novelty_factor', 0.6)
+    )
+    if params.get('forecast_method', FORECAST_METHODS[0]) == FORECAST_METHODS[0]:
+        trend_data = forecast_trend_data(trend_data)
+    return trend_data
+
+def preprocess_history(trend_data):
+    """
+    Preprocess the observed (non-forecast) part of the trend data.
+
+    Args:
+        trend_data (pd.DataFrame): Simulated trend data
+
+    Returns:
+        pd.DataFrame: Preprocessed historical data
+    """
+    return preprocess_data(trend_data[~trend_data['is_forecast']])
+
+def preprocess_buckets(buckets, resolution='day'):
+    """
+    Preprocess a window of bucketed engagement read from an EngagementPyramid.
+
+    Args:
+        buckets (pd.DataFrame): date and engagement per bucket, as returned by
+            EngagementPyramid.query or window
+        resolution (str): Bucket width ('hour', 'day' or 'week')
+
+    Returns:
+        pd.DataFrame: Preprocessed historical data
+    """
+    return preprocess_data(buckets[['date', 'engagement']], resolution)
+
+def compute_features(processed, resolution='day'):
+    """
+    Extract model features from preprocessed history.
+
+    Args:
+        processed (pd.DataFrame): Preprocessed historical data
+        resolution (str): Bucket width of its rows ('hour', 'day' or 'week')
+
+    Returns:
+        pd.DataFrame: Single-row feature matrix
+    """
+    return extract_features(processed, resolution=resolution)
+
+def predict_outcomes(features, models=None, online_models=None, calibrations=None, coverage=DEFAULT_COVERAGE):
+    """
+    Run the virality and trend duration predictors.
+
+    Args:
+        features (pd.DataFrame): Single-row feature matrix
+        models (dict, optional): Preloaded 'virality' and 'trend_duration' models
+        online_models (dict, optional): OnlineRegressor per outcome; those that
+            have learned enough outcomes replace the batch predictors
+        calibrations (dict, optional): ConformalCalibration per batch model;
+            adds the prediction interval of each calibrated prediction
+        coverage (float): Target coverage of the intervals
+
+    Returns:
+        dict: Predicted virality score and trend duration, and their
+            (low, high) 'virality_range' and 'trend_duration_range' when calibrated
+    """
+    models = models or {}
+    online_models = {name: model for name, model in (online_models or {}).items() if model.ready}
+    # Calibrations hold the batch models' residuals, which say nothing about the online models
+    calibrations = {name: calibration for name, calibration in (calibrations or {}).items()
+                    if name not in online_models}
+
+    if 'virality' in online_models:
+        virality = float(online_models['virality'].predict(features)[0])
+    else:
+        virality = float(predict_virality(features, model=models.get('virality')))
+    if 'trend_duration' in online_models:
+        duration = int(round(online_models['trend_duration'].predict(features)[0]))
+    else:
+        duration = predict_trend_duration(features, model=models.get('trend_duration'))
+    predictions = {
+        'virality_score': virality,
+        'trend_duration': duration
+    }
+
+    if 'virality' in calibrations:
+        predictions['virality_range'] = calibrations['virality'].interval(virality, coverage)
+    if 'trend_duration' in calibrations:
+        low, high = calibrations['trend_duration'].interval(duration, coverage)
+        predictions['trend_duration_range'] = (int(np.floor(low)), int(np.ceil(high)))
+    return predictions
+
+def compute_metrics(trend_data, params, predictions):
+    """
+    Calculate forecast metrics, using model predictions where available.
+
+    Args:
+        trend_data (pd.DataFrame): Simulated trend data
+        params (dict): Parameters dictionary from the sidebar
+        predictions (dict): Output of predict_outcomes
+
+    Returns:
+        dict: Dictionary with calculated metrics; when a growth curve sets the
+            trend duration, the duration model's prediction and range are kept
+            as 'model_trend_duration' and 'model_trend_duration_range'
+    """
+    metrics = generate_forecast_metrics(
+        trend_data,
+        emotional_intensity=params.get('emotional_intensity', 7),
+        meme_potential=params.get('meme_potential', 0.7),
+        neural_connection=params.get('neural_connection', 0.8),
+        cultural_resonance=params.get('cultural_resonance', 0.75)
+    )
+    # A fitted growth curve sets the duration; the duration model's estimate is kept next to it
+    if metrics['growth_model'] is not None:
+        predictions = {(f"model_{key}" if key.startswith('trend_duration') else key): value
+                       for key, value in predictions.items()}
+    metrics.update(predictions)
+
+    return metrics
+
+class PipelineStage:
+    """
+    One node of the prediction pipeline DAG.
+
+    The stage function is called with the selected parameters followed by
+    the outputs of its upstream stages, in the order listed in deps, and,
+    for a stateful stage, the pipeline's state mapping as `state`.
+
+    Args:
+        name (str): Unique stage name
+        func (callable): Stage function
+        params (tuple): Sidebar parameters the stage reads
+        deps (tuple): Names of upstream stages
+        inputs (tuple): Zero-argument callables returning a hashable version
+            of state outside the pipeline that the stage reads, such as
+            swapped-in models or ingested data
+        stateful (bool): Whether the stage keeps objects of its own across
+            runs in the pipeline's state
+    """
+
+    def __init__(self, name, func, params=(), deps=(), inputs=(), stateful=False):
+        self.name = name
+        self.func = func
+        self.params = tuple(params)
+        self.deps = tuple(deps)
+        self.inputs = tuple(inputs)
+        self.stateful = stateful
+
+    def signature(self, params, versions):
+        """
+        Build the value that must change for the stage to re-execute.
+
+        Args:
+            params (dict): Parameters dictionary from the sidebar
+            versions (dict): Current output version of each stage
+
+        Returns:
+            tuple: Parameter values, upstream output versions and external input versions
+        """
+        param_values = tuple(_freeze(params.get(key)) for key in self.params)
+        return param_values, tuple(versions[dep] for dep in self.deps), tuple(read() for read in self.inputs)
+
+class IncrementalPipeline:
+    """
+    Pipeline DAG that only re-executes stages whose inputs changed.
+
+    Stage outputs are kept in a caller-supplied mapping (st.session_state in
+    the app) together with the signature they were computed from and a
+    version number that downstream stages use as their input signature.
+
+    Args:
+        stages (list): PipelineStage objects in topological order
+        state_key (str): Key under which results are stored in the state
+    """
+
+    def __init__(self, stages, state_key='pipeline_results'):
+        seen = set()
+        for stage in stages:
+            missing = [dep for dep in stage.deps if dep not in seen]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on {missing}, which must be declared before it")
+            if stage.name in seen:
+                raise ValueError(f"Duplicate stage name: {stage.name}")
+            seen.add(stage.name)
+
+        self.stages = list(stages)
+        self.state_key = state_key
+
+    def run(self, params, state, stage_context=None):
+        """
+        Run the pipeline, re-executing only stages whose inputs changed.
+
+        Args:
+            params (dict): Parameters dictionary from the sidebar
+            state (MutableMapping): Per-session storage for stage results
+            stage_context (callable, optional): Returns a context manager
+                wrapped around each executed stage, e.g. a progress spinner
+
+        Returns:
+            tuple: (dict of stage outputs by name, dict with 'executed' and
+                'skipped' stage name lists)
+        """
+        results = state.setdefault(self.state_key, {})
+        versions = {name: entry['version'] for name, entry in results.items()}
+        executed, skipped = [], []
+
+        for stage in self.stages:
+            signature = stage.signature(params, versions)
+            entry = results.get(stage.name)
+
+            if entry is not None and entry['signature'] == signature:
+                skipped.append(stage.name)
+                continue
+
+            inputs = [results[dep]['value'] for dep in stage.deps]
+            with stage_context(stage.name) if stage_context else nullcontext():
+                kwargs = {'state': state} if stage.stateful else {}
+                value = stage.func(select_params(params, stage.params), *inputs, **kwargs)
+
+            version = entry['version'] + 1 if entry is not None else 1
+            results[stage.name] = {'signature': signature, 'value': value, 'version': version}
+            versions[stage.name] = version
+            executed.append(stage.name)
+
+        logger.debug("Pipeline rerun: executed %s, skipped %s", executed or 'none', skipped or 'none')
+
+        outputs = {stage.name: results[stage.name]['value'] for stage in self.stages}
+        return outputs, {'executed': executed, 'skipped': skipped}
+
+def _freeze(value):
+    # Multiselect values arrive as lists; compare them as tuples
+    if isinstance(value, list):
+        return tuple(value)
+    return value
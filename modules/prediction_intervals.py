@@ -0,0 +1,292 @@
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+
+from modules.prediction_models import MODEL_REGISTRY
+
+# Share of realized outcomes the intervals shown in the app should contain
+DEFAULT_COVERAGE = 0.8
+
+# Bins of predicted values calibrated separately, and the fewest residuals a bin may hold
+CALIBRATION_BINS = 5
+MIN_BIN_RESIDUALS = 200
+
+# Range of each model's outcome, as the predictors clip it; interval bounds are clipped to it
+VALUE_RANGES = {
+    'virality': (0.0, 100.0),
+    'trend_duration': (3.0, 30.0)
+}
+
+def calibration_path(model_path):
+    """
+    Get the path of the calibration residuals stored next to a model file.
+
+    Args:
+        model_path (str): Path to the model file
+
+    Returns:
+        str: Path to the .calibration.npz file
+    """
+    return f"{os.path.splitext(model_path)[0]}.calibration.npz"
+
+class ConformalCalibration:
+    """
+    Split-conformal prediction intervals for one model.
+
+    Holds the signed residuals (actual - predicted) of the model on a
+    calibration set it was not trained on, sorted within bins of the
+    predicted value so intervals widen where the model is less reliable.
+    The interval for coverage c adds the bin's (1 - c) / 2 and (1 + c) / 2
+    conformal quantiles of the residuals to the prediction, which contains
+    the realized outcome with probability at least c for exchangeable data.
+
+    A quantile is one index into the sorted residuals, and the offsets of
+    every bin are computed once per coverage, so an interval costs a bin
+    lookup and two additions per prediction.
+
+    Args:
+        predicted (np.ndarray): Calibration-set predictions
+        actual (np.ndarray): Realized outcomes of the same tracks
+        n_bins (int): Bins of predicted values, reduced so each holds MIN_BIN_RESIDUALS
+        value_range (tuple, optional): (low, high) the bounds are clipped to
+        model_signature (str, optional): Identifies the model configuration calibrated
+    """
+    def __init__(self, predicted, actual, n_bins=CALIBRATION_BINS, value_range=None, model_signature=None):
+        predicted = np.asarray(predicted, dtype=np.float64)
+        actual = np.asarray(actual, dtype=np.float64)
+        if len(predicted) != len(actual) or not len(predicted):
+            raise ValueError("Calibration needs the same, non-zero number of predictions and outcomes")
+
+        n_bins = max(1, min(n_bins, len(predicted) // MIN_BIN_RESIDUALS))
+        # Interior edges at equal-count quantiles; ties (integer predictions) collapse bins
+        edges = np.unique(np.quantile(predicted, np.linspace(0, 1, n_bins + 1)[1:-1]))
+        bins = np.searchsorted(edges, predicted, side='right')
+        residuals = actual - predicted
+        order = np.lexsort((residuals, bins))
+
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(bins, minlength=len(edges) + 1))])
+        self._set(edges, residuals[order], offsets, value_range, model_signature)
+
+    def _set(self, edges, residuals, offsets, value_range, model_signature):
+        self.edges = edges
+        self.residuals = residuals
+        self.offsets = offsets
+        self.value_range = value_range
+        self.model_signature = model_signature
+        self._bounds = {}
+
+    @classmethod
+    def from_sorted(cls, edges, residuals, offsets, value_range=None, model_signature=None):
+        """
+        Rebuild a calibration from its stored arrays.
+
+        Args:
+            edges (np.ndarray): Interior edges of the predicted-value bins
+            residuals (np.ndarray): Residuals sorted within bins, bin by bin
+            offsets (np.ndarray): Start of each bin in residuals, plus the total
+            value_range (tuple, optional): (low, high) the bounds are clipped to
+            model_signature (str, optional): Identifies the model configuration calibrated
+
+        Returns:
+            ConformalCalibration: The calibration
+        """
+        calibration = cls.__new__(cls)
+        calibration._set(edges, residuals, offsets, value_range, model_signature)
+        return calibration
+
+    def bin_sizes(self):
+        """
+        Calibration residuals per bin of predicted values.
+
+        Returns:
+            np.ndarray: Residual count of each bin
+        """
+        return np.diff(self.offsets)
+
+    def bin_offsets(self, coverage=DEFAULT_COVERAGE):
+        """
+        Lower and upper residual quantile of every bin for a coverage.
+
+        Bins with too few residuals for the coverage get infinite offsets,
+        so their intervals span the whole value range.
+
+        Args:
+            coverage (float): Target share of outcomes inside the interval, in (0, 1)
+
+        Returns:
+            tuple: (lower, upper) np.ndarray offsets, one per bin
+        """
+        if not 0 < coverage < 1:
+            raise ValueError(f"Coverage must be between 0 and 1, got {coverage}")
+        if coverage not in self._bounds:
+            tail = (1 - coverage) / 2
+            sizes = self.bin_sizes()
+            # 1-based ranks of the conformal quantiles with the (n + 1) finite-sample correction
+            low_rank = np.floor(tail * (sizes + 1)).astype(np.int64)
+            high_rank = np.ceil((1 - tail) * (sizes + 1)).astype(np.int64)
+            starts = self.offsets[:-1]
+            lower = np.full(len(sizes), -np.inf)
+            upper = np.full(len(sizes), np.inf)
+            has_low, has_high = low_rank >= 1, high_rank <= sizes
+            lower[has_low] = self.residuals[starts[has_low] + low_rank[has_low] - 1]
+            upper[has_high] = self.residuals[starts[has_high] + high_rank[has_high] - 1]
+            self._bounds[coverage] = (lower, upper)
+        return self._bounds[coverage]
+
+    def intervals(self, predicted, coverage=DEFAULT_COVERAGE):
+        """
+        Prediction intervals for a batch of predictions.
+
+        Args:
+            predicted (np.ndarray): Point predictions of the calibrated model
+            coverage (float): Target share of outcomes inside the interval, in (0, 1)
+
+        Returns:
+            tuple: (low, high) np.ndarray bounds, one per prediction
+        """
+        predicted = np.asarray(predicted, dtype=np.float64)
+        lower, upper = self.bin_offsets(coverage)
+        bins = np.searchsorted(self.edges, predicted, side='right')
+        low, high = predicted + lower[bins], predicted + upper[bins]
+        if self.value_range is not None:
+            low = np.clip(low, *self.value_range)
+            high = np.clip(high, *self.value_range)
+        return low, high
+
+    def interval(self, predicted, coverage=DEFAULT_COVERAGE):
+        """
+        Prediction interval for a single prediction.
+
+        Args:
+            predicted (float): Point prediction of the calibrated model
+            coverage (float): Target share of outcomes inside the interval, in (0, 1)
+
+        Returns:
+            tuple: (low, high) floats
+        """
+        low, high = self.intervals([predicted], coverage)
+        return float(low[0]), float(high[0])
+
+def _model_signature(model_path):
+    # Tuned configurations are timestamped; retuning invalidates the calibration
+    from models.model_loader import load_model_metadata
+
+    return load_model_metadata(model_path).get('tuned_at', 'default')
+
+def save_calibration(calibration, model_path):
+    """
+    Save a calibration next to its model, replacing the file atomically.
+
+    Args:
+        calibration (ConformalCalibration): Calibration to save
+        model_path (str): Path to the model file the calibration belongs to
+
+    Returns:
+        str: Path the calibration was written to
+    """
+    path = calibration_path(model_path)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    value_range = calibration.value_range if calibration.value_range is not None else (-np.inf, np.inf)
+    # Write then rename, so the app never loads a partial file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, edges=calibration.edges, residuals=calibration.residuals, offsets=calibration.offsets,
+                 value_range=np.asarray(value_range, dtype=np.float64),
+                 model_signature=np.asarray(calibration.model_signature or ''),
+                 calibrated_at=np.asarray(datetime.now().isoformat(timespec='seconds')))
+    os.replace(tmp_path, path)
+    return path
+
+def load_calibration(model_path):
+    """
+    Load the calibration stored next to a model.
+
+    Args:
+        model_path (str): Path to the model file
+
+    Returns:
+        ConformalCalibration: The stored calibration, or None if there is none
+            or it was made for a different configuration of the model
+    """
+    path = calibration_path(model_path)
+    try:
+        with np.load(path) as stored:
+            arrays = {key: stored[key] for key in stored.files}
+    except (FileNotFoundError, EOFError, ValueError):
+        return None
+
+    signature = str(arrays['model_signature'])
+    if signature != _model_signature(model_path):
+        print(f"Calibration at {path} was made for another configuration of the model; recalibrate it")
+        return None
+
+    low, high = arrays['value_range']
+    value_range = None if np.isinf(low) and np.isinf(high) else (float(low), float(high))
+    return ConformalCalibration.from_sorted(arrays['edges'], arrays['residuals'], arrays['offsets'],
+                                            value_range=value_range, model_signature=signature)
+
+def load_calibrations(model_dir='models/trained'):
+    """
+    Load the calibrations of the registered models.
+
+    Args:
+        model_dir (str): Directory containing the model files
+
+    Returns:
+        dict: ConformalCalibration per model name, for calibrated models only
+    """
+    calibrations = {}
+    for name, (_, filename) in MODEL_REGISTRY.items():
+        calibration = load_calibration(os.path.join(model_dir, filename))
+        if calibration is not None:
+            calibrations[name] = calibration
+    return calibrations
+
+def calibrate_models(curves, start_date=None, n_bins=CALIBRATION_BINS, max_workers=None,
+                     model_dir='models/trained', save=True):
+    """
+    Calibrate prediction intervals for every model in MODEL_REGISTRY.
+
+    The models score the tracks at rolling forecast origins, as in
+    run_backtest, and their residuals against the realized outcomes become
+    the calibration set. The histories must not be ones the models were
+    trained on, or the intervals come out too narrow.
+
+    Args:
+        curves (np.ndarray): (n_tracks, n_days) daily engagement, such as
+            generate_historical_trends returns
+        start_date (datetime-like, optional): Date of the first day
+        n_bins (int): Bins of predicted values calibrated separately
+        max_workers (int, optional): Worker processes scoring the origins
+        model_dir (str): Directory of the model files the calibrations are saved next to
+        save (bool): Whether to save the calibrations
+
+    Returns:
+        dict: 'calibrations' (ConformalCalibration per model name), 'backtest'
+            (run_backtest result) and 'wall_seconds'
+    """
+    # Imported here; backtesting imports the pipeline, which imports this module
+    from modules.backtesting import run_backtest
+
+    started = time.perf_counter()
+    backtest = run_backtest(curves, start_date=start_date, max_workers=max_workers)
+    predictions = backtest['predictions']
+
+    calibrations = {}
+    for name, (_, filename) in MODEL_REGISTRY.items():
+        model_path = os.path.join(model_dir, filename)
+        rows = predictions[predictions['model'] == name]
+        calibrations[name] = ConformalCalibration(rows['predicted'].to_numpy(), rows['actual'].to_numpy(),
+                                                  n_bins=n_bins, value_range=VALUE_RANGES.get(name),
+                                                  model_signature=_model_signature(model_path))
+        if save:
+            save_calibration(calibrations[name], model_path)
+
+    return {
+        'calibrations': calibrations,
+        'backtest': backtest,
+        'wall_seconds': time.perf_counter() - started
+    }
@@ -1,8 +1,9 @@
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 import pickle
 import os
 
+from modules.data_processing import FEATURE_NAMES
+
 def load_or_create_model(model_path, model_type='random_forest'):
     """
     Load a model from disk or create a new one if it doesn't exist.
@@ -20,7 +21,17 @@ def load_or_create_model(model_path, model_type='random_forest'):
         print(f"Model loaded from {model_path}")
         return model
     except (FileNotFoundError, EOFError):
+        from models.model_loader import create_default_model, load_model_metadata
+        
+        # A configuration written by modules.tuning takes precedence over the defaults
+        metadata = load_model_metadata(model_path)
+        if metadata.get('hyperparameters'):
+            print(f"Model not found at {model_path}, creating tuned {metadata['model_type']} model")
+            return create_default_model(metadata['model_type'], hyperparameters=metadata['hyperparameters'])
+        
         print(f"Model not found at {model_path}, creating new model")
+        from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+        
         if model_type == 'random_forest':
             model = RandomForestRegressor(n_estimators=100, random_state=42)
         elif model_type == 'gradient_boosting':
@@ -33,13 +44,54 @@ def load_or_create_model(model_path, model_type='random_forest'):
         
         return model
 
-def predict_virality(features, model_path='models/trained/virality_predictor.pkl'):
+def load_prediction_models(model_dir='models/trained'):
+    """
+    Load the virality and trend duration models.
+    
+    Args:
+        model_dir (str): Directory containing the model files
+        
+    Returns:
+        dict: Models keyed by 'virality' and 'trend_duration'
+    """
+    return {name: load_or_create_model(os.path.join(model_dir, filename))
+            for name, (_, filename) in MODEL_REGISTRY.items()}
+
+def fitted_prediction(model, features):
+    """
+    Predict with a fitted model, such as one saved by modules.tuning.
+
+    Fitted models are trained on the FEATURE_NAMES columns of
+    extract_features, with missing values as 0. Models created unfitted
+    from the defaults or a tuned configuration cannot predict.
+
+    Args:
+        model (object): Loaded model, or None
+        features (pd.DataFrame): Feature matrix; only its first row is used
+
+    Returns:
+        float: The model's prediction, or None if the model is not fitted
+            or the features lack a column it needs
+    """
+    # scikit-learn estimators only set n_features_in_ when they are fitted
+    if model is None or not hasattr(model, 'n_features_in_'):
+        return None
+    if any(name not in features for name in FEATURE_NAMES):
+        return None
+    row = np.nan_to_num(features[list(FEATURE_NAMES)].to_numpy(dtype=np.float64)[:1])
+    return float(model.predict(row)[0])
+
+def predict_virality(features, model_path='models/trained/virality_predictor.pkl', model=None):
     """
     Predict virality score based on features and parameters.
     
+    A fitted model file, such as a tuned one, makes the prediction;
+    otherwise a rule-based score stands in for it.
+    
     Args:
         features (pd.DataFrame): Feature matrix
         model_path (str): Path to the model file
+        model (object, optional): Preloaded model; skips loading from model_path
         
     Returns:
         float: Predicted virality score (0-100)
@@ -47,10 +99,14 @@ def predict_virality(features, model_path='models/trained/virality_predictor.pkl
     # For demonstration, we'll use a simple rule-based approach with simulated ML
     # In production, you would use a properly trained model
     
-    model = load_or_create_model(model_path)
+    if model is None:
+        model = load_or_create_model(model_path)
+    
+    prediction = fitted_prediction(model, features)
+    if prediction is not None:
+        return float(np.clip(prediction, 0, 100))
     
     # Simple mock prediction for demonstration
-    # In a real app, this would use the loaded model
     base_score = 50
     
     # Weight each feature based on importance
@@ -71,18 +127,27 @@ def predict_virality(features, model_path='models/trained/virality_predictor.pkl
     final_score = np.clip(base_score + score_adjustment, 0, 100)
     return final_score
 
-def predict_trend_duration(features, model_path='models/trained/trend_duration.pkl'):
+def predict_trend_duration(features, model_path='models/trained/trend_duration.pkl', model=None):
     """
     Predict the expected duration of a trend in days.
     
+    A fitted model file, such as a tuned one, makes the prediction;
+    otherwise a rule-based estimate stands in for it.
+    
     Args:
         features (pd.DataFrame): Feature matrix
         model_path (str): Path to the model file
+        model (object, optional): Preloaded model; skips loading from model_path
         
     Returns:
         int: Predicted trend duration in days
     """
-    model = load_or_create_model(model_path)
+    if model is None:
+        model = load_or_create_model(model_path)
+    
+    prediction = fitted_prediction(model, features)
+    if prediction is not None:
+        return int(round(np.clip(prediction, 3, 30)))
     
     # Simple mock prediction for demonstration
     base_duration = 14  # Base duration in days
@@ -104,4 +169,10 @@ def predict_trend_duration(features, model_path='models/trained/trend_duration.p
         duration = np.clip(duration, 3, 30)
         return int(round(duration))
     
-    return base_duration
\ No newline at end of file
+    return base_duration
+
+# Predictors keyed by model name: (predict function, model file in the model directory)
+MODEL_REGISTRY = {
+    'virality': (predict_virality, 'virality_predictor.pkl'),
+    'trend_duration': (predict_trend_duration, 'trend_duration.pkl')
+}
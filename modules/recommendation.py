@@ -1,3 +1,68 @@
+from modules.rule_engine import Rule, RuleSet
+
+def _genre_term(genre):
+    return genre.split()[0] if len(genre.split()) > 0 else genre
+
+def _target_region(regions):
+    return max(regions, key=lambda x: len(x)) if regions else "Global"
+
+# Artist recommendations, in the order they are emitted
+RECOMMENDATION_RULES = RuleSet(
+    rules=[
+        # Genre-based recommendation
+        Rule(None, "Emphasize {genre_term} elements in vocal processing"),
+        # Region-based recommendation
+        Rule(None, "Optimize for {target_region} neurological patterns"),
+        # Structure recommendation
+        Rule(None, "Incorporate neural-hook at 0:45 timestamp"),
+        # Tempo recommendation
+        Rule(None, "Utilize {tempo}bpm rhythmic pattern in chorus sections"),
+        # Platform optimization
+        Rule(None, "Structure for 15-second viral loop compatibility"),
+        # Vocal processing recommendation
+        Rule(('synthetic_vocal_pct', '<', 50), "Increase synthetic vocal elements"),
+        Rule(('synthetic_vocal_pct', '>=', 50), "Add organic vocal textures for balance"),
+        # Emotional intensity recommendation
+        Rule(('emotional_intensity', '<', 7), "Boost emotional resonance hooks"),
+        Rule(('emotional_intensity', '>=', 7), "Balance emotional intensity with novelty factors"),
+        # Meme recommendation if potential is low
+        Rule(('meme_potential', '<', 0.6), "Incorporate repeatable visual motif for user-generated content"),
+        # Neural connection recommendation
+        Rule(('neural_connection', '<', 0.7), "Enhance listener connection through relatable lyrical themes")
+    ],
+    defaults={
+        'genre': 'Neural Pop',
+        'regions': ['Global Neural Network'],
+        'tempo': 120,
+        'emotional_intensity': 7,
+        'synthetic_vocal_pct': 50,
+        'neural_connection': 0.8,
+        'meme_potential': 0.7
+    },
+    derived={
+        'genre_term': ('genre', _genre_term),
+        'target_region': ('regions', _target_region)
+    }
+)
+
+# Collaborator types, in the order they are suggested
+COLLABORATION_RULES = RuleSet(
+    rules=[
+        Rule(('genre', 'contains', ('Synth', 'Electronic')), "Vocal Producer"),
+        Rule(('genre', 'contains', ('Folk', 'Ambient')), "Acoustic Instrumentalist"),
+        Rule(('emotional_intensity', '>', 7), "Emotive Vocalist"),
+        Rule(('emotional_intensity', '<=', 7), "Technical Vocalist"),
+        Rule(('novelty_factor', '>', 0.7), "Experimental Sound Designer"),
+        # Always suggest a visual artist for content creation
+        Rule(None, "Neural Visual Artist")
+    ],
+    defaults={
+        'genre': 'Neural Pop',
+        'emotional_intensity': 7,
+        'novelty_factor': 0.6
+    }
+)
+
 def generate_artist_recommendations(params):
     """
     Generate artist-specific recommendations based on analysis.
@@ -8,56 +73,19 @@ def generate_artist_recommendations(params):
     Returns:
         list: List of recommendation strings
     """
-    # Extract parameters
-    genre = params.get('genre', 'Neural Pop')
-    regions = params.get('regions', ['Global Neural Network'])
-    tempo = params.get('tempo', 120)
-    emotional_intensity = params.get('emotional_intensity', 7)
-    synthetic_vocal_pct = params.get('synthetic_vocal_pct', 50)
-    neural_connection = params.get('neural_connection', 0.8)
-    meme_potential = params.get('meme_potential', 0.7)
-    
-    # Generate dynamic recommendations based on parameters
-    recommendations = []
-    
-    # Genre-based recommendation
-    genre_term = genre.split()[0] if len(genre.split()) > 0 else genre
-    recommendations.append(f"Emphasize {genre_term} elements in vocal processing")
-    
-    # Region-based recommendation
-    target_region = max(regions, key=lambda x: len(x)) if regions else "Global"
-    recommendations.append(f"Optimize for {target_region} neurological patterns")
-    
-    # Structure recommendation
-    recommendations.append("Incorporate neural-hook at 0:45 timestamp")
-    
-    # Tempo recommendation
-    recommendations.append(f"Utilize {tempo}bpm rhythmic pattern in chorus sections")
-    
-    # Platform optimization
-    recommendations.append("Structure for 15-second viral loop compatibility")
-    
-    # Vocal processing recommendation
-    if synthetic_vocal_pct < 50:
-        recommendations.append("Increase synthetic vocal elements")
-    else:
-        recommendations.append("Add organic vocal textures for balance")
-    
-    # Emotional intensity recommendation
-    if emotional_intensity < 7:
-        recommendations.append("Boost emotional resonance hooks")
-    else:
-        recommendations.append("Balance emotional intensity with novelty factors")
-    
-    # Meme recommendation if potential is low
-    if meme_potential < 0.6:
-        recommendations.append("Incorporate repeatable visual motif for user-generated content")
-    
-    # Neural connection recommendation
-    if neural_connection < 0.7:
-        recommendations.append("Enhance listener connection through relatable lyrical themes")
+    return RECOMMENDATION_RULES.evaluate([params])[0]
+
+def generate_roster_recommendations(param_sets):
+    """
+    Evaluate the recommendation rules over a roster of tracks at once.
     
-    return recommendations
+    Args:
+        param_sets (list): Parameter dictionaries, one per track
+        
+    Returns:
+        RuleMatches: Per-track recommendations, formatted when a track is accessed
+    """
+    return RECOMMENDATION_RULES.evaluate(param_sets)
 
 def analyze_potential_collaborations(params):
     """
@@ -69,29 +97,16 @@ def analyze_potential_collaborations(params):
     Returns:
         list: List of potential collaboration types
     """
-    # Extract parameters
-    genre = params.get('genre', 'Neural Pop')
-    emotional_intensity = params.get('emotional_intensity', 7)
-    novelty_factor = params.get('novelty_factor', 0.6)
-    
-    # Base collaborations on genre and parameters
-    collaborations = []
+    return COLLABORATION_RULES.evaluate([params])[0]
+
+def analyze_roster_collaborations(param_sets):
+    """
+    Evaluate the collaboration rules over a roster of tracks at once.
     
-    if 'Synth' in genre or 'Electronic' in genre:
-        collaborations.append("Vocal Producer")
-        
-    if 'Folk' in genre or 'Ambient' in genre:
-        collaborations.append("Acoustic Instrumentalist")
-        
-    if emotional_intensity > 7:
-        collaborations.append("Emotive Vocalist")
-    else:
-        collaborations.append("Technical Vocalist")
+    Args:
+        param_sets (list): Parameter dictionaries, one per track
         
-    if novelty_factor > 0.7:
-        collaborations.append("Experimental Sound Designer")
-    
-    # Always suggest a visual artist for content creation
-    collaborations.append("Neural Visual Artist")
-    
-    return collaborations
\ No newline at end of file
+    Returns:
+        RuleMatches: Per-track collaborator types, formatted when a track is accessed
+    """
+    return COLLABORATION_RULES.evaluate(param_sets)
@@ -0,0 +1,190 @@
+import operator
+import string
+
+import numpy as np
+
+# Comparison operators usable in rule conditions
+OPERATORS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne
+}
+
+class Rule:
+    """
+    One row of a rule table: a condition on parameter columns and a message template.
+
+    The condition is None (always applies) or a (column, op, value) tuple,
+    where op is a comparison from OPERATORS or 'contains', which matches if
+    the column's string contains any of the given substrings. The template
+    is formatted with the row's parameters and derived fields.
+    """
+    __slots__ = ('condition', 'template', 'fields')
+
+    def __init__(self, condition, template):
+        if condition is not None and condition[1] not in OPERATORS and condition[1] != 'contains':
+            raise ValueError(f"Unknown rule operator: {condition[1]!r}")
+        self.condition = condition
+        self.template = template
+        self.fields = tuple(field for _, field, _, _ in string.Formatter().parse(template) if field)
+
+    def __repr__(self):
+        return f"Rule({self.condition!r}, {self.template!r})"
+
+def _column(param_sets, name, default):
+    return [params.get(name, default) for params in param_sets]
+
+def _cache_keys(column):
+    """
+    Hashable keys for a column of values, equal only for values that format identically.
+
+    Keys include the type, since 7 and 7.0 compare equal but format differently.
+    """
+    types = set(map(type, column))
+    if list in types:
+        return [tuple(value) if isinstance(value, list) else (type(value), value) for value in column]
+    if types <= {str}:
+        return column
+    return list(zip(map(type, column), column))
+
+def _map_distinct(func, keys, values):
+    # Apply func once per distinct key and spread the results back over the rows
+    distinct = dict(zip(keys, values))
+    results = {key: func(value) for key, value in distinct.items()}
+    return list(map(results.__getitem__, keys))
+
+def _contains(values, needles):
+    # Genres repeat across a roster, so test each distinct value once
+    uniques, inverse = np.unique(np.array(values, dtype=str), return_inverse=True)
+    hits = np.array([any(needle in value for needle in needles) for value in uniques], dtype=bool)
+    return hits[inverse]
+
+class RuleSet:
+    """
+    A declarative rule table evaluated over many parameter sets at once.
+
+    Args:
+        rules (list): Rule rows, in the order their messages are emitted
+        defaults (dict): Value used for each column missing from a parameter set
+        derived (dict, optional): Template fields computed when messages are
+            materialized, as name -> (source column, function of the source value)
+    """
+    def __init__(self, rules, defaults, derived=None):
+        self.rules = list(rules)
+        self.defaults = dict(defaults)
+        self.derived = dict(derived or {})
+
+        used = {rule.condition[0] for rule in self.rules if rule.condition}
+        used |= {field for rule in self.rules for field in rule.fields if field not in self.derived}
+        used |= {source for source, _ in self.derived.values()}
+        unknown = used - set(self.defaults)
+        if unknown:
+            raise ValueError(f"Rules use columns without defaults: {sorted(unknown)}")
+
+    def evaluate(self, param_sets):
+        """
+        Evaluate every rule over N parameter sets with boolean masks.
+
+        Args:
+            param_sets (list): Parameter dictionaries
+
+        Returns:
+            RuleMatches: Matches, with messages materialized on access
+        """
+        param_sets = list(param_sets)
+        columns = {name: _column(param_sets, name, default) for name, default in self.defaults.items()}
+
+        masks = np.ones((len(self.rules), len(param_sets)), dtype=bool)
+        for i, rule in enumerate(self.rules):
+            if rule.condition is None:
+                continue
+            name, op, value = rule.condition
+            if op == 'contains':
+                masks[i] = _contains(columns[name], value if isinstance(value, (tuple, list)) else (value,))
+            else:
+                masks[i] = OPERATORS[op](np.array(columns[name], dtype=float), value)
+
+        return RuleMatches(self, columns, masks)
+
+class RuleMatches:
+    """
+    Result of RuleSet.evaluate: a (rules x rows) boolean mask.
+
+    Messages are only formatted when a row is accessed, so roster-wide
+    counts never build strings.
+    """
+    def __init__(self, rule_set, columns, masks):
+        self.rule_set = rule_set
+        self.columns = columns
+        self.masks = masks
+        self._matched = None
+        self._fields = {}
+        self._messages = {}
+
+    def __len__(self):
+        return self.masks.shape[1]
+
+    def _field(self, name):
+        # Template field values for every row, derived once per distinct source value
+        if name not in self._fields:
+            if name in self.rule_set.derived:
+                source, func = self.rule_set.derived[name]
+                column = self.columns[source]
+                self._fields[name] = _map_distinct(func, _cache_keys(column), column)
+            else:
+                self._fields[name] = self.columns[name]
+        return self._fields[name]
+
+    def _rule_messages(self, i):
+        # Messages of rule i for every row, formatted once per distinct field values
+        if i not in self._messages:
+            rule = self.rule_set.rules[i]
+            if not rule.fields:
+                self._messages[i] = rule.template
+            else:
+                columns = [self._field(name) for name in rule.fields]
+                keys = list(zip(*map(_cache_keys, columns)))
+                self._messages[i] = _map_distinct(lambda values: rule.template.format(**dict(zip(rule.fields, values))),
+                                                  keys, list(zip(*columns)))
+        return self._messages[i]
+
+    def _matched_rules(self):
+        if self._matched is None:
+            # Encode each row's mask as an integer; rows sharing a pattern share its rule list
+            n_rules = len(self.rule_set.rules)
+            if n_rules < 63:
+                codes = (self.masks.astype(np.int64) << np.arange(n_rules, dtype=np.int64)[:, None]).sum(axis=0).tolist()
+                patterns = {code: [i for i in range(n_rules) if code >> i & 1] for code in set(codes)}
+                self._matched = list(map(patterns.__getitem__, codes))
+            else:
+                self._matched = [np.flatnonzero(row_mask).tolist() for row_mask in self.masks.T]
+        return self._matched
+
+    def __getitem__(self, row):
+        """
+        Materialize the messages of one row.
+
+        Returns:
+            list: Messages of the matching rules, in rule order
+        """
+        messages = [self._rule_messages(i) for i in self._matched_rules()[row]]
+        return [message if isinstance(message, str) else message[row] for message in messages]
+
+    def __iter__(self):
+        # Format every rule's messages up front, then assemble rows without per-row lookups
+        columns = [self._rule_messages(i) for i in range(len(self.rule_set.rules))]
+        static = [isinstance(column, str) for column in columns]
+        for row, matched in enumerate(self._matched_rules()):
+            yield [columns[i] if static[i] else columns[i][row] for i in matched]
+
+    def counts(self):
+        """
+        Count the rows each rule applies to.
+
+        Returns:
+            list: (template, count) pairs in rule order
+        """
+        return [(rule.template, int(count)) for rule, count in zip(self.rule_set.rules, self.masks.sum(axis=1))]
@@ -0,0 +1,118 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from modules.parameters import validate_params
+from modules.pipeline import simulate_trend, preprocess_history, compute_features, predict_outcomes, compute_metrics
+from modules.prediction_models import load_prediction_models
+from modules.prediction_intervals import load_calibrations
+
+# Scenario comparison accepts between two and eight parameter sets
+MIN_SCENARIOS = 2
+MAX_SCENARIOS = 8
+
+# Models and their interval calibrations loaded once per worker process by init_worker
+_worker_models = None
+_worker_calibrations = None
+
+def init_worker():
+    """
+    Load the prediction models and their calibrations when a worker process
+    starts, so the first scenario on each worker does not pay for it.
+    """
+    global _worker_models, _worker_calibrations
+    _worker_models = load_prediction_models()
+    _worker_calibrations = load_calibrations()
+
+def create_scenario_pool(max_workers=None):
+    """
+    Create a process pool whose workers have the prediction models loaded.
+
+    Args:
+        max_workers (int, optional): Pool size; defaults to default_worker_count()
+
+    Returns:
+        ProcessPoolExecutor: Worker pool for run_scenarios
+    """
+    return ProcessPoolExecutor(max_workers=max_workers or default_worker_count(), initializer=init_worker)
+
+def default_worker_count(scenario_count=MAX_SCENARIOS):
+    """
+    Get the number of worker processes to use for a scenario batch.
+
+    Args:
+        scenario_count (int): Number of scenarios to run
+
+    Returns:
+        int: Worker count, bounded by the scenario count and CPU count
+    """
+    return max(1, min(scenario_count, os.cpu_count() or 1))
+
+def run_scenario(params, seed=None, features=None):
+    """
+    Run the simulation, metrics and prediction pipeline for one scenario.
+
+    Args:
+        params (dict): Validated parameter set
+        seed (int, optional): Seed for the trend simulator; None draws a fresh one
+        features (pd.DataFrame, optional): Precomputed model features; skips
+            preprocessing and feature extraction
+
+    Returns:
+        dict: Parameters, trend data, features, metrics and the scenario's runtime in seconds
+    """
+    # Forked workers inherit the parent's random state, so always reseed
+    random.seed(seed)
+
+    start = time.perf_counter()
+    trend_data = simulate_trend(params)
+    if features is None:
+        features = compute_features(preprocess_history(trend_data))
+    predictions = predict_outcomes(features, models=_worker_models, calibrations=_worker_calibrations)
+    metrics = compute_metrics(trend_data, params, predictions)
+
+    return {
+        'params': params,
+        'trend_data': trend_data,
+        'features': features,
+        'metrics': metrics,
+        'seconds': time.perf_counter() - start
+    }
+
+def run_scenarios(param_sets, executor=None, max_workers=None, seeds=None):
+    """
+    Run several scenarios concurrently in a process pool.
+
+    Args:
+        param_sets (list): Parameter sets following the sidebar schema
+        executor (concurrent.futures.Executor, optional): Pool to reuse; a
+            temporary process pool is created if omitted
+        max_workers (int, optional): Size of the temporary pool
+        seeds (list, optional): Simulator seed per scenario
+
+    Returns:
+        dict: Scenario results in input order, wall time and summed scenario time
+
+    Raises:
+        ValueError: If the number of scenarios or a parameter set is invalid
+    """
+    if not MIN_SCENARIOS <= len(param_sets) <= MAX_SCENARIOS:
+        raise ValueError(f"Compare between {MIN_SCENARIOS} and {MAX_SCENARIOS} scenarios, got {len(param_sets)}")
+
+    validated = [validate_params(params) for params in param_sets]
+    seeds = seeds or [None] * len(validated)
+
+    start = time.perf_counter()
+    if executor is None:
+        with create_scenario_pool(max_workers or default_worker_count(len(validated))) as pool:
+            results = list(pool.map(run_scenario, validated, seeds))
+    else:
+        results = list(executor.map(run_scenario, validated, seeds))
+    wall_seconds = time.perf_counter() - start
+
+    return {
+        'scenarios': results,
+        'wall_seconds': wall_seconds,
+        'scenario_seconds': sum(result['seconds'] for result in results)
+    }
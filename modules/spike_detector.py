@@ -0,0 +1,334 @@
+import csv
+import io
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+# Signals watched per track, as preprocess_data defines them
+SIGNALS = ('growth', 'acceleration')
+
+# EWMA smoothing of each signal's mean and variance
+EWMA_ALPHA = 0.1
+
+# An EWMA alert fires when a signal is this many standard deviations above its mean
+Z_THRESHOLD = 6.0
+
+# CUSUM over the z-scores: slack subtracted per event, and the sum that fires an
+# alert. Breakouts raise growth by several standard deviations every hour, so
+# the slack is high enough that noise rarely accumulates; a CUSUM alert also
+# needs the alerting event itself this many standard deviations above the mean
+CUSUM_SLACK = 1.0
+CUSUM_THRESHOLD = 5.0
+CUSUM_CONFIRM_Z = 2.0
+
+# z-scores are clipped before they update the statistics, so one extreme
+# acceleration (growth divided by a near-zero growth) does not inflate the variance
+Z_CLIP = 6.0
+
+# Acceleration divides one growth value by another, so it is heavy-tailed even
+# for steady tracks; its alerts only count while growth is this many standard
+# deviations above its own mean
+ACCELERATION_CONFIRM_Z = 5.0
+
+# Observations of a signal before it can alert
+WARMUP_EVENTS = 24
+
+# Events of a track skipped after it alerted
+COOLDOWN_EVENTS = 24
+
+# Track capacity added when new track ids run past the allocated slots
+TRACK_CHUNK = 4096
+
+# Alert latencies kept for the latency percentiles
+LATENCY_SAMPLES = 10_000
+
+# Columns of the event stream and of emitted alerts
+EVENT_COLUMNS = ('timestamp', 'track_id', 'engagement')
+ALERT_COLUMNS = ('timestamp', 'track_id', 'engagement', 'growth', 'acceleration', 'z_growth', 'z_acceleration',
+                 'triggers', 'latency_ms')
+
+class SpikeDetector:
+    """
+    Online breakout detector over per-track engagement events.
+
+    Every event is one period's engagement of a track. The detector
+    derives growth and acceleration the way preprocess_data does, scores
+    each against an exponentially weighted mean and variance, and runs a
+    one-sided CUSUM over the scores. A track alerts when either score
+    crosses Z_THRESHOLD or either CUSUM crosses CUSUM_THRESHOLD.
+
+    State per track is a fixed set of numbers in preallocated arrays, and
+    a batch of events is processed with array operations, one pass per
+    event of the busiest track in the batch.
+    """
+    def __init__(self, alpha=EWMA_ALPHA, z_threshold=Z_THRESHOLD, cusum_slack=CUSUM_SLACK,
+                 cusum_threshold=CUSUM_THRESHOLD, warmup=WARMUP_EVENTS, cooldown=COOLDOWN_EVENTS):
+        self.alpha = alpha
+        self.z_threshold = z_threshold
+        self.cusum_slack = cusum_slack
+        self.cusum_threshold = cusum_threshold
+        self.warmup = warmup
+        self.cooldown = cooldown
+
+        self._slots = {}
+        self._track_ids = []
+        self._last = np.full(0, np.nan)
+        self._values = np.full((len(SIGNALS), 0), np.nan)
+        self._mean = np.zeros((len(SIGNALS), 0))
+        self._var = np.zeros((len(SIGNALS), 0))
+        self._cusum = np.zeros((len(SIGNALS), 0))
+        self._observed = np.zeros((len(SIGNALS), 0), dtype=np.int64)
+        self._quiet = np.zeros(0, dtype=np.int64)
+
+        self.events = 0
+        self.alerts = 0
+        self.busy_seconds = 0.0
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._track_ids)
+
+    def _slot_indices(self, track_ids):
+        # Map track ids to state slots, allocating slots for new tracks
+        slots = self._slots
+        indices = np.empty(len(track_ids), dtype=np.int64)
+        for i, track_id in enumerate(track_ids):
+            slot = slots.get(track_id)
+            if slot is None:
+                slot = slots[track_id] = len(self._track_ids)
+                self._track_ids.append(track_id)
+            indices[i] = slot
+
+        capacity = len(self._last)
+        if len(self._track_ids) > capacity:
+            extra = len(self._track_ids) - capacity + TRACK_CHUNK
+            self._last = np.concatenate([self._last, np.full(extra, np.nan)])
+            self._quiet = np.concatenate([self._quiet, np.zeros(extra, dtype=np.int64)])
+            for name, fill in (('_values', np.nan), ('_mean', 0.0), ('_var', 0.0), ('_cusum', 0.0), ('_observed', 0)):
+                old = getattr(self, name)
+                setattr(self, name, np.concatenate([old, np.full((len(SIGNALS), extra), fill, dtype=old.dtype)], axis=1))
+        return indices
+
+    def _step(self, slots, engagement):
+        # Process at most one event per slot; returns (fired, signal values, z-scores, triggers)
+        last = self._last[slots]
+        previous = self._values[:, slots]
+
+        # Growth and acceleration as in preprocess_data: undefined values carry the previous one forward
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = engagement / last - 1
+            growth = np.where(np.isfinite(growth), growth, previous[0])
+            acceleration = growth / previous[0] - 1
+            acceleration = np.where(np.isfinite(acceleration), acceleration, previous[1])
+        values = np.stack([growth, acceleration])
+        self._last[slots] = engagement
+        self._values[:, slots] = values
+
+        defined = np.isfinite(values)
+        observed = self._observed[:, slots]
+        mean = self._mean[:, slots]
+        var = self._var[:, slots]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = (values - mean) / np.sqrt(var)
+        z = np.where(defined & (observed > 1), z, 0.0)
+        z = np.clip(np.nan_to_num(z, nan=0.0, posinf=Z_CLIP, neginf=-Z_CLIP), -Z_CLIP, Z_CLIP)
+        cusum = np.where(defined, np.maximum(0.0, self._cusum[:, slots] + z - self.cusum_slack), 0.0)
+
+        # Exponentially weighted mean and variance, updated with the clipped value
+        first = defined & (observed == 0)
+        clipped = np.where(first | (var <= 0), values, mean + z * np.sqrt(var))
+        diff = clipped - mean
+        increment = self.alpha * diff
+        self._mean[:, slots] = np.where(first, values, np.where(defined, mean + increment, mean))
+        self._var[:, slots] = np.where(defined & ~first, (1 - self.alpha) * (var + diff * increment), var)
+        self._observed[:, slots] = observed + defined
+
+        armed = (observed >= self.warmup) & (self._quiet[slots] == 0)
+        armed[1] &= z[0] >= ACCELERATION_CONFIRM_Z
+        ewma_fired = armed & (z >= self.z_threshold)
+        cusum_fired = armed & (cusum >= self.cusum_threshold) & (z >= CUSUM_CONFIRM_Z)
+        fired = (ewma_fired | cusum_fired).any(axis=0)
+
+        # An alert resets the track's CUSUM and silences it for the cooldown
+        cusum[:, fired] = 0.0
+        self._cusum[:, slots] = cusum
+        self._quiet[slots] = np.where(fired, self.cooldown, np.maximum(self._quiet[slots] - 1, 0))
+
+        triggers = [
+            ",".join(f"{rule}:{signal}" for rule, hits in (('ewma', ewma_fired), ('cusum', cusum_fired))
+                     for s, signal in enumerate(SIGNALS) if hits[s, i])
+            for i in np.flatnonzero(fired)
+        ]
+        return fired, values, z, triggers
+
+    def update(self, track_ids, engagement, timestamps=None, arrived=None):
+        """
+        Process a batch of engagement events.
+
+        Events of the same track are applied in their order in the batch.
+
+        Args:
+            track_ids (sequence): Track of each event
+            engagement (array-like): Engagement of each event
+            timestamps (array-like, optional): Event times, copied into the alerts
+            arrived (float, optional): time.perf_counter() when the batch was
+                received, for the alert latency; defaults to now
+
+        Returns:
+            pd.DataFrame: One row per alert, with ALERT_COLUMNS
+        """
+        arrived = time.perf_counter() if arrived is None else arrived
+        engagement = np.asarray(engagement, dtype=np.float64)
+        if timestamps is None:
+            timestamps = np.full(len(engagement), np.datetime64('now'))
+        timestamps = np.asarray(timestamps)
+
+        with self._lock:
+            start = time.perf_counter()
+            slots = self._slot_indices(list(track_ids))
+
+            # Rank each event among its track's events, then process rank by rank
+            order = np.argsort(slots, kind='stable')
+            sorted_slots = slots[order]
+            group_start = np.flatnonzero(np.r_[True, sorted_slots[1:] != sorted_slots[:-1]])
+            rank = np.empty(len(slots), dtype=np.int64)
+            rank[order] = np.arange(len(slots)) - np.repeat(group_start, np.diff(np.r_[group_start, len(slots)]))
+
+            found = []
+            for r in range(int(rank.max()) + 1 if len(rank) else 0):
+                events = np.flatnonzero(rank == r)
+                fired, values, z, triggers = self._step(slots[events], engagement[events])
+                if triggers:
+                    found.append((events[fired], values[:, fired], z[:, fired], triggers))
+
+            done = time.perf_counter()
+            self.busy_seconds += done - start
+            self.events += len(slots)
+            latency_ms = (done - arrived) * 1000
+
+            if not found:
+                return pd.DataFrame(columns=list(ALERT_COLUMNS))
+            events = np.concatenate([f[0] for f in found])
+            values = np.concatenate([f[1] for f in found], axis=1)
+            z = np.concatenate([f[2] for f in found], axis=1)
+            self.alerts += len(events)
+            self._latencies.extend([latency_ms] * len(events))
+
+        return pd.DataFrame({
+            'timestamp': timestamps[events],
+            'track_id': [self._track_ids[slot] for slot in slots[events]],
+            'engagement': engagement[events],
+            'growth': values[0],
+            'acceleration': values[1],
+            'z_growth': z[0],
+            'z_acceleration': z[1],
+            'triggers': [trigger for f in found for trigger in f[3]],
+            'latency_ms': latency_ms
+        })
+
+    def metrics(self):
+        """
+        Throughput and alert latency so far.
+
+        Returns:
+            dict: tracks, events, alerts, events_per_second (while processing),
+                and latency_p50_ms / latency_p99_ms from batch arrival to alert
+        """
+        with self._lock:
+            latencies = np.array(self._latencies)
+            return {
+                'tracks': len(self._track_ids),
+                'events': self.events,
+                'alerts': self.alerts,
+                'events_per_second': self.events / self.busy_seconds if self.busy_seconds else 0.0,
+                'latency_p50_ms': float(np.percentile(latencies, 50)) if len(latencies) else None,
+                'latency_p99_ms': float(np.percentile(latencies, 99)) if len(latencies) else None
+            }
+
+def parse_event_lines(lines):
+    """
+    Parse `timestamp,track_id,engagement` lines into an event frame.
+
+    Timestamps with a UTC offset or `Z` are converted to UTC and returned
+    timezone-naive; timestamps without one are taken as UTC. Lines with the
+    wrong number of fields, an unparseable timestamp or a non-numeric
+    engagement are dropped.
+
+    Args:
+        lines (list): Complete lines, each ending in a newline
+
+    Returns:
+        pd.DataFrame: EVENT_COLUMNS, with parsed timestamps and string track ids
+    """
+    events = pd.read_csv(io.StringIO("".join(lines)), names=list(EVENT_COLUMNS), header=None,
+                         dtype={'track_id': str}, quoting=csv.QUOTE_NONE, on_bad_lines='skip')
+    events['timestamp'] = pd.to_datetime(events['timestamp'], format='ISO8601', utc=True,
+                                         errors='coerce').dt.tz_convert(None)
+    events['engagement'] = pd.to_numeric(events['engagement'], errors='coerce')
+    return events.dropna(subset=list(EVENT_COLUMNS)).reset_index(drop=True)
+
+def tail_events(path, batch_lines=100_000, poll_interval=0.2, follow=True, stop=None):
+    """
+    Read an engagement event file as it grows, like `tail -f`.
+
+    The file holds one `timestamp,track_id,engagement` line per event; a
+    header line with those names is skipped. A trailing partial line is
+    held back until the rest of it is written.
+
+    Args:
+        path (str): Event file; it may not exist yet when following
+        batch_lines (int): Most events per yielded batch
+        poll_interval (float): Seconds between checks for new lines
+        follow (bool): Keep waiting for new lines at the end of the file
+        stop (threading.Event, optional): Stops following when set
+
+    Yields:
+        tuple: (pd.DataFrame of EVENT_COLUMNS, time.perf_counter() when read)
+    """
+    while not os.path.exists(path):
+        if not follow or (stop is not None and stop.is_set()):
+            return
+        time.sleep(poll_interval)
+
+    header = ",".join(EVENT_COLUMNS)
+    partial = ""
+    with open(path) as f:
+        while True:
+            lines = f.readlines(batch_lines * 32)
+            if lines:
+                lines[0] = partial + lines[0]
+                partial = "" if lines[-1].endswith("\n") else lines.pop()
+                lines = [line for line in lines if line.strip() and not line.startswith(header)]
+                if lines:
+                    yield parse_event_lines(lines), time.perf_counter()
+                continue
+            if not follow or (stop is not None and stop.is_set()):
+                if partial.strip():
+                    yield parse_event_lines([partial + "\n"]), time.perf_counter()
+                return
+            time.sleep(poll_interval)
+
+def run_detector(detector, batches, on_alerts=None):
+    """
+    Feed event batches into a detector and hand over the alerts they raise.
+
+    Args:
+        detector (SpikeDetector): Detector to update
+        batches (iterable): (events, arrived) pairs, as tail_events yields
+        on_alerts (callable, optional): Called with each non-empty alert DataFrame
+
+    Returns:
+        dict: detector.metrics() after the last batch
+    """
+    for events, arrived in batches:
+        alerts = detector.update(events['track_id'].to_numpy(), events['engagement'].to_numpy(),
+                                 timestamps=events['timestamp'].to_numpy(), arrived=arrived)
+        if len(alerts) and on_alerts is not None:
+            on_alerts(alerts)
+    return detector.metrics()
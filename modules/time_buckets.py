@@ -0,0 +1,201 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Pyramid levels, finest first, with their bucket width in seconds
+RESOLUTIONS = ('hour', 'day', 'week')
+BUCKET_SECONDS = {'hour': 3600, 'day': 86400, 'week': 7 * 86400}
+
+# Buckets of each level per day, for windows expressed in days
+PERIODS_PER_DAY = {resolution: 86400 / seconds for resolution, seconds in BUCKET_SECONDS.items()}
+
+# Day 0 (1970-01-01) was a Thursday; weeks start on Monday
+WEEK_OFFSET_DAYS = 3
+
+# Most points a chart should draw
+MAX_CHART_POINTS = 200
+
+# Bucket capacity added when appended rows run past the allocated buckets
+BUCKET_CHUNK = 256
+
+def choose_resolution(span_days, max_points=MAX_CHART_POINTS):
+    """
+    Pick the finest resolution that covers a span in at most max_points buckets.
+
+    Args:
+        span_days (float): Length of the window or chart zoom, in days
+        max_points (int): Most buckets wanted over the span
+
+    Returns:
+        str: 'hour', 'day' or 'week'; 'week' if no finer level fits
+    """
+    for resolution in RESOLUTIONS:
+        if span_days * PERIODS_PER_DAY[resolution] <= max_points:
+            return resolution
+    return RESOLUTIONS[-1]
+
+def _bucket_starts(resolution, buckets):
+    # Start time of each bucket number, as datetime64[s]
+    if resolution == 'week':
+        seconds = (buckets * 7 - WEEK_OFFSET_DAYS) * 86400
+    else:
+        seconds = buckets * BUCKET_SECONDS[resolution]
+    return np.asarray(seconds, dtype=np.int64).astype('datetime64[s]')
+
+def _bucket_number(resolution, timestamp):
+    seconds = int(pd.Timestamp(timestamp).value // 10**9)
+    if resolution == 'week':
+        return (seconds // 86400 + WEEK_OFFSET_DAYS) // 7
+    return seconds // BUCKET_SECONDS[resolution]
+
+class _Level:
+    # Sums and counts of one resolution, over consecutive bucket numbers from start
+    def __init__(self):
+        self.start = None
+        self.size = 0
+        self.sums = np.zeros(0)
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def add(self, first, sums, counts):
+        last = first + len(sums) - 1
+        start = first if self.start is None else min(self.start, first)
+        shift = 0 if self.start is None else self.start - start
+        size = max(shift + self.size, last - start + 1)
+        if shift or size > len(self.sums):
+            new_sums = np.zeros(size + BUCKET_CHUNK)
+            new_counts = np.zeros(size + BUCKET_CHUNK, dtype=np.int64)
+            new_sums[shift:shift + self.size] = self.sums[:self.size]
+            new_counts[shift:shift + self.size] = self.counts[:self.size]
+            self.sums, self.counts = new_sums, new_counts
+        self.start, self.size = start, size
+
+        offset = first - start
+        self.sums[offset:offset + len(sums)] += sums
+        self.counts[offset:offset + len(counts)] += counts
+
+def _rollup(first, sums, counts, parents):
+    # Aggregate consecutive child buckets into their parent buckets
+    parent_first = parents[0]
+    index = parents - parent_first
+    n_parents = index[-1] + 1
+    return (parent_first,
+            np.bincount(index, weights=sums, minlength=n_parents),
+            np.bincount(index, weights=counts, minlength=n_parents).astype(np.int64))
+
+class EngagementPyramid:
+    """
+    Engagement per track pre-aggregated into hourly, daily and weekly buckets.
+
+    append() bins raw events into hours once, then rolls the new hourly
+    totals up into days and the daily totals into weeks, so every level
+    stays current and a query at any resolution only slices stored
+    buckets. Events may arrive in any order, including before earlier data.
+    """
+    def __init__(self):
+        self._tracks = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, track_id):
+        return track_id in self._tracks
+
+    @property
+    def tracks(self):
+        """Ids of the tracks with data, oldest first."""
+        return list(self._tracks)
+
+    def discard(self, track_id):
+        """
+        Drop all buckets of a track, if it has any.
+
+        Args:
+            track_id: Track identifier
+        """
+        with self._lock:
+            self._tracks.pop(track_id, None)
+
+    def append(self, track_id, timestamps, engagement):
+        """
+        Add raw engagement events of one track.
+
+        Args:
+            track_id: Track identifier
+            timestamps (array-like): Event times
+            engagement (array-like): Engagement of each event
+        """
+        seconds = pd.to_datetime(np.asarray(timestamps)).values.astype('datetime64[s]').astype(np.int64)
+        if len(seconds) == 0:
+            return
+        values = np.asarray(engagement, dtype=np.float64)
+
+        hours = seconds // BUCKET_SECONDS['hour']
+        first_hour = int(hours.min())
+        index = hours - first_hour
+        n_hours = int(index.max()) + 1
+        hourly = (first_hour,
+                  np.bincount(index, weights=values, minlength=n_hours),
+                  np.bincount(index, minlength=n_hours))
+
+        bucket_hours = np.arange(first_hour, first_hour + n_hours)
+        daily = _rollup(*hourly, bucket_hours // 24)
+        bucket_days = np.arange(daily[0], daily[0] + len(daily[1]))
+        weekly = _rollup(*daily, (bucket_days + WEEK_OFFSET_DAYS) // 7)
+
+        with self._lock:
+            levels = self._tracks.setdefault(track_id, {resolution: _Level() for resolution in RESOLUTIONS})
+            for resolution, (first, sums, counts) in zip(RESOLUTIONS, (hourly, daily, weekly)):
+                levels[resolution].add(int(first), sums, counts)
+
+    def query(self, track_id, resolution='day', start=None, end=None):
+        """
+        Engagement of one track at a resolution.
+
+        Args:
+            track_id: Track identifier
+            resolution (str): 'hour', 'day' or 'week'
+            start (datetime-like, optional): Only buckets containing or after this time
+            end (datetime-like, optional): Only buckets containing or before this time
+
+        Returns:
+            pd.DataFrame: date (bucket start), engagement (sum) and count
+                (events) per bucket, with empty buckets as zeros
+        """
+        if resolution not in BUCKET_SECONDS:
+            raise ValueError(f"Unknown resolution: {resolution!r}")
+        if track_id not in self._tracks:
+            raise KeyError(f"No engagement for track {track_id!r}")
+
+        with self._lock:
+            level = self._tracks[track_id][resolution]
+            first = 0 if start is None else max(0, _bucket_number(resolution, start) - level.start)
+            last = level.size if end is None else min(level.size, _bucket_number(resolution, end) - level.start + 1)
+            last = max(first, last)
+            sums = level.sums[first:last].copy()
+            counts = level.counts[first:last].copy()
+            buckets = np.arange(level.start + first, level.start + last)
+
+        return pd.DataFrame({
+            'date': pd.to_datetime(_bucket_starts(resolution, buckets)),
+            'engagement': sums,
+            'count': counts
+        })
+
+    def window(self, track_id, days, end=None, max_points=MAX_CHART_POINTS):
+        """
+        The last `days` days of a track at the finest resolution that fits max_points.
+
+        Args:
+            track_id: Track identifier
+            days (float): Length of the window or chart zoom
+            end (datetime-like, optional): End of the window; defaults to the last event
+            max_points (int): Most buckets wanted
+
+        Returns:
+            tuple: (resolution, DataFrame as returned by query)
+        """
+        resolution = choose_resolution(days, max_points)
+        if end is None:
+            level = self._tracks[track_id]['hour']
+            end = _bucket_starts('hour', level.start + level.size - 1) + np.timedelta64(3599, 's')
+        end = pd.Timestamp(end)
+        return resolution, self.query(track_id, resolution, start=end - pd.Timedelta(days=days), end=end)
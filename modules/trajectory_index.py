@@ -0,0 +1,279 @@
+import numpy as np
+
+# Days of history compared between trajectories
+HISTORY_DAYS = 30
+
+# Sakoe-Chiba band: how many days DTW may shift one curve against the other
+WARPING_WINDOW = 3
+
+# Piecewise aggregate approximation used to pick the first DTW candidates
+PAA_SEGMENTS = 6
+SEED_CANDIDATES = 1024
+
+# Candidates compared with full DTW per vectorized pass
+DTW_BATCH_SIZE = 32768
+
+# Share of curves left after LB_Kim above which a query skips LB_Keogh and
+# compares every curve with DTW in index order; gathering that many scattered
+# survivors costs more than scanning the whole index
+FULL_SCAN_SHARE = 0.5
+
+def znormalize(curves):
+    """
+    Scale each curve to zero mean and unit variance, so matching compares shape rather than level.
+
+    Args:
+        curves (np.ndarray): (n_curves, n_days) engagement values
+
+    Returns:
+        np.ndarray: float32 normalized curves; flat curves become all zeros
+    """
+    curves = np.asarray(curves, dtype=np.float64)
+    mean = curves.mean(axis=1, keepdims=True)
+    std = curves.std(axis=1, keepdims=True)
+    return ((curves - mean) / np.where(std > 0, std, 1)).astype(np.float32)
+
+def resample(curve, n_days):
+    """
+    Linearly resample a curve to n_days points.
+    """
+    curve = np.asarray(curve, dtype=np.float64)
+    if len(curve) == n_days:
+        return curve
+    return np.interp(np.linspace(0, len(curve) - 1, n_days), np.arange(len(curve)), curve)
+
+def paa(curves, segments=PAA_SEGMENTS):
+    """
+    Piecewise aggregate approximation: the mean of each of `segments` equal spans.
+    """
+    curves = np.asarray(curves)
+    bounds = np.linspace(0, curves.shape[1], segments + 1).astype(int)
+    return np.add.reduceat(curves, bounds[:-1], axis=1) / np.diff(bounds)
+
+def envelope(query, radius=WARPING_WINDOW):
+    """
+    Upper and lower envelope of a query within the warping window.
+
+    Returns:
+        tuple: (upper, lower) arrays, the running max and min over +/- radius days
+    """
+    upper, lower = query.copy(), query.copy()
+    for shift in range(1, radius + 1):
+        np.maximum(upper[shift:], query[:-shift], out=upper[shift:])
+        np.maximum(upper[:-shift], query[shift:], out=upper[:-shift])
+        np.minimum(lower[shift:], query[:-shift], out=lower[shift:])
+        np.minimum(lower[:-shift], query[shift:], out=lower[:-shift])
+    return upper, lower
+
+def dtw_distances(query, curves, radius=WARPING_WINDOW):
+    """
+    DTW distance from one query to a batch of curves, vectorized over the batch.
+
+    Uses squared pointwise differences within a Sakoe-Chiba band of the given
+    radius and returns the square root of the accumulated cost.
+
+    Args:
+        query (np.ndarray): Query curve of n_days values
+        curves (np.ndarray): (n_curves, n_days) candidate curves
+        radius (int): Warping window in days
+
+    Returns:
+        np.ndarray: DTW distance to each curve
+    """
+    n_curves, n_days = curves.shape
+    # Day-major layout keeps every per-day slice contiguous across the batch
+    days = np.ascontiguousarray(curves.T, dtype=np.float32)
+
+    previous = np.full((n_days + 1, n_curves), np.inf, dtype=np.float32)
+    previous[0] = 0
+    current = np.empty_like(previous)
+    cost = np.empty(n_curves, dtype=np.float32)
+    for i in range(n_days):
+        low, high = max(0, i - radius), min(n_days, i + radius + 1)
+        current[:low + 1] = np.inf
+        current[high + 1:] = np.inf
+        for j in range(low, high):
+            np.subtract(days[j], query[i], out=cost)
+            np.multiply(cost, cost, out=cost)
+            np.minimum(previous[j], previous[j + 1], out=current[j + 1])
+            np.minimum(current[j + 1], current[j], out=current[j + 1])
+            current[j + 1] += cost
+        previous, current = current, previous
+
+    return np.sqrt(previous[n_days])
+
+class TrajectoryIndex:
+    """
+    k-nearest-neighbour search over engagement curves under DTW.
+
+    The first history_days of each curve are z-normalized and indexed; any
+    later days are kept as the outcome that followed. A query first runs
+    DTW on the SEED_CANDIDATES curves closest in PAA space to get a k-th
+    best distance, then discards curves whose LB_PAA, LB_Kim and then
+    LB_Keogh lower bounds exceed it. The rest are compared with DTW in
+    order of LB_Keogh until the bound passes the current k-th best, so
+    results are exact. When more than FULL_SCAN_SHARE of the curves pass
+    LB_Kim, the query scans every curve with DTW instead.
+
+    Args:
+        curves (np.ndarray): (n_curves, n_days) engagement values, n_days >= history_days
+        track_ids (sequence, optional): Identifier of each curve; defaults to row numbers
+        history_days (int): Days of each curve compared with queries
+        radius (int): Warping window in days
+    """
+    def __init__(self, curves, track_ids=None, history_days=HISTORY_DAYS, radius=WARPING_WINDOW):
+        self.raw_curves = np.asarray(curves)
+        self.track_ids = list(track_ids) if track_ids is not None else list(range(len(self.raw_curves)))
+        self.history_days = history_days
+        self.radius = radius
+
+        # Day-major and segment-major storage keeps every whole-index pass on contiguous arrays
+        normalized = znormalize(self.raw_curves[:, :history_days])
+        self.days = np.ascontiguousarray(normalized.T)
+        self.paa_columns = np.ascontiguousarray(paa(normalized).T, dtype=np.float32)
+        # Days per PAA segment, weighting each segment in the LB_PAA bound
+        self.paa_weights = np.diff(np.linspace(0, history_days, PAA_SEGMENTS + 1).astype(int))
+        self.last_query_stats = {}
+
+    def __len__(self):
+        return self.days.shape[1]
+
+    def _curves(self, rows):
+        # Normalized history of the given rows, one row per curve
+        return self.days[:, rows].T
+
+    def _scan(self, query, k):
+        # DTW against every curve in index order, one contiguous batch at a time
+        distances = np.concatenate([dtw_distances(query, self._curves(slice(start, start + DTW_BATCH_SIZE)),
+                                                  self.radius)
+                                    for start in range(0, len(self), DTW_BATCH_SIZE)])
+        rows = np.argpartition(distances, k - 1)[:k]
+        rows = rows[np.argsort(distances[rows], kind='stable')]
+        return rows, distances[rows]
+
+    def query(self, curve, k=5):
+        """
+        Find the k stored curves whose history is closest to a curve under DTW.
+
+        Args:
+            curve (np.ndarray): Engagement history; resampled to history_days if needed
+            k (int): Number of matches
+
+        Returns:
+            list: Up to k (row, distance) pairs, nearest first
+        """
+        query = znormalize(resample(curve, self.history_days).reshape(1, -1))[0]
+        n_curves = len(self)
+        k = min(k, n_curves)
+        upper, lower = envelope(query, self.radius)
+
+        # One pass over the PAA columns: distance in PAA space, and LB_PAA
+        # (squared) against the PAA of the query envelope
+        query_paa = paa(query.reshape(1, -1))[0]
+        paa_upper, paa_lower = paa(upper.reshape(1, -1))[0], paa(lower.reshape(1, -1))[0]
+        paa_distances = np.zeros(n_curves, dtype=np.float32)
+        lb_paa = np.zeros(n_curves, dtype=np.float32)
+        scratch = np.empty(n_curves, dtype=np.float32)
+        for segment, column in enumerate(self.paa_columns):
+            np.subtract(column, query_paa[segment], out=scratch)
+            paa_distances += scratch * scratch
+            np.subtract(column, paa_upper[segment], out=scratch)
+            np.maximum(scratch, np.subtract(paa_lower[segment], column), out=scratch)
+            np.maximum(scratch, 0, out=scratch)
+            lb_paa += self.paa_weights[segment] * scratch * scratch
+
+        # Seed the k-th best distance with the curves nearest in PAA space
+        n_seeds = min(max(SEED_CANDIDATES, k), n_curves)
+        seeds = np.argpartition(paa_distances, n_seeds - 1)[:n_seeds]
+        seed_distances = dtw_distances(query, self._curves(seeds), self.radius)
+        keep = np.argsort(seed_distances)[:k]
+        best_rows, best_distances = seeds[keep], seed_distances[keep]
+        threshold = best_distances[-1]
+
+        # Cheap pre-filters on every curve: LB_PAA, then LB_Kim from the first
+        # and last days, which every warping path aligns
+        candidates = lb_paa < threshold ** 2
+        candidates[seeds] = False
+        after_paa = int(candidates.sum())
+        rows = np.flatnonzero(candidates)
+        lb_kim = (self.days[0, rows] - query[0]) ** 2 + (self.days[-1, rows] - query[-1]) ** 2
+        rows = rows[lb_kim < threshold ** 2]
+        after_kim = len(rows)
+
+        if after_kim > FULL_SCAN_SHARE * n_curves:
+            best_rows, best_distances = self._scan(query, k)
+            self.last_query_stats = {
+                'curves': n_curves,
+                'after_lb_paa': after_paa,
+                'after_lb_kim': after_kim,
+                'after_lb_keogh': after_kim,
+                'dtw_computed': n_seeds + n_curves,
+                'full_scan': True
+            }
+            return [(int(row), float(distance)) for row, distance in zip(best_rows, best_distances)]
+
+        # LB_Keogh on the survivors, accumulated one day at a time
+        bounds = np.zeros(len(rows), dtype=np.float32)
+        for day in range(self.history_days):
+            values = self.days[day, rows]
+            excess = np.maximum(np.maximum(values - upper[day], lower[day] - values), 0)
+            bounds += excess * excess
+        bounds = np.sqrt(bounds)
+        keep = bounds < threshold
+        rows, bounds = rows[keep], bounds[keep]
+        after_keogh = len(rows)
+
+        # DTW in order of the lower bound until it passes the k-th best
+        order = np.argsort(bounds)
+        rows, bounds = rows[order], bounds[order]
+        computed = n_seeds
+        for start in range(0, len(rows), DTW_BATCH_SIZE):
+            batch = slice(start, start + DTW_BATCH_SIZE)
+            # Gathered in index order, which reads the day-major storage far faster
+            batch_rows = np.sort(rows[batch][bounds[batch] < threshold])
+            if len(batch_rows) == 0:
+                break
+            distances = dtw_distances(query, self._curves(batch_rows), self.radius)
+            computed += len(batch_rows)
+            best_rows = np.concatenate([best_rows, batch_rows])
+            best_distances = np.concatenate([best_distances, distances])
+            keep = np.argsort(best_distances, kind='stable')[:k]
+            best_rows, best_distances = best_rows[keep], best_distances[keep]
+            threshold = best_distances[-1]
+
+        self.last_query_stats = {
+            'curves': n_curves,
+            'after_lb_paa': after_paa,
+            'after_lb_kim': after_kim,
+            'after_lb_keogh': after_keogh,
+            'dtw_computed': computed,
+            'full_scan': False
+        }
+        return [(int(row), float(distance)) for row, distance in zip(best_rows, best_distances)]
+
+    def precedents(self, history, k=5):
+        """
+        Find the stored tracks whose history looked most like a curve, with what happened next.
+
+        Args:
+            history (np.ndarray): Engagement history of the current track
+            k (int): Number of matches
+
+        Returns:
+            list: Dictionaries with track_id, distance, history_days and curve,
+                the full stored curve rescaled to the mean and spread of the
+                given history; its first history_days values are the matched part
+        """
+        window = resample(history, self.history_days)
+        precedents = []
+        for row, distance in self.query(window, k):
+            raw = self.raw_curves[row].astype(np.float64)
+            std = raw[:self.history_days].std()
+            scaled = (raw - raw[:self.history_days].mean()) / (std if std > 0 else 1)
+            precedents.append({
+                'track_id': self.track_ids[row],
+                'distance': distance,
+                'history_days': self.history_days,
+                'curve': scaled * window.std() + window.mean()
+            })
+        return precedents
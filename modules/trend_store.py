@@ -0,0 +1,138 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+# Store the app reads observed platform engagement from, and `cli.py ingest` writes to by default
+DEFAULT_STORE_PATH = os.path.join('data', 'trend_store.db')
+
+class TrendStore:
+    """
+    Observed engagement per (platform, track_id, hour), persisted in SQLite.
+
+    Writes add to existing cells, so late or repeated batches for the same
+    hour accumulate. A per-(platform, day) rollup is maintained in the same
+    transaction, so platform totals never scan the hourly rows.
+    """
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS engagement ("
+            "platform TEXT NOT NULL, track_id TEXT NOT NULL, hour TEXT NOT NULL, engagement REAL NOT NULL, "
+            "PRIMARY KEY (platform, track_id, hour)) WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS platform_daily ("
+            "platform TEXT NOT NULL, day TEXT NOT NULL, engagement REAL NOT NULL, "
+            "PRIMARY KEY (platform, day)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+        # The connection is shared by the threads that ingestion writes from
+        self._lock = threading.Lock()
+
+    def write_batch(self, platform, events):
+        """
+        Add a batch of one platform's engagement events in a single transaction.
+
+        Args:
+            platform (str): Platform the events were observed on
+            events (pd.DataFrame): timestamp, track_id and engagement columns
+
+        Returns:
+            int: Number of events written
+        """
+        if len(events) == 0:
+            return 0
+        frame = pd.DataFrame({
+            'hour': pd.to_datetime(events['timestamp']).to_numpy().astype('datetime64[h]').astype(np.int64),
+            'track_id': events['track_id'].astype(str),
+            'engagement': events['engagement'].astype(float)
+        })
+        # Aggregate on integer hours and format only the distinct ones
+        hourly = frame.groupby(['track_id', 'hour'], sort=False)['engagement'].sum()
+        hours = hourly.index.get_level_values('hour').to_numpy()
+        distinct = np.unique(hours)
+        labels = dict(zip(distinct.tolist(), np.datetime_as_string(distinct.astype('datetime64[h]'), unit='h')))
+        hour_labels = [labels[hour] for hour in hours.tolist()]
+        daily = hourly.groupby([label[:10] for label in hour_labels]).sum()
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO engagement (platform, track_id, hour, engagement) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (platform, track_id, hour) DO UPDATE SET engagement = engagement + excluded.engagement",
+                list(zip([platform] * len(hourly), hourly.index.get_level_values('track_id'), hour_labels,
+                         hourly.to_numpy().tolist()))
+            )
+            self._conn.executemany(
+                "INSERT INTO platform_daily (platform, day, engagement) VALUES (?, ?, ?) "
+                "ON CONFLICT (platform, day) DO UPDATE SET engagement = engagement + excluded.engagement",
+                [(platform, day, value) for day, value in daily.items()]
+            )
+        return len(events)
+
+    def platform_totals(self, days=None):
+        """
+        Engagement per platform.
+
+        Args:
+            days (int, optional): Only the last `days` days up to today; None for all
+
+        Returns:
+            dict: Total engagement keyed by platform
+        """
+        since = '' if days is None else (datetime.now().date() - timedelta(days=days - 1)).isoformat()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT platform, SUM(engagement) FROM platform_daily WHERE day >= ? GROUP BY platform", (since,)
+            ).fetchall()
+        return dict(rows)
+
+    def platform_shares(self, days=None):
+        """
+        Share of engagement per platform, as generate_platform_distribution returns it.
+
+        Returns:
+            dict: Shares summing to 1, highest first; empty if nothing was observed
+        """
+        totals = self.platform_totals(days)
+        total = sum(totals.values())
+        if not total:
+            return {}
+        return dict(sorted(((platform, value / total) for platform, value in totals.items()),
+                           key=lambda item: item[1], reverse=True))
+
+    def read_track(self, platform, track_id):
+        """
+        Hourly engagement of one track on one platform.
+
+        Returns:
+            pd.DataFrame: hour and engagement columns in time order
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT hour, engagement FROM engagement WHERE platform = ? AND track_id = ? ORDER BY hour",
+                (platform, str(track_id))
+            ).fetchall()
+        return pd.DataFrame({
+            'hour': pd.to_datetime([hour for hour, _ in rows], format='%Y-%m-%dT%H'),
+            'engagement': [value for _, value in rows]
+        })
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
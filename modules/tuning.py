@@ -0,0 +1,258 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from modules.backtesting import HORIZON_DAYS, history_feature_matrix, realized_outcomes, rolling_origins
+from modules.prediction_models import MODEL_REGISTRY
+from modules.scenarios import default_worker_count
+
+# Hyperparameters searched per model type; the others keep DEFAULT_HYPERPARAMETERS
+PARAM_GRIDS = {
+    'random_forest': {
+        'n_estimators': [50, 100, 200, 400],
+        'max_depth': [4, 6, 10, 16, None]
+    },
+    'gradient_boosting': {
+        'learning_rate': [0.03, 0.1, 0.3],
+        'max_depth': [2, 3, 5, 8]
+    }
+}
+
+# Share of candidates kept, and growth of the training samples, per halving round
+HALVING_FACTOR = 3
+
+# Forward-chaining folds over forecast origins
+CV_SPLITS = 3
+
+# Objective points per millisecond of single-track prediction latency; the
+# accuracy part of the objective is RMSE divided by the target's std
+LATENCY_WEIGHT = 0.01
+
+# Single-row predictions timed per latency measurement
+LATENCY_REPEATS = 30
+
+def build_training_set(curves, target, start_date=None, horizon=HORIZON_DAYS, max_workers=None):
+    """
+    Features and realized outcomes of every track at every rolling forecast origin.
+
+    Samples are ordered by origin, so earlier rows never come from later dates.
+
+    Args:
+        curves (np.ndarray): (n_tracks, n_days) daily engagement
+        target (str): Model in MODEL_REGISTRY whose outcome is the label
+        start_date (datetime-like, optional): Date of the first day; defaults to n_days ago
+        horizon (int): Days after each origin in which outcomes are realized
+        max_workers (int, optional): Worker processes computing the features
+
+    Returns:
+        tuple: (features np.ndarray, targets np.ndarray, origin of each sample np.ndarray)
+    """
+    if target not in MODEL_REGISTRY:
+        raise ValueError(f"Unknown model {target!r}; expected one of {', '.join(MODEL_REGISTRY)}")
+    curves = np.asarray(curves, dtype=np.float64)
+    n_tracks, n_days = curves.shape
+    if start_date is None:
+        start_date = pd.Timestamp.now().normalize() - pd.Timedelta(days=n_days)
+    origins = rolling_origins(n_days, horizon=horizon)
+    if len(origins) < 2:
+        raise ValueError(f"{n_days} days leave fewer than 2 forecast origins to cross-validate over")
+
+    tasks = [(curves[:, :origin], start_date) for origin in origins]
+    with ProcessPoolExecutor(max_workers=max_workers or default_worker_count(len(tasks))) as pool:
+        features = list(pool.map(history_feature_matrix, tasks))
+
+    targets = [realized_outcomes(curves, origin, horizon)[target] for origin in origins]
+    return (np.vstack(features), np.concatenate(targets),
+            np.repeat(np.asarray(origins), n_tracks))
+
+def time_series_folds(sample_origins, n_splits=CV_SPLITS):
+    """
+    Forward-chaining folds: each trains on the origins before its test origin.
+
+    Args:
+        sample_origins (np.ndarray): Forecast origin of each sample, in time order
+        n_splits (int): Most folds; bounded by the number of origins minus one
+
+    Returns:
+        list: (train indices, test indices) pairs
+    """
+    origins = np.unique(sample_origins)
+    n_splits = min(n_splits, len(origins) - 1)
+    folds = []
+    for test_origin in origins[-n_splits:]:
+        folds.append((np.flatnonzero(sample_origins < test_origin),
+                      np.flatnonzero(sample_origins == test_origin)))
+    return folds
+
+def prediction_latency_ms(model, features, repeats=LATENCY_REPEATS):
+    """
+    Median time to predict a single track, as the app does per request.
+
+    Returns:
+        float: Milliseconds per single-row prediction
+    """
+    row = features[:1]
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        model.predict(row)
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings)) * 1000
+
+def latency_aware_scorer(latency_weight=LATENCY_WEIGHT):
+    """
+    Scorer combining accuracy and inference latency; higher is better.
+
+    Args:
+        latency_weight (float): Objective points per millisecond of latency
+
+    Returns:
+        callable: scorer(estimator, X, y) returning -(RMSE / std(y) + latency_weight * latency_ms)
+    """
+    def score(estimator, features, targets):
+        rmse = np.sqrt(np.mean((estimator.predict(features) - targets) ** 2))
+        normalized = rmse / max(float(np.std(targets)), 1e-9)
+        return -(normalized + latency_weight * prediction_latency_ms(estimator, features))
+    return score
+
+def _search(model_type, features, targets, folds, latency_weight, n_jobs, random_state):
+    from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+    from sklearn.model_selection import HalvingGridSearchCV
+
+    from models.model_loader import create_default_model
+
+    search = HalvingGridSearchCV(
+        create_default_model(model_type),
+        PARAM_GRIDS[model_type],
+        factor=HALVING_FACTOR,
+        resource='n_samples',
+        min_resources='exhaust',
+        cv=folds,
+        scoring=latency_aware_scorer(latency_weight),
+        n_jobs=n_jobs,
+        random_state=random_state
+    )
+    search.fit(features, targets)
+    return search
+
+def evaluate_configuration(model_type, hyperparameters, features, targets, folds, latency_weight=LATENCY_WEIGHT):
+    """
+    Cross-validate one configuration on all the training samples of each fold.
+
+    Args:
+        model_type (str): Key of DEFAULT_HYPERPARAMETERS
+        hyperparameters (dict, optional): Values overriding the defaults
+        features (np.ndarray): Samples, as build_training_set returns them
+        targets (np.ndarray): Realized outcomes
+        folds (list): (train indices, test indices) pairs
+        latency_weight (float): Objective points per millisecond of latency
+
+    Returns:
+        dict: Mean 'objective', 'rmse', 'normalized_rmse' and 'latency_ms' over the folds
+    """
+    from models.model_loader import create_default_model
+
+    rmse, normalized, latency = [], [], []
+    for train, test in folds:
+        model = create_default_model(model_type, hyperparameters=hyperparameters)
+        model.fit(features[train], targets[train])
+        error = np.sqrt(np.mean((model.predict(features[test]) - targets[test]) ** 2))
+        rmse.append(error)
+        normalized.append(error / max(float(np.std(targets[test])), 1e-9))
+        latency.append(prediction_latency_ms(model, features[test]))
+    return {
+        'objective': float(np.mean(normalized) + latency_weight * np.mean(latency)),
+        'rmse': float(np.mean(rmse)),
+        'normalized_rmse': float(np.mean(normalized)),
+        'latency_ms': float(np.mean(latency))
+    }
+
+def tune_model(curves, target, model_types=None, start_date=None, latency_weight=LATENCY_WEIGHT,
+               max_workers=None, model_dir='models/trained', save=True, random_state=42):
+    """
+    Tune a registered model's hyperparameters with successive halving.
+
+    Every candidate in PARAM_GRIDS is cross-validated with forward-chaining
+    folds over forecast origins. Each halving round keeps the best
+    1/HALVING_FACTOR of the candidates and gives them HALVING_FACTOR times
+    more training samples; fits run in parallel across worker processes.
+    Candidates are ranked by RMSE / std(target) plus latency_weight times
+    their single-track prediction latency in milliseconds.
+
+    The winner is refit on all samples and saved with its configuration in
+    the model's metadata, which load_model reads back.
+
+    Args:
+        curves (np.ndarray): (n_tracks, n_days) daily engagement, such as
+            generate_historical_trends returns
+        target (str): Model in MODEL_REGISTRY to tune
+        model_types (list, optional): Keys of PARAM_GRIDS to search; all by default
+        start_date (datetime-like, optional): Date of the first day
+        latency_weight (float): Objective points per millisecond of latency
+        max_workers (int, optional): Worker processes; all CPUs by default
+        model_dir (str): Directory the model and its metadata are saved to
+        save (bool): Whether to save the winner
+        random_state (int): Seed of the halving rounds' sample subsets
+
+    Returns:
+        dict: 'model' (fitted winner), 'metadata', 'candidates' (pd.DataFrame
+            of every evaluated candidate per round), 'fits' and 'wall_seconds'
+    """
+    from models.model_loader import DEFAULT_HYPERPARAMETERS, save_model, save_model_metadata
+
+    started = time.perf_counter()
+    features, targets, sample_origins = build_training_set(curves, target, start_date=start_date,
+                                                           max_workers=max_workers)
+    folds = time_series_folds(sample_origins)
+    n_jobs = max_workers or -1
+
+    best, candidates = None, []
+    for model_type in model_types or list(PARAM_GRIDS):
+        search = _search(model_type, features, targets, folds, latency_weight, n_jobs, random_state)
+        results = pd.DataFrame(search.cv_results_)
+        candidates.append(pd.DataFrame({
+            'model_type': model_type,
+            'round': results['iter'],
+            'samples': results['n_resources'],
+            'params': results['params'].map(lambda params: ", ".join(f"{k}={v}" for k, v in params.items())),
+            'objective': -results['mean_test_score']
+        }))
+        if best is None or search.best_score_ > best[1].best_score_:
+            best = (model_type, search)
+    candidates = pd.concat(candidates, ignore_index=True)
+
+    model_type, search = best
+    model = search.best_estimator_
+    hyperparameters = {**DEFAULT_HYPERPARAMETERS[model_type], **search.best_params_}
+    # The last halving round may train on a subset; score the winner on the full folds
+    scores = evaluate_configuration(model_type, hyperparameters, features, targets, folds, latency_weight)
+
+    metadata = {
+        'model': target,
+        'model_type': model_type,
+        'hyperparameters': hyperparameters,
+        'objective': scores['objective'],
+        'cv_rmse': scores['rmse'],
+        'cv_normalized_rmse': scores['normalized_rmse'],
+        'latency_ms': prediction_latency_ms(model, features),
+        'latency_weight': latency_weight,
+        'samples': int(len(targets)),
+        'cv_folds': len(folds),
+        'tuned_at': datetime.now().isoformat(timespec='seconds')
+    }
+    if save:
+        model_path = os.path.join(model_dir, MODEL_REGISTRY[target][1])
+        save_model(model, model_path)
+        save_model_metadata(metadata, model_path)
+
+    return {
+        'model': model,
+        'metadata': metadata,
+        'candidates': candidates,
+        'fits': len(candidates) * len(folds),
+        'wall_seconds': time.perf_counter() - started
+    }
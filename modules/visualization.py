@@ -1,6 +1,6 @@
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime
+from datetime import datetime, timedelta
 
 def create_trend_chart(trend_data, genre, metrics):
     """
@@ -148,12 +148,14 @@ def create_radar_chart(params):
     
     return fig
 
-def create_platform_distribution_chart(platforms):
+def create_platform_distribution_chart(platforms, observed=None):
     """
     Create a bar chart for platform distribution.
     
     Args:
         platforms (dict): Dictionary with platform names and distribution values
+        observed (dict, optional): Observed share of engagement per platform,
+            drawn next to the predicted one
         
     Returns:
         plotly.graph_objects.Figure: Plotly figure object
@@ -169,6 +171,13 @@ def create_platform_distribution_chart(platforms):
     fig.update_traces(marker_color='#9067ff', marker_line_color='#BD4DE6',
                       marker_line_width=1.5, opacity=0.8)
     
+    if observed:
+        fig.update_traces(name="Predicted", showlegend=True)
+        fig.add_bar(x=list(platforms.keys()), y=[observed.get(platform, 0.0) for platform in platforms],
+                    name="Observed", marker_color='#4dd9e6', marker_line_color='#BD4DE6',
+                    marker_line_width=1.5, opacity=0.8)
+        fig.update_layout(barmode='group', title="Platform Distribution: Predicted vs Observed")
+    
     # Update layout
     fig.update_layout(
         plot_bgcolor='rgba(10, 10, 26, 0.8)',
@@ -184,4 +193,259 @@ def create_platform_distribution_chart(platforms):
         )
     )
     
-    return fig
\ No newline at end of file
+    return fig
+
+def create_demographic_chart(demographics, title="Demographic Neural Resonance"):
+    """
+    Create a donut chart for demographic appeal.
+    
+    Args:
+        demographics (dict): Dictionary with age groups or audience segments and appeal values
+        title (str): Chart title
+        
+    Returns:
+        plotly.graph_objects.Figure: Plotly figure object
+    """
+    fig = go.Figure(data=[go.Pie(
+        labels=list(demographics.keys()),
+        values=list(demographics.values()),
+        hole=.5,
+        marker=dict(
+            colors=['#BD4DE6', '#9067ff', '#6e45e2', '#4527a0', '#311b92'],
+            line=dict(color='#000000', width=1)
+        ),
+        textfont=dict(color='white'),
+        textinfo='label+percent'
+    )])
+    
+    fig.update_layout(
+        title=title,
+        plot_bgcolor='rgba(10, 10, 26, 0)',
+        paper_bgcolor='rgba(10, 10, 26, 0)',
+        font_color='#e0e0ff',
+        showlegend=False,
+    )
+    
+    return fig
+
+def create_scenario_comparison_chart(scenarios, labels):
+    """
+    Create a chart overlaying the trend trajectories of several scenarios.
+    
+    Args:
+        scenarios (list): Scenario results, each with a 'trend_data' DataFrame
+        labels (list): Display name of each scenario
+        
+    Returns:
+        plotly.graph_objects.Figure: Plotly figure object
+    """
+    colors = ['#BD4DE6', '#9067ff', '#00ffff', '#ff00cc', '#FF5733', '#6e45e2', '#3333ff', '#c9b6ff']
+    
+    fig = go.Figure()
+    
+    for i, (scenario, label) in enumerate(zip(scenarios, labels)):
+        trend_data = scenario['trend_data']
+        color = colors[i % len(colors)]
+        
+        # Solid line for history, dashed line for the forecast
+        for is_forecast, dash in [(False, 'solid'), (True, 'dash')]:
+            segment = trend_data[trend_data['is_forecast'] == is_forecast]
+            fig.add_trace(go.Scatter(
+                x=segment['date'],
+                y=segment['engagement'],
+                mode='lines',
+                line=dict(color=color, width=2, dash=dash),
+                name=label,
+                legendgroup=label,
+                showlegend=not is_forecast
+            ))
+    
+    fig.update_layout(
+        title="Scenario Trajectory Comparison",
+        plot_bgcolor='rgba(10, 10, 26, 0.8)',
+        paper_bgcolor='rgba(10, 10, 26, 0)',
+        font_color='#e0e0ff',
+        title_font_size=20,
+        legend_font_color='#e0e0ff',
+        hovermode='x unified',
+        xaxis=dict(
+            title='Timeline',
+            showgrid=False,
+            showline=True,
+            linecolor='rgba(138, 87, 255, 0.5)',
+        ),
+        yaxis=dict(
+            title='Neural Engagement Score',
+            showgrid=True,
+            gridcolor='rgba(138, 87, 255, 0.2)',
+            showline=True,
+            linecolor='rgba(138, 87, 255, 0.5)',
+        )
+    )
+    
+    # Add a vertical line at today's date
+    fig.add_vline(x=datetime.now(), line_width=2, line_dash="dash", line_color="#FF5733")
+    
+    return fig
+
+def create_similar_trajectories_chart(history, precedents):
+    """
+    Create a chart of past tracks whose history matched the current trend.
+    
+    Args:
+        history (pd.DataFrame): Observed trend data with date and engagement columns
+        precedents (list): Matches from TrajectoryIndex.precedents, each with
+            track_id, distance, history_days and a curve rescaled to the history
+        
+    Returns:
+        plotly.graph_objects.Figure: Plotly figure object
+    """
+    colors = ['#9067ff', '#00ffff', '#ff00cc', '#FF5733', '#6e45e2', '#3333ff', '#c9b6ff']
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=history['date'],
+        y=history['engagement'],
+        mode='lines',
+        line=dict(color='#BD4DE6', width=3),
+        name="This track"
+    ))
+    
+    # Align each match so its last matched day falls on the last observed day
+    last_date = history['date'].iloc[-1]
+    for i, precedent in enumerate(precedents):
+        curve, matched_days = precedent['curve'], precedent['history_days']
+        dates = [last_date + timedelta(days=day - matched_days + 1) for day in range(len(curve))]
+        label = f"{precedent['track_id']} (DTW {precedent['distance']:.2f})"
+        color = colors[i % len(colors)]
+        
+        # Solid line for the matched history, dotted line for what followed
+        for segment, dash in [(slice(0, matched_days), 'solid'), (slice(matched_days - 1, None), 'dot')]:
+            fig.add_trace(go.Scatter(
+                x=dates[segment],
+                y=curve[segment],
+                mode='lines',
+                line=dict(color=color, width=1.5, dash=dash),
+                opacity=0.7,
+                name=label,
+                legendgroup=label,
+                showlegend=dash == 'solid'
+            ))
+    
+    fig.update_layout(
+        title="Similar Past Trajectories",
+        plot_bgcolor='rgba(10, 10, 26, 0.8)',
+        paper_bgcolor='rgba(10, 10, 26, 0)',
+        font_color='#e0e0ff',
+        title_font_size=20,
+        legend_font_color='#e0e0ff',
+        hovermode='x unified',
+        xaxis=dict(
+            title='Timeline',
+            showgrid=False,
+            showline=True,
+            linecolor='rgba(138, 87, 255, 0.5)',
+        ),
+        yaxis=dict(
+            title='Neural Engagement Score',
+            showgrid=True,
+            gridcolor='rgba(138, 87, 255, 0.2)',
+            showline=True,
+            linecolor='rgba(138, 87, 255, 0.5)',
+        )
+    )
+    
+    # Add a vertical line at today's date
+    fig.add_vline(x=datetime.now(), line_width=2, line_dash="dash", line_color="#FF5733")
+    
+    return fig
+
+def create_engagement_detail_chart(buckets, resolution):
+    """
+    Create a bar chart of engagement buckets at one time resolution.
+    
+    Args:
+        buckets (pd.DataFrame): date (bucket start) and engagement columns
+        resolution (str): Bucket width, 'hour', 'day' or 'week'
+        
+    Returns:
+        plotly.graph_objects.Figure: Plotly figure object
+    """
+    fig = go.Figure(go.Bar(
+        x=buckets['date'],
+        y=buckets['engagement'],
+        marker_color='#9067ff',
+        name=f"Engagement per {resolution}"
+    ))
+    
+    fig.update_layout(
+        title=f"Observed Engagement per {resolution.capitalize()}",
+        plot_bgcolor='rgba(10, 10, 26, 0.8)',
+        paper_bgcolor='rgba(10, 10, 26, 0)',
+        font_color='#e0e0ff',
+        title_font_size=20,
+        bargap=0.1,
+        xaxis=dict(
+            title='Timeline',
+            showgrid=False,
+            showline=True,
+            linecolor='rgba(138, 87, 255, 0.5)',
+        ),
+        yaxis=dict(
+            title='Neural Engagement Score',
+            showgrid=True,
+            gridcolor='rgba(138, 87, 255, 0.2)',
+            showline=True,
+            linecolor='rgba(138, 87, 255, 0.5)',
+        )
+    )
+    
+    return fig
+
+def create_regional_engagement_chart(series, genre):
+    """
+    Create a chart of daily engagement per selected region.
+    
+    Args:
+        series (dict): Region label -> DataFrame with date and engagement columns
+        genre (str): Music genre the engagement belongs to
+        
+    Returns:
+        plotly.graph_objects.Figure: Plotly figure object
+    """
+    colors = ['#BD4DE6', '#9067ff', '#00ffff', '#ff00cc', '#FF5733', '#6e45e2', '#3333ff', '#c9b6ff']
+    
+    fig = go.Figure()
+    for i, (label, daily) in enumerate(series.items()):
+        fig.add_trace(go.Scatter(
+            x=daily['date'],
+            y=daily['engagement'],
+            mode='lines',
+            line=dict(color=colors[i % len(colors)], width=2),
+            name=label
+        ))
+    
+    fig.update_layout(
+        title=f"{genre} Engagement by Neural-Market",
+        plot_bgcolor='rgba(10, 10, 26, 0.8)',
+        paper_bgcolor='rgba(10, 10, 26, 0)',
+        font_color='#e0e0ff',
+        title_font_size=20,
+        legend_font_color='#e0e0ff',
+        hovermode='x unified',
+        xaxis=dict(
+            title='Date',
+            showgrid=False,
+            showline=True,
+            linecolor='rgba(138, 87, 255, 0.5)',
+        ),
+        yaxis=dict(
+            title='Daily Engagement',
+            showgrid=True,
+            gridcolor='rgba(138, 87, 255, 0.2)',
+            showline=True,
+            linecolor='rgba(138, 87, 255, 0.5)',
+        )
+    )
+    
+    return fig
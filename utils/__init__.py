@@ -1,12 +1,19 @@
 # This file makes the utils directory a Python package
-# Import key functions to make them available at the package level
+# Key functions are exported at the package level but imported on first access,
+# so importing the package does not pull in heavy dependencies like scikit-learn
 
-from .data_simulation import generate_mock_trend_data
-from .metrics_calculation import generate_forecast_metrics
-from .style_helpers import load_custom_css
+import importlib
 
-__all__ = [
-    'generate_mock_trend_data',
-    'generate_forecast_metrics',
-    'load_custom_css'
-]
\ No newline at end of file
+_EXPORTS = {
+    'generate_mock_trend_data': '.data_simulation',
+    'generate_forecast_metrics': '.metrics_calculation',
+    'load_custom_css': '.style_helpers'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,171 @@
+import functools
+import pickle
+import threading
+from collections import deque
+
+import streamlit as st
+
+# Defaults for data caches; tune per server from the cache admin panel
+DATA_CACHE_TTL = 3600
+DATA_CACHE_MAX_ENTRIES = 256
+
+# Registry of every tracked cache in this process, keyed by cache name
+CACHE_REGISTRY = {}
+
+class CacheStats:
+    """
+    Hit/miss counters and an estimated footprint for one Streamlit cache.
+
+    Streamlit does not expose per-cache statistics, so calls are counted by
+    the outer wrapper and misses by the function body that only runs when
+    Streamlit has no stored value.
+
+    Args:
+        name (str): Display name of the cache
+        kind (str): 'data' or 'resource'
+        max_entries (int, optional): Entry limit of the cache
+        ttl (int, optional): Time-to-live of cache entries in seconds
+    """
+
+    def __init__(self, name, kind, max_entries=None, ttl=None):
+        self.name = name
+        self.kind = kind
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.calls = 0
+        self.misses = 0
+        self._entry_sizes = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    def record_call(self):
+        with self._lock:
+            self.calls += 1
+
+    def record_miss(self, value):
+        size = estimate_size(value)
+        with self._lock:
+            self.misses += 1
+            self._entry_sizes.append(size)
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.misses = 0
+            self._entry_sizes.clear()
+
+    def summary(self):
+        """
+        Summarize the cache for the admin panel.
+
+        Returns:
+            dict: Counters, hit rate and estimated size of the cache
+        """
+        with self._lock:
+            hits = max(0, self.calls - self.misses)
+            return {
+                'cache': self.name,
+                'kind': self.kind,
+                'max_entries': self.max_entries,
+                'ttl_s': self.ttl,
+                'calls': self.calls,
+                'hits': hits,
+                'misses': self.misses,
+                'hit_rate': hits / self.calls if self.calls else 0.0,
+                'entries': len(self._entry_sizes),
+                'est_size_kb': sum(self._entry_sizes) / 1024
+            }
+
+def estimate_size(value):
+    """
+    Estimate the memory footprint of a cached value in bytes.
+
+    Args:
+        value (object): Cached value
+
+    Returns:
+        int: Estimated size in bytes, or 0 if it cannot be measured
+    """
+    if hasattr(value, 'memory_usage'):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, 'sum') else usage)
+
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+def _tracked(name, kind, cache_decorator, max_entries=None, ttl=None):
+    stats = CacheStats(name, kind, max_entries=max_entries, ttl=ttl)
+    CACHE_REGISTRY[name] = stats
+
+    def decorator(func):
+        # functools.wraps keeps Streamlit's function key and its "_arg"
+        # hashing exclusions tied to the wrapped function, not this closure
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            value = func(*args, **kwargs)
+            stats.record_miss(value)
+            return value
+
+        cached = cache_decorator(compute)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stats.record_call()
+            return cached(*args, **kwargs)
+
+        wrapper.clear = cached.clear
+        wrapper.stats = stats
+        return wrapper
+
+    return decorator
+
+def tracked_cache_data(name, max_entries=DATA_CACHE_MAX_ENTRIES, ttl=DATA_CACHE_TTL):
+    """
+    Cache a data stage with st.cache_data and track its hit rate.
+
+    Args:
+        name (str): Cache name shown in the admin panel
+        max_entries (int): Maximum number of cached entries
+        ttl (int): Time-to-live of cache entries in seconds
+
+    Returns:
+        callable: Decorator for the stage function
+    """
+    cache_decorator = st.cache_data(max_entries=max_entries, ttl=ttl, show_spinner=False)
+    return _tracked(name, 'data', cache_decorator, max_entries=max_entries, ttl=ttl)
+
+def tracked_cache_resource(name):
+    """
+    Cache a shared resource with st.cache_resource and track its hit rate.
+
+    Args:
+        name (str): Cache name shown in the admin panel
+
+    Returns:
+        callable: Decorator for the resource loader
+    """
+    cache_decorator = st.cache_resource(show_spinner=False)
+    return _tracked(name, 'resource', cache_decorator)
+
+def get_cache_summaries():
+    """
+    Get a summary row for every tracked cache.
+
+    Returns:
+        list: List of cache summary dictionaries
+    """
+    return [stats.summary() for stats in CACHE_REGISTRY.values()]
+
+def clear_data_caches():
+    """
+    Clear the Streamlit data caches and reset their counters.
+
+    Resource caches (models, indexes, the cube, leaderboard and online
+    learner) are shared by every session and slow to rebuild, so they are
+    left alone.
+    """
+    st.cache_data.clear()
+    for stats in CACHE_REGISTRY.values():
+        if stats.kind == 'data':
+            stats.reset()
@@ -69,6 +69,9 @@ def generate_mock_trend_data(days_back=30, forecast_days=14, tempo=120,
     
     return df
 
+# Neural platforms in the distribution, feeds and observed shares
+PLATFORMS = ("HoloTok", "NeuraVerse", "SenseStream", "BrainBeats", "OmniGroove", "NeuroClips")
+
 def generate_platform_distribution(meme_potential, neural_connection, cultural_resonance, 
                                    tempo, synthetic_vocal_pct, celebrity_influence,
                                    emotional_intensity, novelty_factor):
@@ -91,4 +94,327 @@ def generate_platform_distribution(meme_potential, neural_connection, cultural_r
     total = sum(platforms.values())
     platforms = {k: v/total for k, v in platforms.items()}
     
-    return dict(sorted(platforms.items(), key=lambda item: item[1], reverse=True))
\ No newline at end of file
+    return dict(sorted(platforms.items(), key=lambda item: item[1], reverse=True))
+
+# Name parts for simulated artists
+ARTIST_NAME_PREFIXES = ["Neural", "Quantum", "Synaptic", "Holographic", "Orbital", "Cortex", "Prism", "Echo",
+                        "Lunar", "Nova", "Cipher", "Aurora", "Vector", "Pulse", "Helix", "Static"]
+ARTIST_NAME_SUFFIXES = ["Nexus", "Drift", "Harmony", "Bloom", "Signal", "Mirage", "Circuit", "Tide",
+                        "Theory", "Vision", "Cascade", "Relay", "Shift", "Garden", "Engine", "Choir"]
+
+def generate_artist_catalog(n_artists, roles, seed=None):
+    """
+    Generate a simulated catalog of artists with audio parameters.
+    
+    Args:
+        n_artists (int): Number of artists
+        roles (sequence): Collaborator roles to assign at random
+        seed (int, optional): Random seed for a reproducible catalog
+        
+    Returns:
+        pd.DataFrame: artist_id, name and role columns plus one column per
+            sidebar audio parameter, drawn uniformly from its range
+    """
+    from modules.parameters import PARAM_RANGES
+    from models.feature_schema import AUDIO_FEATURES
+    
+    rng = np.random.default_rng(seed)
+    names = [f"{prefix} {suffix}" for prefix in ARTIST_NAME_PREFIXES for suffix in ARTIST_NAME_SUFFIXES]
+    catalog = {
+        'artist_id': [f"artist-{i}" for i in range(n_artists)],
+        'name': pd.Categorical.from_codes(rng.integers(0, len(names), n_artists), categories=names),
+        'role': pd.Categorical.from_codes(rng.integers(0, len(roles), n_artists), categories=list(roles))
+    }
+    for name in AUDIO_FEATURES:
+        low, high = PARAM_RANGES[name]
+        catalog[name] = rng.uniform(low, high, n_artists)
+    
+    return pd.DataFrame(catalog)
+
+# Shapes of simulated historical trend curves
+TREND_SHAPES = ('steady_growth', 'breakout', 'spike', 'fade', 'exponential')
+
+def generate_historical_trends(n_tracks, history_days=30, outcome_days=14, seed=None):
+    """
+    Generate simulated engagement curves of past tracks.
+    
+    Each curve follows one of TREND_SHAPES with a random onset, rate and
+    level, plus multiplicative daily noise.
+    
+    Args:
+        n_tracks (int): Number of curves
+        history_days (int): Days of observed history per curve
+        outcome_days (int): Days recorded after the history window
+        seed (int, optional): Random seed for reproducible curves
+        
+    Returns:
+        np.ndarray: (n_tracks, history_days + outcome_days) float32 engagement values
+    """
+    rng = np.random.default_rng(seed)
+    n_days = history_days + outcome_days
+    t = np.linspace(0, 1, n_days, dtype=np.float32)
+    curves = np.empty((n_tracks, n_days), dtype=np.float32)
+    
+    shapes = rng.integers(0, len(TREND_SHAPES), n_tracks)
+    for code, shape in enumerate(TREND_SHAPES):
+        rows = np.flatnonzero(shapes == code)
+        center = rng.uniform(0.2, 0.9, (len(rows), 1)).astype(np.float32)
+        rate = rng.uniform(2, 12, (len(rows), 1)).astype(np.float32)
+        if shape == 'steady_growth':
+            curve = 1 + rate * t
+        elif shape == 'breakout':
+            curve = 1 + 10 / (1 + np.exp(-rate * 2 * (t - center)))
+        elif shape == 'spike':
+            curve = 1 + 10 * np.exp(-((t - center) * rate) ** 2)
+        elif shape == 'fade':
+            curve = 1 + 10 * np.exp(-rate * t)
+        else:
+            curve = np.exp(rate / 4 * t)
+        curves[rows] = curve
+    
+    curves *= rng.uniform(500, 5000, (n_tracks, 1)).astype(np.float32)
+    curves *= 1 + rng.normal(0, 0.05, curves.shape).astype(np.float32)
+    return curves
+
+def generate_engagement_events(n_events, days, end_date=None, seed=None):
+    """
+    Generate simulated raw engagement rows across regions and genres.
+    
+    Each region and genre gets its own popularity and growth over the
+    period, so per-region views of the same genre differ.
+    
+    Args:
+        n_events (int): Number of rows
+        days (int): Number of days covered, ending at end_date
+        end_date (datetime.date, optional): Last day covered; defaults to today
+        seed (int, optional): Random seed for reproducible rows
+        
+    Returns:
+        pd.DataFrame: date (day), region and genre (categorical) and
+            engagement columns, one row per event
+    """
+    from modules.parameters import GENRES, REGIONS
+    
+    rng = np.random.default_rng(seed)
+    # The global network is a rollup of the other regions, never a row's own region
+    regions = [region for region in REGIONS if region != REGIONS[0]]
+    end_date = np.datetime64(end_date or datetime.now().date(), 'D')
+    
+    region_codes = rng.choice(len(regions), n_events, p=rng.dirichlet(np.full(len(regions), 2.0)))
+    genre_codes = rng.choice(len(GENRES), n_events, p=rng.dirichlet(np.full(len(GENRES), 2.0)))
+    day_offsets = rng.integers(0, days, n_events)
+    
+    # Daily growth rate per (region, genre) pair, compounding over the period
+    growth = rng.normal(0.01, 0.02, (len(regions), len(GENRES)))
+    level = np.exp(growth[region_codes, genre_codes] * day_offsets)
+    engagement = np.rint(rng.lognormal(3, 1, n_events) * level).astype(np.int64)
+    
+    return pd.DataFrame({
+        'date': end_date - (days - 1) + day_offsets,
+        'region': pd.Categorical.from_codes(region_codes, categories=regions),
+        'genre': pd.Categorical.from_codes(genre_codes, categories=GENRES),
+        'engagement': engagement
+    })
+
+# Share of a day's engagement falling in each hour, peaking in the evening
+HOURLY_PROFILE = 1 + 0.8 * np.sin((np.arange(24) - 13) / 24 * 2 * np.pi)
+HOURLY_PROFILE = HOURLY_PROFILE / HOURLY_PROFILE.sum()
+
+def generate_hourly_engagement(trend_data, seed=None):
+    """
+    Split the observed daily engagement of a trend into timestamped events.
+    
+    Each day's total is spread over its hours following HOURLY_PROFILE, as
+    one event at a random minute of each hour, so the events add up to the
+    daily values exactly.
+    
+    Args:
+        trend_data (pd.DataFrame): Trend data with date, engagement and is_forecast columns
+        seed (int, optional): Random seed for reproducible events
+        
+    Returns:
+        pd.DataFrame: timestamp and engagement columns, one row per event
+    """
+    rng = np.random.default_rng(seed)
+    history = trend_data[~trend_data['is_forecast']]
+    days = history['date'].dt.floor('D').to_numpy()
+    totals = np.maximum(history['engagement'].to_numpy(), 0).astype(np.int64)
+    
+    hourly = np.stack([rng.multinomial(total, HOURLY_PROFILE) for total in totals])
+    offsets = np.arange(24) * 3600 + rng.integers(0, 3600, hourly.shape)
+    timestamps = days[:, None] + offsets.astype('timedelta64[s]')
+    return pd.DataFrame({'timestamp': timestamps.ravel(), 'engagement': hourly.ravel()})
+
+def generate_track_catalog(n_tracks, history_days, seed=None):
+    """
+    Generate a simulated catalog of current tracks with recent daily engagement.
+    
+    Args:
+        n_tracks (int): Number of tracks
+        history_days (int): Days of recent engagement per track
+        seed (int, optional): Random seed for a reproducible catalog
+        
+    Returns:
+        tuple: (pd.DataFrame with track_id, genre and region columns,
+            np.ndarray of (n_tracks, history_days) engagement, oldest day first)
+    """
+    from modules.parameters import GENRES, REGIONS
+    
+    rng = np.random.default_rng(seed)
+    regions = [region for region in REGIONS if region != REGIONS[0]]
+    catalog = pd.DataFrame({
+        'track_id': [f"track-{i}" for i in range(n_tracks)],
+        'genre': pd.Categorical.from_codes(rng.integers(0, len(GENRES), n_tracks), categories=GENRES),
+        'region': pd.Categorical.from_codes(rng.integers(0, len(regions), n_tracks), categories=regions)
+    })
+    history = generate_historical_trends(n_tracks, history_days=history_days, outcome_days=0, seed=seed)
+    return catalog, history.astype(np.float64)
+
+def generate_engagement_updates(latest, seed=None):
+    """
+    Simulate the next day's engagement of tracks from their latest day.
+    
+    Args:
+        latest (np.ndarray): Latest daily engagement of each track
+        seed (int, optional): Random seed for reproducible updates
+        
+    Returns:
+        np.ndarray: New daily engagement, one value per track
+    """
+    rng = np.random.default_rng(seed)
+    return np.maximum(np.rint(latest * rng.lognormal(0.01, 0.15, len(latest))), 0)
+
+# Largest factor a breakout multiplies a track's engagement by, keeping long streams within int64
+BREAKOUT_MAX_GROWTH = 1e4
+
+def generate_engagement_stream(n_tracks, periods, breakout_share=0.01, start=None, seed=None):
+    """
+    Generate a stream of hourly engagement events in which a few tracks break out.
+    
+    Every track reports its engagement once per hour. Most tracks drift
+    around their own level; breakout tracks start growing exponentially
+    at a random hour in the second half of the stream, levelling off at
+    BREAKOUT_MAX_GROWTH times their level.
+    
+    Args:
+        n_tracks (int): Number of tracks
+        periods (int): Hours in the stream
+        breakout_share (float): Share of tracks that break out
+        start (datetime-like, optional): Time of the first hour; defaults to `periods` hours ago
+        seed (int, optional): Random seed for a reproducible stream
+        
+    Returns:
+        tuple: (pd.DataFrame with timestamp, track_id and engagement columns in
+            time order, np.ndarray of each track's breakout hour, -1 for none)
+    """
+    rng = np.random.default_rng(seed)
+    if start is None:
+        start = pd.Timestamp.now().floor('h') - pd.Timedelta(hours=periods)
+    
+    level = rng.uniform(200, 2000, (1, n_tracks))
+    drift = np.cumsum(rng.normal(0, 0.01, (periods, n_tracks)), axis=0)
+    engagement = level * np.exp(drift) * (1 + rng.normal(0, 0.05, (periods, n_tracks)))
+    
+    onsets = np.full(n_tracks, -1)
+    breakouts = rng.choice(n_tracks, int(n_tracks * breakout_share), replace=False)
+    onsets[breakouts] = rng.integers(periods // 2, periods - 8, len(breakouts))
+    hours = np.arange(periods)[:, None]
+    rate = rng.uniform(0.2, 0.5, len(breakouts))
+    growth = np.minimum(rate * np.maximum(hours - onsets[breakouts], 0), np.log(BREAKOUT_MAX_GROWTH))
+    engagement[:, breakouts] *= np.exp(growth)
+    
+    track_ids = np.array([f"track-{i}" for i in range(n_tracks)], dtype=object)
+    return pd.DataFrame({
+        'timestamp': np.repeat(pd.date_range(start, periods=periods, freq='h').to_numpy(), n_tracks),
+        'track_id': np.tile(track_ids, periods),
+        'engagement': np.rint(np.maximum(engagement, 0)).ravel().astype(np.int64)
+    }), onsets
+
+def generate_platform_events(n_events, n_tracks, hours, shares=None, end=None, seed=None):
+    """
+    Generate simulated raw engagement events per platform, as platform feeds deliver them.
+    
+    Args:
+        n_events (int): Number of events across all platforms
+        n_tracks (int): Number of tracks the events belong to
+        hours (int): Hours covered, ending at end
+        shares (dict, optional): Share of events per platform; random if None
+        end (datetime-like, optional): End of the period; defaults to now
+        seed (int, optional): Random seed for reproducible events
+        
+    Returns:
+        dict: pd.DataFrame with timestamp, track_id and engagement columns in
+            time order, keyed by platform
+    """
+    rng = np.random.default_rng(seed)
+    if shares is None:
+        shares = dict(zip(PLATFORMS, rng.dirichlet(np.full(len(PLATFORMS), 4.0))))
+    end = pd.Timestamp(end or datetime.now())
+    start_seconds = int((end - pd.Timedelta(hours=hours)).value // 10**9)
+    
+    counts = rng.multinomial(n_events, np.array(list(shares.values())) / sum(shares.values()))
+    events = {}
+    for platform, count in zip(shares, counts):
+        seconds = np.sort(rng.integers(start_seconds, start_seconds + hours * 3600, count))
+        events[platform] = pd.DataFrame({
+            'timestamp': seconds.astype('datetime64[s]'),
+            'track_id': [f"track-{i}" for i in rng.integers(0, n_tracks, count)],
+            'engagement': rng.integers(1, 100, count)
+        })
+    return events
+
+# Simulated listener archetypes: share of listeners and mean vector in LISTENER_FEATURES order
+LISTENER_ARCHETYPES = {
+    'teen_meme': (0.20, (16, 6.0, 0.50, 0.30, 0.8, 0.9, 0.7, 0.5, 0.3, 0.5, 0.6)),
+    'club': (0.22, (22, 5.0, 0.35, 0.20, 0.6, 0.6, 0.85, 0.6, 0.4, 0.6, 0.5)),
+    'neural_native': (0.20, (29, 4.0, 0.20, 0.10, 0.5, 0.3, 0.5, 0.9, 0.5, 0.8, 0.3)),
+    'ambient': (0.10, (33, 3.0, 0.10, 0.05, 0.7, 0.1, 0.2, 0.7, 0.6, 0.3, 0.2)),
+    'culture': (0.15, (38, 2.5, 0.15, 0.08, 0.3, 0.2, 0.4, 0.5, 0.9, 0.6, 0.4)),
+    'mainstream': (0.13, (48, 1.5, 0.25, 0.05, 0.2, 0.3, 0.5, 0.3, 0.6, 0.5, 0.85))
+}
+
+# Standard deviation of each listener feature around its archetype's mean
+LISTENER_NOISE = (4.0, 1.0, 0.05, 0.04) + (0.1,) * 7
+
+def generate_listener_features(n_listeners, seed=None):
+    """
+    Generate simulated listener vectors drawn around LISTENER_ARCHETYPES.
+    
+    Args:
+        n_listeners (int): Number of listeners
+        seed (int, optional): Random seed for reproducible listeners
+        
+    Returns:
+        tuple: ((n_listeners, len(LISTENER_FEATURES)) float32 array, archetype code of each listener)
+    """
+    rng = np.random.default_rng(seed)
+    shares = np.array([share for share, _ in LISTENER_ARCHETYPES.values()])
+    means = np.array([mean for _, mean in LISTENER_ARCHETYPES.values()], dtype=np.float32)
+    
+    archetypes = rng.choice(len(shares), size=n_listeners, p=shares / shares.sum())
+    features = means[archetypes] + rng.standard_normal((n_listeners, means.shape[1]), dtype=np.float32) \
+        * np.asarray(LISTENER_NOISE, dtype=np.float32)
+    features[:, 0] = np.clip(features[:, 0], 13, 80)
+    features[:, 1] = np.maximum(features[:, 1], 0)
+    features[:, 2:] = np.clip(features[:, 2:], 0, 1)
+    return features, archetypes
+
+def generate_listener_chunks(n_listeners, chunk_size, seed=None):
+    """
+    Generate simulated listener vectors chunk by chunk, never holding all of them.
+    
+    Calling it again with the same seed yields the same chunks, so training
+    can make several passes.
+    
+    Args:
+        n_listeners (int): Total number of listeners
+        chunk_size (int): Listeners per chunk
+        seed (int, optional): Random seed for reproducible listeners
+        
+    Yields:
+        np.ndarray: (rows, len(LISTENER_FEATURES)) float32 listener vectors
+    """
+    for i, start in enumerate(range(0, n_listeners, chunk_size)):
+        chunk_seed = None if seed is None else [seed, i]
+        features, _ = generate_listener_features(min(chunk_size, n_listeners - start), seed=chunk_seed)
+        yield features
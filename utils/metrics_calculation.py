@@ -1,3 +1,7 @@
+from datetime import timedelta
+
+from modules.growth_curves import growth_curve_summary
+
 def generate_forecast_metrics(trend_data, emotional_intensity, meme_potential, 
                              neural_connection, cultural_resonance):
     """
@@ -11,7 +15,10 @@ def generate_forecast_metrics(trend_data, emotional_intensity, meme_potential,
         cultural_resonance (float): Cultural relevance score
         
     Returns:
-        dict: Dictionary with calculated metrics
+        dict: Dictionary with calculated metrics. When a growth curve could
+            be fitted to the history, trend_duration is the days until its
+            growth fades and growth_model, inflection_day and
+            carrying_capacity describe the fit; otherwise growth_model is None
     """
     # Filter only forecast data
     forecast = trend_data[trend_data['is_forecast']]
@@ -30,8 +37,20 @@ def generate_forecast_metrics(trend_data, emotional_intensity, meme_potential,
     else:
         virality_score = 50  # Default value if we can't calculate growth
     
-    # Calculate expected trend duration
-    trend_duration = min(30, max(3, int(10 * neural_connection * cultural_resonance)))
+    # Calculate expected trend duration from a saturating growth curve
+    # fitted to the history, falling back to the parameter heuristic
+    growth = growth_curve_summary(historical['engagement'].to_numpy()) if len(historical) >= 4 else None
+    if growth is not None and growth['converged']:
+        trend_duration = min(30, max(3, int(round(growth['remaining_days']))))
+        inflection_date = historical['date'].iloc[0] + timedelta(days=growth['inflection_day'])
+        growth_metrics = {
+            'growth_model': growth['model'],
+            'inflection_day': inflection_date.strftime("%b %d"),
+            'carrying_capacity': int(growth['carrying_capacity'])
+        }
+    else:
+        trend_duration = min(30, max(3, int(10 * neural_connection * cultural_resonance)))
+        growth_metrics = {'growth_model': None}
     
     # Return all calculated metrics
     return {
@@ -39,7 +58,8 @@ def generate_forecast_metrics(trend_data, emotional_intensity, meme_potential,
         'peak_day': peak_day,
         'total_engagement': total_engagement,
         'virality_score': virality_score,
-        'trend_duration': trend_duration
+        'trend_duration': trend_duration,
+        **growth_metrics
     }
 
 def calculate_demographic_appeal(novelty_factor, meme_potential, tempo, 
@@ -0,0 +1,60 @@
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Minimum on-screen time per stage when demo pacing is switched on
+DEMO_STAGE_SECONDS = 1.0
+
+class StageTimer:
+    """
+    Measure the wall-clock duration of named pipeline stages.
+
+    Args:
+        min_stage_seconds (float): Pad each stage to at least this duration.
+            Zero (the default) never sleeps; a positive value is only meant
+            for demo pacing.
+    """
+
+    def __init__(self, min_stage_seconds=0.0):
+        self.min_stage_seconds = min_stage_seconds
+        self.timings = []
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time the enclosed block and record it under the given stage name.
+
+        The recorded duration is the measured work only; demo padding is
+        applied afterwards and never included.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings.append({'stage': name, 'seconds': elapsed})
+
+            if elapsed < self.min_stage_seconds:
+                time.sleep(self.min_stage_seconds - elapsed)
+
+    def total_seconds(self):
+        """
+        Get the total measured duration across all recorded stages.
+
+        Returns:
+            float: Sum of stage durations in seconds
+        """
+        return sum(timing['seconds'] for timing in self.timings)
+
+    def as_log_entry(self):
+        """
+        Summarize the recorded stages as a timing log entry.
+
+        Returns:
+            dict: Timestamp, per-stage durations and total duration
+        """
+        return {
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'stages': list(self.timings),
+            'total_seconds': self.total_seconds()
+        }
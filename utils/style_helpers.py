@@ -1,10 +1,21 @@
 import streamlit as st
+from utils.caching import tracked_cache_resource
 
 def load_custom_css():
     """
     Load custom CSS for the application to create a futuristic interface.
     """
-    st.markdown("""
+    st.markdown(get_custom_css(), unsafe_allow_html=True)
+
+@tracked_cache_resource('custom_css')
+def get_custom_css():
+    """
+    Get the custom CSS payload, built once per server process.
+    
+    Returns:
+        str: HTML style block with the application CSS
+    """
+    return """
     <style>
         .main {
             background-color: #0a0a1a;
@@ -99,7 +110,7 @@ def load_custom_css():
             text-shadow: 0 0 10px rgba(138, 87, 255, 0.7);
         }
     </style>
-    """, unsafe_allow_html=True)
+    """
 
 def create_spinner_with_message(message):
     """